@@ -0,0 +1,58 @@
+import argparse
+import datetime
+import pathlib
+import polars
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+from benchmark_indexes import open_database
+
+
+NAMES = ["RECEBIMENTO DINHEIRO", "VISA DÉBITO", "ELO DÉBITO", "MASTER CRÉDITO", "VISA CRÉDITO", "PIX"]
+
+
+def time_extend(
+        finishers_count: int,
+        should_trigger_listeners: bool
+    ) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        database = open_database(pathlib.Path(directory) / "benchmark.db")
+        reports_count: int = -(-finishers_count // len(NAMES))
+        start_time: datetime.datetime = datetime.datetime(2025, 1, 1)
+        report_ids: polars.Series = database.extend(
+            "report",
+            polars.DataFrame(
+                {
+                    "shift": [index % 3 for index in range(reports_count)],
+                    "employee": ["EMPLOYEE"] * reports_count,
+                    "start_time": [start_time + datetime.timedelta(hours = 8 * index) for index in range(reports_count)],
+                    "end_time": [start_time + datetime.timedelta(hours = 8 * index + 7) for index in range(reports_count)],
+                }
+            ),
+            should_trigger_listeners = False
+        )
+
+        # Finishers classified through the listeners or inserted without them as loaded reports are (names are unique per report)
+        finishers_df: polars.DataFrame = polars.DataFrame(
+            {
+                "report_id": [report_ids[index // len(NAMES)] for index in range(finishers_count)],
+                "name": [NAMES[index % len(NAMES)] for index in range(finishers_count)],
+                "value": [index + 1 for index in range(finishers_count)],
+            }
+        )
+        start: float = time.perf_counter()
+        database.extend("finisher", finishers_df, should_trigger_listeners = should_trigger_listeners)
+        return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Time extending finishers through the ORM with listeners and through a Core insert without them.")
+    parser.add_argument("--finishers", type = int, default = 5_000, help = "Number of finishers to insert.")
+    args: argparse.Namespace = parser.parse_args()
+
+    before: float = time_extend(args.finishers, True)
+    after: float = time_extend(args.finishers, False)
+    print(f"Extend of {args.finishers} finishers: {before:.2f} s -> {after:.2f} s ({before / after:.0f}x)")
\ No newline at end of file
@@ -0,0 +1,130 @@
+import argparse
+import datetime
+import pathlib
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import typing
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+from conciliador.src.database import Database
+
+
+INSERTIONS_PATH = pathlib.Path(__file__).parent.parent / "conciliador" / "db" / "db_insertions.json"
+
+TYPES = ["cash", "pix", "card.debit.visa", "card.credit.visa", "card.credit.master"]
+
+INDEXES = [
+    "index_finisher_payment_date_type_id",
+    "index_statement_entry_statement_id_type_id",
+    "index_verification_date_type_id"
+]
+
+QUERIES = {
+    "finisher totals by date and type": "SELECT payment_date, type_id, SUM(payment_value) FROM finisher WHERE payment_date BETWEEN '2030-01-01' AND '2030-01-31' GROUP BY payment_date, type_id;",
+    "statement entry totals by date and type": "SELECT statement.date, statement_entry.type_id, SUM(statement_entry.value) FROM statement JOIN statement_entry ON statement.id = statement_entry.statement_id WHERE statement.date BETWEEN '2030-01-01' AND '2030-01-31' GROUP BY 1, 2;",
+    "verification ids by date": "SELECT id FROM verification WHERE date BETWEEN '2030-01-01' AND '2030-01-31';"
+}
+
+
+def open_database(
+        database_path: pathlib.Path
+    ) -> Database.Database:
+    # Opening the database creates the tables and any missing declared index
+    return Database.Database(f"sqlite:///{database_path}", database_path.with_suffix(".log"), INSERTIONS_PATH)
+
+
+def fill_database(
+        database_path: pathlib.Path,
+        finishers_count: int
+    ) -> None:
+    random.seed(0)
+    reports_count: int = finishers_count // 11
+    start_time: datetime.datetime = datetime.datetime(2020, 1, 1)
+
+    connection: sqlite3.Connection = sqlite3.connect(database_path)
+    connection.executemany(
+        "INSERT INTO report (id, shift, employee, start_time, end_time) VALUES (?, ?, ?, ?, ?);",
+        [
+            (index + 1, index % 3, "EMPLOYEE", (start_time + datetime.timedelta(hours = 8 * index)).isoformat(" "), (start_time + datetime.timedelta(hours = 8 * index + 7)).isoformat(" "))
+            for index in range(reports_count)
+        ]
+    )
+
+    # Eleven finishers per report paid up to a month after the report date
+    finishers: typing.List[typing.Tuple[typing.Any, ...]] = []
+    for index in range(finishers_count):
+        report_id: int = index // 11 + 1
+        payment_date: datetime.date = start_time.date() + datetime.timedelta(days = report_id * 8 // 24 + random.randint(0, 30))
+        finishers.append((report_id, TYPES[index % len(TYPES)], f"FINISHER {index % 11}", random.randint(1, 1_000_000), payment_date.isoformat(), random.randint(1, 1_000_000)))
+    connection.executemany("INSERT INTO finisher (report_id, type_id, name, value, payment_date, payment_value) VALUES (?, ?, ?, ?, ?, ?);", finishers)
+
+    # One statement per payment date holding a fifth as many entries
+    dates: typing.List[str] = sorted({finisher[4] for finisher in finishers})
+    connection.executemany("INSERT INTO statement (id, date) VALUES (?, ?);", list(enumerate(dates, 1)))
+    connection.executemany(
+        "INSERT INTO statement_entry (statement_id, type_id, name, value) VALUES (?, ?, ?, ?);",
+        [(random.randint(1, len(dates)), TYPES[index % len(TYPES)], "ENTRY", random.randint(1, 1_000_000)) for index in range(finishers_count // 5)]
+    )
+
+    # One verification per date and type
+    connection.executemany(
+        "INSERT INTO verification (type_id, date, verified_on, is_verified) VALUES (?, ?, ?, 0);",
+        [(type_id, date, start_time.isoformat(" ")) for date in dates for type_id in TYPES]
+    )
+    connection.commit()
+    connection.close()
+
+
+def time_queries(
+        database_path: pathlib.Path,
+        runs: int
+    ) -> typing.Dict[str, float]:
+    connection: sqlite3.Connection = sqlite3.connect(database_path)
+    timings: typing.Dict[str, float] = {}
+    for name, query in QUERIES.items():
+        durations: typing.List[float] = []
+        for _ in range(runs):
+            start: float = time.perf_counter()
+            connection.execute(query).fetchall()
+            durations.append(time.perf_counter() - start)
+        timings[name] = statistics.median(durations) * 1000
+    connection.close()
+    return timings
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Time the month queries of reconciliation with and without the declared indexes.")
+    parser.add_argument("--finishers", type = int, default = 1_000_000, help = "Number of finishers to generate.")
+    parser.add_argument("--runs", type = int, default = 5, help = "Number of runs of each query (the median is reported).")
+    args: argparse.Namespace = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_path: pathlib.Path = pathlib.Path(directory) / "benchmark.db"
+        open_database(database_path)
+        fill_database(database_path, args.finishers)
+
+        # Baseline without the indexes
+        connection: sqlite3.Connection = sqlite3.connect(database_path)
+        for index in INDEXES:
+            connection.execute(f"DROP INDEX {index};")
+        connection.execute("ANALYZE;")
+        connection.close()
+        before: typing.Dict[str, float] = time_queries(database_path, args.runs)
+
+        # Schema sync recreates the dropped indexes
+        start: float = time.perf_counter()
+        open_database(database_path)
+        sync_duration: float = time.perf_counter() - start
+        connection = sqlite3.connect(database_path)
+        connection.execute("ANALYZE;")
+        connection.close()
+        after: typing.Dict[str, float] = time_queries(database_path, args.runs)
+
+    print(f"Schema sync with index creation: {sync_duration:.1f} s")
+    for name in QUERIES:
+        print(f"{name}: {before[name]:.1f} ms -> {after[name]:.1f} ms")
\ No newline at end of file
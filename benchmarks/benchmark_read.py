@@ -0,0 +1,61 @@
+import argparse
+import pathlib
+import polars
+import sqlalchemy
+import sqlalchemy.orm
+import sys
+import tempfile
+import time
+import tracemalloc
+import typing
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent))
+
+from benchmark_indexes import fill_database, open_database
+from conciliador.src.database.models import Finisher
+
+
+def read_rows(
+        database_path: pathlib.Path
+    ) -> polars.DataFrame:
+    # Previous read building a dictionary per ORM row
+    engine: sqlalchemy.Engine = sqlalchemy.create_engine(f"sqlite:///{database_path}")
+    columns: typing.List[sqlalchemy.Column] = list(Finisher.Finisher.__table__.columns)
+    string_schema: typing.List[str] = [f"{column.table.name}.{column.name}" for column in columns]
+    with sqlalchemy.orm.Session(engine) as session:
+        fetched: typing.List[sqlalchemy.Row] = session.query(*columns).all()
+        dataframe: polars.DataFrame = polars.DataFrame([dict(zip(string_schema, instance)) for instance in fetched], schema = string_schema)
+    engine.dispose()
+    return dataframe
+
+
+def measure(
+        read: typing.Callable[[], polars.DataFrame]
+    ) -> typing.Tuple[float, float]:
+    # Duration in seconds (untraced, tracing slows allocations down) and traced peak memory in MiB
+    start: float = time.perf_counter()
+    read()
+    duration: float = time.perf_counter() - start
+
+    tracemalloc.start()
+    read()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (duration, peak / 1024 / 1024)
+
+
+if __name__ == "__main__":
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description = "Time reading every finisher as row dictionaries and as typed columns in batches.")
+    parser.add_argument("--finishers", type = int, default = 1_000_000, help = "Number of finishers to generate.")
+    args: argparse.Namespace = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_path: pathlib.Path = pathlib.Path(directory) / "benchmark.db"
+        database = open_database(database_path)
+        fill_database(database_path, args.finishers)
+
+        before: typing.Tuple[float, float] = measure(lambda: read_rows(database_path))
+        after: typing.Tuple[float, float] = measure(lambda: database.read("finisher"))
+
+    print(f"Read of {args.finishers} finishers: {before[0]:.1f} s -> {after[0]:.1f} s")
+    print(f"Traced peak memory: {before[1]:.0f} MiB -> {after[1]:.0f} MiB")
\ No newline at end of file
@@ -1,10 +1,12 @@
 import argparse
+import datetime
 import dotenv
 import os
 import pathlib
 import typing
 
 from .src import Conciliador
+from .src.loaders import ExecutorTypeEnum
 
 
 def main():
@@ -22,8 +24,8 @@ def main():
     # Required operation
     parser.add_argument(
         "operation",
-        choices = ["load", "load_reports", "load_statements", "link", "all"],
-        help = "Operation to perform (required): \"load\", \"load_reports\", \"load_statements\", \"link\", \"all\"")
+        choices = ["load", "load_reports", "load_statements", "link", "match", "reclassify", "all"],
+        help = "Operation to perform (required): \"load\", \"load_reports\", \"load_statements\", \"link\", \"match\", \"reclassify\", \"all\"")
 
     # Optional input reports file/folder
     parser.add_argument(
@@ -43,6 +45,24 @@ def main():
         help = "Input statements file/folder path (optional)"
     )
 
+    # Optional input reports encoding
+    parser.add_argument(
+        "--reports-encoding",
+        dest = "reports-encoding",
+        default = os.getenv("REPORTS_ENCODING"),
+        required = False,
+        help = "Input reports fixed encoding, skipping detection (optional)"
+    )
+
+    # Optional input statements encoding
+    parser.add_argument(
+        "--statements-encoding",
+        dest = "statements-encoding",
+        default = os.getenv("STATEMENTS_ENCODING"),
+        required = False,
+        help = "Input statements fixed encoding, skipping detection (optional)"
+    )
+
     # Optional output folder
     parser.add_argument(
         "--output",
@@ -70,6 +90,74 @@ def main():
         help = "Statements archive folder path (optional)"
     )
 
+    # Optional files executor
+    parser.add_argument(
+        "--executor",
+        dest = "executor",
+        choices = [executor_type.value for executor_type in ExecutorTypeEnum.ExecutorTypeEnum],
+        default = os.getenv("EXECUTOR") or ExecutorTypeEnum.ExecutorTypeEnum.SEQUENTIAL.value,
+        required = False,
+        help = "Executor used to parse input files: \"sequential\", \"thread\", \"process\" (optional)"
+    )
+
+    # Optional files executor workers
+    parser.add_argument(
+        "--workers",
+        dest = "workers",
+        type = int,
+        default = os.getenv("WORKERS"),
+        required = False,
+        help = "Number of workers used to parse input files (optional)"
+    )
+
+    # Flag lazy statements loading
+    parser.add_argument(
+        "--lazy",
+        dest = "lazy",
+        action = "store_true",
+        default = (os.getenv("LAZY", "False").lower() in {"1", "true", "yes", "on"}),
+        required = False,
+        help = "Load statements through a single lazy scan of all files (ignores executor and workers)"
+    )
+
+    # Optional link start date
+    parser.add_argument(
+        "--start-date",
+        dest = "start-date",
+        default = None,
+        required = False,
+        help = "Start date in ISO format (optional, linking defaults to START_DATE or today and reclassifying to all dates)"
+    )
+
+    # Optional link end date
+    parser.add_argument(
+        "--end-date",
+        dest = "end-date",
+        default = None,
+        required = False,
+        help = "End date in ISO format (optional, linking defaults to END_DATE or today and reclassifying to all dates)"
+    )
+
+    # Flag incremental link
+    parser.add_argument(
+        "--incremental",
+        dest = "incremental",
+        action = "store_true",
+        default = (os.getenv("INCREMENTAL", "False").lower() in {"1", "true", "yes", "on"}),
+        required = False,
+        help = "Link only dates and types changed since the last link"
+    )
+
+    # Optional match tolerance days
+    parser.add_argument(
+        "--tolerance-days",
+        dest = "tolerance-days",
+        type = int,
+        default = os.getenv("TOLERANCE_DAYS") or 0,
+        required = False,
+        help = "Business days a statement entry may be off from the payment date of its finishers when matching (optional)"
+    )
+
     # Optional database URI
     parser.add_argument(
         "--database-uri",
@@ -147,6 +235,12 @@ def main():
         if not value is None
     }
 
+    # Function to parse dates given only by flags (none when not given)
+    parse_date: typing.Callable[[typing.Optional[str]], typing.Optional[datetime.date]] = lambda value: datetime.date.fromisoformat(value) if value else None
+
+    # Function to parse link dates (flag, then environment variable, then today)
+    parse_link_date: typing.Callable[[typing.Optional[str], str], datetime.date] = lambda value, name: datetime.date.fromisoformat(value or os.getenv(name) or datetime.date.today().isoformat())
+
     # Instanciating the main class for the program
     conciliador = Conciliador.Conciliador(
         **clear_empty_args(
@@ -169,13 +263,20 @@ def main():
                 input = pathlib.Path(args["in-reports"]),
                 archive = pathlib.Path(args["archive-reports"]),
                 can_archive = not args["dev-mode"],
-                can_overwrite_archive = not args["dev-mode"]
+                can_overwrite_archive = not args["dev-mode"],
+                encoding = args["reports-encoding"],
+                executor_type = ExecutorTypeEnum.ExecutorTypeEnum(args["executor"]),
+                workers = args["workers"]
             )
             conciliador.load_statements(
                 input = pathlib.Path(args["in-statements"]),
                 archive = pathlib.Path(args["archive-statements"]),
                 can_archive = not args["dev-mode"],
-                can_overwrite_archive = not args["dev-mode"]
+                can_overwrite_archive = not args["dev-mode"],
+                encoding = args["statements-encoding"],
+                executor_type = ExecutorTypeEnum.ExecutorTypeEnum(args["executor"]),
+                workers = args["workers"],
+                is_lazy = args["lazy"]
             )
 
         case "load_reports":
@@ -183,7 +284,10 @@ def main():
                 input = pathlib.Path(args["in-reports"]),
                 archive = pathlib.Path(args["archive-reports"]),
                 can_archive = not args["dev-mode"],
-                can_overwrite_archive = not args["dev-mode"]
+                can_overwrite_archive = not args["dev-mode"],
+                encoding = args["reports-encoding"],
+                executor_type = ExecutorTypeEnum.ExecutorTypeEnum(args["executor"]),
+                workers = args["workers"]
             )
 
         case "load_statements":
@@ -191,12 +295,40 @@ def main():
                 input = pathlib.Path(args["in-statements"]),
                 archive = pathlib.Path(args["archive-statements"]),
                 can_archive = not args["dev-mode"],
-                can_overwrite_archive = not args["dev-mode"]
+                can_overwrite_archive = not args["dev-mode"],
+                encoding = args["statements-encoding"],
+                executor_type = ExecutorTypeEnum.ExecutorTypeEnum(args["executor"]),
+                workers = args["workers"],
+                is_lazy = args["lazy"]
             )
 
         case "link":
-            from datetime import date
-            conciliador.link(date(2025, 4, 24), date(2025, 4, 24))
+            if args["incremental"]:
+                print(conciliador.link(is_incremental = True))
+            else:
+                print(
+                    conciliador.link(
+                        start_date = parse_link_date(args["start-date"], "START_DATE"),
+                        end_date = parse_link_date(args["end-date"], "END_DATE")
+                    )
+                )
+
+        case "match":
+            print(
+                conciliador.match(
+                    start_date = parse_link_date(args["start-date"], "START_DATE"),
+                    end_date = parse_link_date(args["end-date"], "END_DATE"),
+                    tolerance_days = args["tolerance-days"]
+                )
+            )
+
+        case "reclassify":
+            print(
+                conciliador.reclassify(
+                    start_date = parse_date(args["start-date"]),
+                    end_date = parse_date(args["end-date"])
+                )
+            )
 
         case "all":
             conciliador.load_reports()
@@ -204,7 +336,7 @@ def main():
             conciliador.link()
 
         case _:
-            raise Exception(f"Invalid operation detected: {args["operation"]}")
+            raise Exception(f"Invalid operation detected: {args['operation']}")
 
 
 if __name__ == "__main__":
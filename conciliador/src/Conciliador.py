@@ -1,13 +1,18 @@
 import datetime
 import pathlib
 import polars
+import sqlalchemy
+import tempfile
 import typeguard
 import typing
 
+from .classifiers import FinisherClassifier, StatementEntryClassifier
 from .database import Database
 from .database.join import Join, JoinTypeEnum
-from .loaders import ReportLoader, StatementLoader
-from .utils import Currency
+from .database.models import DirtyDate, Verification
+from .loaders import ExecutorTypeEnum, Loader, ReportLoader, StatementLoader
+from .matchers import AmountMatcher
+from .utils import BusinessCalendar, Currency
 from .utils.unique_iter import UniqueList
 
 
@@ -42,22 +47,31 @@ class Conciliador():
             input: pathlib.Path,
             archive: pathlib.Path,
             can_archive: bool = False,
-            can_overwrite_archive: bool = False
+            can_overwrite_archive: bool = False,
+            encoding: typing.Optional[str] = None,
+            executor_type: ExecutorTypeEnum.ExecutorTypeEnum = ExecutorTypeEnum.ExecutorTypeEnum.SEQUENTIAL,
+            workers: typing.Optional[int] = None
         ) -> None:
         loader: ReportLoader.ReportLoader = ReportLoader.ReportLoader()
 
-        # Load files and archive them
+        # Load files not ingested yet and archive them
         paths: typing.Tuple[pathlib.Path, ...] = loader.extract_paths(input, folder_filter = "*.csv")
-        dataframes: typing.Tuple[polars.DataFrame, ...] = loader.process_files(paths)
+        new_paths: typing.Tuple[pathlib.Path, ...] = loader.filter_paths(paths, ignored_hashes = self.__read_ingested_hashes(paths))
+        dataframes: typing.Dict[pathlib.Path, polars.DataFrame] = loader.process_files(new_paths, encoding = encoding, executor_type = executor_type, workers = workers)
+        ingested_files_df: polars.DataFrame = self.__create_ingested_files(dataframes.keys())
         if can_archive:
             loader.archive_files(paths, archive, can_overwrite_archive = can_overwrite_archive)
 
+        # Check if all files were already ingested
+        if paths and not new_paths:
+            return
+
         # Check if no data was found
         if not dataframes:
             raise Exception("No data was found.")
 
         # Concatenate dataframes and format them
-        concat_df: polars.DataFrame = polars.concat(dataframes, how = "vertical")
+        concat_df: polars.DataFrame = polars.concat(dataframes.values(), how = "vertical")
         concat_df = concat_df.select(
             [
                 polars.col("Turno").cast(polars.Int64).alias("shift"),
@@ -79,61 +93,122 @@ class Conciliador():
             ]
         ).unique()
 
-        # Extend database with reports and recover ids
-        last_id: int = self.__database.extend("report", reports_df)[0]
-        reports_df = reports_df.with_columns([
-            (polars.Series(name = "id", values = [last_id - (reports_df.height - i - 1) for i in range(reports_df.height)]))
-        ])
+        # Reuse reports already loaded through overlapping exports
+        start_times: typing.List[datetime.datetime] = reports_df.get_column("start_time").to_list()
+        loaded_reports_df: polars.DataFrame = self.__database.read(
+            "report",
+            columns = ["report.id", "report.start_time"],
+            conditions = {
+                "report.start_time": lambda x: x.in_(start_times),
+            }
+        ).select(
+            [
+                polars.col("report.start_time").cast(polars.Datetime("us")).alias("start_time"),
+                polars.col("report.id").cast(polars.Int64).alias("id"),
+            ]
+        )
+        reports_df = reports_df.join(loaded_reports_df, on = "start_time", how = "anti")
+
+        # Skip finishers already loaded (names are unique within a report, so a repeated name keeps its loaded value)
+        loaded_start_times: typing.List[datetime.datetime] = loaded_reports_df.get_column("start_time").to_list()
+        loaded_finishers_df: polars.DataFrame = self.__database.read(
+            "report",
+            columns = ["report.start_time", "finisher.name"],
+            joins = [
+                Join.Join("report", "finisher", lambda x, y: x.id == y.report_id, JoinTypeEnum.JoinTypeEnum.INNER),
+            ],
+            conditions = {
+                "report.start_time": lambda x: x.in_(loaded_start_times),
+            }
+        ).select(
+            [
+                polars.col("report.start_time").cast(polars.Datetime("us")).alias("start_time"),
+                polars.col("finisher.name").cast(polars.String).alias("name"),
+            ]
+        )
+        concat_df = concat_df.join(loaded_finishers_df, on = ["start_time", "name"], how = "anti")
 
-        # Link reports to finishers with recovered id
-        concat_df = concat_df.join(
-            reports_df,
-            on = [col for col in concat_df.columns if col in reports_df.columns],
-            how = "left"
+        # Classify finishers as columns (type, payment date and payment value)
+        classifier: FinisherClassifier.FinisherClassifier = FinisherClassifier.FinisherClassifier(
+            self.__database.read("finisher_pattern").rename(lambda column: Database.Database.parse_column_name(column)[1]),
+            self.__database.read("rate").rename(lambda column: Database.Database.parse_column_name(column)[1])
         )
+        concat_df = classifier.classify(concat_df)
+
+        # Link finishers to reports through the recovered ids of new reports or the ids of loaded ones
+        def build_finishers(keys: typing.Dict[str, polars.Series]) -> polars.DataFrame:
+            new_reports_df: polars.DataFrame = reports_df.with_columns(keys["report"].cast(polars.Int64).alias("id"))
+            return polars.concat(
+                [
+                    concat_df.join(new_reports_df, on = [col for col in concat_df.columns if col in reports_df.columns], how = "inner"),
+                    concat_df.join(loaded_reports_df, on = "start_time", how = "inner"),
+                ],
+                how = "diagonal"
+            ).select(
+                [
+                    polars.col("id").alias("report_id"),
+                    polars.col("name").alias("name"),
+                    polars.col("value").alias("value"),
+                    polars.col("type_id").alias("type_id"),
+                    polars.col("payment_date").alias("payment_date"),
+                    polars.col("payment_value").alias("payment_value"),
+                ]
+            )
 
-        # Create finishers dataframe
-        finishers_df: polars.DataFrame = concat_df.select(
+        # Extend database with reports, already classified finishers and ingested files at once (listeners skipped, daily totals of their dates and types are kept by the database)
+        self.__database.extend_all(
             [
-                polars.col("id").alias("report_id"),
-                polars.col("name").alias("name"),
-                polars.col("value").alias("value"),
+                ("report", lambda keys: reports_df),
+                ("finisher", build_finishers),
+                ("ingested_file", lambda keys: ingested_files_df),
             ]
         )
 
-        # Extend database with finishers
-        self.__database.extend("finisher", finishers_df)
-
 
     def load_statements(
             self,
             input: pathlib.Path,
             archive: pathlib.Path,
             can_archive: bool = False,
-            can_overwrite_archive: bool = False
+            can_overwrite_archive: bool = False,
+            encoding: typing.Optional[str] = None,
+            executor_type: ExecutorTypeEnum.ExecutorTypeEnum = ExecutorTypeEnum.ExecutorTypeEnum.SEQUENTIAL,
+            workers: typing.Optional[int] = None,
+            is_lazy: bool = False
         ) -> None:
         loader: StatementLoader.StatementLoader = StatementLoader.StatementLoader()
 
-        # Load files and archive them
+        # Statement columns (dates and amounts parsed in the same pass)
+        statement_columns: typing.List[polars.Expr] = [
+            polars.col("Data").str.strptime(polars.Date, "%d/%m/%Y").alias("date"),
+            polars.col("Histórico").cast(polars.String).alias("name"),
+            polars.col("Valor").str.replace_all(r"[,.]", "").cast(polars.Int64).alias("value"),
+        ]
+
+        # Load files not ingested yet and archive them
         paths: typing.Tuple[pathlib.Path, ...] = loader.extract_paths(input, folder_filter = "*.csv")
-        dataframes: typing.Tuple[polars.DataFrame, ...] = loader.process_files(paths)
+        new_paths: typing.Tuple[pathlib.Path, ...] = loader.filter_paths(paths, ignored_hashes = self.__read_ingested_hashes(paths))
+        if is_lazy:
+            # Single scan of all files collected once through the streaming engine
+            with tempfile.TemporaryDirectory() as directory:
+                concat_df: polars.DataFrame = loader.scan_files(new_paths, pathlib.Path(directory), encoding = encoding).select(statement_columns).collect(engine = "streaming") if new_paths else polars.DataFrame()
+            ingested_paths: typing.Iterable[pathlib.Path] = new_paths
+        else:
+            dataframes: typing.Dict[pathlib.Path, polars.DataFrame] = loader.process_files(new_paths, encoding = encoding, executor_type = executor_type, workers = workers)
+            concat_df: polars.DataFrame = polars.concat(dataframes.values(), how = "vertical").select(statement_columns) if dataframes else polars.DataFrame()
+            ingested_paths: typing.Iterable[pathlib.Path] = dataframes.keys()
+        ingested_files_df: polars.DataFrame = self.__create_ingested_files(ingested_paths)
         if can_archive:
             loader.archive_files(paths, archive, can_overwrite_archive = can_overwrite_archive)
 
+        # Check if all files were already ingested
+        if paths and not new_paths:
+            return
+
         # Check if no data was found
-        if not dataframes:
+        if not ingested_paths:
             raise Exception("No data was found.")
 
-        # Concatenate dataframes and create statements dataframe
-        concat_df: polars.DataFrame = polars.concat(dataframes, how = "vertical")
-        concat_df = concat_df.select(
-            [
-                polars.col("Data").str.strptime(polars.Date, "%d/%m/%Y").alias("date"),
-                polars.col("Histórico").cast(polars.String).alias("name"),
-                polars.col("Valor").str.replace_all(r"[,.]", "").cast(polars.Int64).alias("value"),
-            ]
-        )
-
         # Create statements dataframe
         statements_df: polars.DataFrame = concat_df.select(
             [
@@ -141,83 +216,293 @@ class Conciliador():
             ]
         ).unique()
 
-        # Extend database with reports and recover ids
-        last_id: int = self.__database.extend("statement", statements_df)[0]
-        statements_df = statements_df.with_columns([
-            (polars.Series(name = "id", values = [last_id - (statements_df.height - i - 1) for i in range(statements_df.height)]))
-        ])
+        # Reuse statements already loaded through overlapping exports
+        dates: typing.List[datetime.date] = statements_df.get_column("date").to_list()
+        loaded_statements_df: polars.DataFrame = self.__database.read(
+            "statement",
+            columns = ["statement.id", "statement.date"],
+            conditions = {
+                "statement.date": lambda x: x.in_(dates),
+            }
+        ).select(
+            [
+                polars.col("statement.date").cast(polars.Date).alias("date"),
+                polars.col("statement.id").cast(polars.Int64).alias("id"),
+            ]
+        )
+        statements_df = statements_df.join(loaded_statements_df, on = "date", how = "anti")
+
+        # Skip statement entries already loaded (repeated entries are compared by occurrence)
+        loaded_dates: typing.List[datetime.date] = loaded_statements_df.get_column("date").to_list()
+        entry_keys: typing.List[str] = ["date", "name", "value"]
+        loaded_statement_entries_df: polars.DataFrame = self.__database.read(
+            "statement",
+            columns = ["statement.date", "statement_entry.name", "statement_entry.value"],
+            joins = [
+                Join.Join("statement", "statement_entry", lambda x, y: x.id == y.statement_id, JoinTypeEnum.JoinTypeEnum.INNER),
+            ],
+            conditions = {
+                "statement.date": lambda x: x.in_(loaded_dates),
+            }
+        ).select(
+            [
+                polars.col("statement.date").cast(polars.Date).alias("date"),
+                polars.col("statement_entry.name").cast(polars.String).alias("name"),
+                polars.col("statement_entry.value").cast(polars.Int64).alias("value"),
+            ]
+        )
+        concat_df = concat_df.with_columns(
+            polars.int_range(polars.len()).over(entry_keys).alias("rank")
+        ).join(
+            loaded_statement_entries_df.with_columns(polars.int_range(polars.len()).over(entry_keys).alias("rank")),
+            on = entry_keys + ["rank"],
+            how = "anti"
+        ).drop("rank")
+
+        # Classify statement entries as a column (type)
+        classifier: StatementEntryClassifier.StatementEntryClassifier = StatementEntryClassifier.StatementEntryClassifier(
+            self.__database.read("statement_entry_pattern").rename(lambda column: Database.Database.parse_column_name(column)[1])
+        )
+        concat_df = classifier.classify(concat_df)
+
+        # Link statement entries to statements through the recovered ids of new statements or the ids of loaded ones
+        def build_statement_entries(keys: typing.Dict[str, polars.Series]) -> polars.DataFrame:
+            dates_df: polars.DataFrame = polars.concat(
+                [
+                    loaded_statements_df,
+                    statements_df.with_columns(keys["statement"].cast(polars.Int64).alias("id")),
+                ],
+                how = "vertical"
+            )
+            return concat_df.join(
+                dates_df,
+                on = "date",
+                how = "left"
+            ).select(
+                [
+                    polars.col("id").alias("statement_id"),
+                    polars.col("name").alias("name"),
+                    polars.col("value").alias("value"),
+                    polars.col("type_id").alias("type_id"),
+                ]
+            )
 
-        # Link reports to statement entries with recovered id
-        concat_df = concat_df.join(
-            statements_df,
-            on = [col for col in concat_df.columns if col in statements_df.columns],
-            how = "left"
+        # Extend database with statements, already classified statement entries and ingested files at once (listeners skipped, daily totals of their dates and types are kept by the database)
+        self.__database.extend_all(
+            [
+                ("statement", lambda keys: statements_df),
+                ("statement_entry", build_statement_entries),
+                ("ingested_file", lambda keys: ingested_files_df),
+            ]
+        )
+
+
+    def link(
+            self,
+            start_date: typing.Optional[datetime.date] = None,
+            end_date: typing.Optional[datetime.date] = None,
+            is_incremental: bool = False
+        ) -> polars.DataFrame:
+        if not is_incremental and (start_date is None or end_date is None):
+            raise Exception("No start or end date was given.")
+
+        # Payment values of changed rates may still be recomputing (match links through here first)
+        self.__database.wait_recomputes()
+
+        # Read daily totals of the dates (only of changed dates and types if incremental)
+        first_date: datetime.date = start_date or datetime.date.min
+        last_date: datetime.date = end_date or datetime.date.max
+        daily_totals_df: polars.DataFrame = self.__database.read(
+            "daily_total",
+            columns = ["daily_total.date", "daily_total.type_id", "daily_total.finishers_net_value", "daily_total.finishers_count", "daily_total.statement_entries_value", "daily_total.statement_entries_count"],
+            joins = [
+                Join.Join("daily_total", "dirty_date", lambda x, y: sqlalchemy.and_(x.date == y.date, x.type_id == y.type_id), JoinTypeEnum.JoinTypeEnum.INNER),
+            ] if is_incremental else [],
+            conditions = {
+                "daily_total.date": lambda x: x.between(first_date, last_date),
+            }
         )
 
-        # Create statement entries dataframe
-        statement_entries_df: polars.DataFrame = concat_df.select(
+        # Compare totals of both sides for every classified date and type still holding rows
+        totals_df: polars.DataFrame = daily_totals_df.filter(
+            (polars.col("daily_total.finishers_count") > 0) | (polars.col("daily_total.statement_entries_count") > 0)
+        ).select(
             [
-                polars.col("id").alias("statement_id"),
-                polars.col("name").alias("name"),
-                polars.col("value").alias("value"),
+                polars.col("daily_total.date").cast(polars.Date).alias("date"),
+                polars.col("daily_total.type_id").cast(polars.String).alias("type_id"),
+                polars.col("daily_total.finishers_net_value").cast(polars.Int64).alias("finishers_value"),
+                polars.col("daily_total.statement_entries_value").cast(polars.Int64).alias("statement_entries_value"),
             ]
+        ).with_columns(
+            (polars.col("finishers_value") - polars.col("statement_entries_value")).alias("difference")
+        ).sort(["date", "type_id"])
+
+        # Choose verifications to be replaced (only of changed dates and types if incremental)
+        verification_ids: sqlalchemy.Select = sqlalchemy.select(
+            Verification.Verification.id
+        ).where(
+            Verification.Verification.date.between(first_date, last_date)
         )
+        if is_incremental:
+            verification_ids = verification_ids.join(
+                DirtyDate.DirtyDate,
+                sqlalchemy.and_(
+                    DirtyDate.DirtyDate.date == Verification.Verification.date,
+                    DirtyDate.DirtyDate.type_id == Verification.Verification.type_id
+                )
+            )
 
-        # Extend database with finishers
-        self.__database.extend("statement_entry", statement_entries_df)
+        # Unlink matched rows and remove verifications to be replaced
+        self.__database.update("finisher", {"verification_id": None}, verification_id = lambda x: x.in_(verification_ids))
+        self.__database.update("statement_entry", {"verification_id": None}, verification_id = lambda x: x.in_(verification_ids))
+        self.__database.delete("verification", id = lambda x: x.in_(verification_ids))
+
+        # Insert recomputed verifications in bulk
+        verification_ids_series: polars.Series = self.__database.extend(
+            "verification",
+            totals_df.select(
+                [
+                    polars.col("date").alias("date"),
+                    polars.col("type_id").alias("type_id"),
+                    (polars.col("difference") == 0).alias("is_verified"),
+                ]
+            ),
+            should_trigger_listeners = False
+        )
 
+        # Clear changed dates and types already recomputed and daily totals left without rows
+        self.__database.delete("dirty_date", date = lambda x: x.between(first_date, last_date))
+        self.__database.delete("daily_total", date = lambda x: x.between(first_date, last_date), finishers_count = lambda x: x == 0, statement_entries_count = lambda x: x == 0)
 
-    def link(
+        # Empty inserts come back without a dtype
+        return totals_df.with_columns(verification_ids_series.cast(polars.Int64).alias("verification_id"))
+
+
+    def match(
             self,
             start_date: datetime.date,
-            end_date: datetime.date
-        ) -> None:
-        current_date: datetime.date = start_date - datetime.timedelta(days = 1)
-        while current_date < end_date:
-            current_date += datetime.timedelta(days = 1)
+            end_date: datetime.date,
+            subset_size: int = AmountMatcher.MATCH_SUBSET_SIZE,
+            time_budget: float = AmountMatcher.MATCH_TIME_BUDGET,
+            tolerance_days: int = 0
+        ) -> polars.DataFrame:
+        # Recompute verifications of the dates to link matched rows to
+        totals_df: polars.DataFrame = self.link(start_date, end_date)
+
+        # Read both sides of the dates widened by the tolerance (the first and last days matched across it share the business day index of its bounds)
+        calendar: typing.Optional[BusinessCalendar.BusinessCalendar] = None
+        read_start_date: datetime.date = start_date
+        read_end_date: datetime.date = end_date
+        if tolerance_days > 0:
+            calendar = BusinessCalendar.BusinessCalendar(start_date.year - 1, end_date.year + 1)
+            read_start_date = calendar.shift_business_days(start_date, -(tolerance_days + 1)) + datetime.timedelta(days = 1)
+            read_end_date = calendar.shift_business_days(calendar.next_business_day(end_date), tolerance_days)
+
+        finishers_df: polars.DataFrame = self.__database.read(
+            "finisher",
+            columns = ["finisher.id", "finisher.payment_date", "finisher.type_id", "finisher.payment_value"],
+            conditions = {
+                "finisher.payment_date": lambda x: x.between(read_start_date, read_end_date),
+                "finisher.type_id": lambda x: x.is_not(None),
+            }
+        ).rename(
+            {
+                "finisher.id": "id",
+                "finisher.payment_date": "date",
+                "finisher.type_id": "type_id",
+                "finisher.payment_value": "value",
+            }
+        )
+        statement_entries_df: polars.DataFrame = self.__database.read(
+            "statement",
+            columns = ["statement_entry.id", "statement.date", "statement_entry.type_id", "statement_entry.value"],
+            joins = [
+                Join.Join("statement", "statement_entry", lambda x, y: x.id == y.statement_id, JoinTypeEnum.JoinTypeEnum.INNER),
+            ],
+            conditions = {
+                "statement.date": lambda x: x.between(read_start_date, read_end_date),
+                "statement_entry.type_id": lambda x: x.is_not(None),
+            }
+        ).rename(
+            {
+                "statement_entry.id": "id",
+                "statement.date": "date",
+                "statement_entry.type_id": "type_id",
+                "statement_entry.value": "value",
+            }
+        )
 
-            types: polars.DataFrame = self.__database.read(
-                "type"
-            )
+        # Match amounts within every type (and date unless a tolerance of business days is given)
+        matcher: AmountMatcher.AmountMatcher = AmountMatcher.AmountMatcher(
+            subset_size = subset_size,
+            time_budget = time_budget,
+            tolerance_days = tolerance_days,
+            calendar = calendar
+        )
+        matched_finishers_df, matched_statement_entries_df = matcher.match(finishers_df, statement_entries_df)
+
+        # Link matched rows of both sides to the verification of their date and type (matches of widened dates out of the range are dropped)
+        verifications_df: polars.DataFrame = totals_df.select(["date", "type_id", "verification_id"])
+        matched_finishers_df = matched_finishers_df.join(verifications_df, on = ["date", "type_id"], how = "inner")
+        matched_statement_entries_df = matched_statement_entries_df.join(verifications_df, on = ["date", "type_id"], how = "inner")
+        self.__database.update_rows("finisher", matched_finishers_df.select(["id", "verification_id"]))
+        self.__database.update_rows("statement_entry", matched_statement_entries_df.select(["id", "verification_id"]))
+
+        # Count matched rows of every verification
+        return totals_df.join(
+            matched_finishers_df.group_by("verification_id").agg(polars.len().cast(polars.Int64).alias("matched_finishers_count")),
+            on = "verification_id",
+            how = "left"
+        ).join(
+            matched_statement_entries_df.group_by("verification_id").agg(polars.len().cast(polars.Int64).alias("matched_statement_entries_count")),
+            on = "verification_id",
+            how = "left"
+        ).with_columns(
+            polars.col(["matched_finishers_count", "matched_statement_entries_count"]).fill_null(0)
+        )
 
-            day_finishers: polars.DataFrame = self.__database.read(
-                "finisher",
-                conditions = {
-                    "finisher.payment_date": lambda x: x == current_date,
-                }
-            )
 
-            day_statement_entries: polars.DataFrame = self.__database.read(
-                "statement",
-                joins = [
-                    Join.Join("statement", "statement_entry", lambda x, y: x.id == y.statement_id, JoinTypeEnum.JoinTypeEnum.INNER),
-                ],
+    def reclassify(
+            self,
+            start_date: typing.Optional[datetime.date] = None,
+            end_date: typing.Optional[datetime.date] = None
+        ) -> typing.Tuple[int, int]:
+        # Classify again finishers and statement entries with the current patterns (changed dates are recomputed by the next link)
+        self.__database.wait_recomputes()
+        return self.__database.reclassify(start_date = start_date, end_date = end_date)
+
+
+    def __read_ingested_hashes(
+            self,
+            paths: typing.Iterable[pathlib.Path]
+        ) -> typing.Set[str]:
+        hashes: typing.List[str] = [Loader.Loader.hash_file(path) for path in paths]
+        return set(
+            self.__database.read(
+                "ingested_file",
+                columns = ["ingested_file.hash"],
                 conditions = {
-                    "statement.date": lambda x: x == current_date,
+                    "ingested_file.hash": lambda x: x.in_(hashes),
                 }
-            )
+            ).get_column("ingested_file.hash").to_list()
+        )
 
-            for type in types.to_dicts():
-                type_id: str = type["type.id"]
-                self.__database.delete("verification", date = lambda x: x == current_date)
-                verification_id = self.__database.insert(
-                    "verification",
-                    {
-                        "date": current_date,
-                        "type_id": type_id,
-                    }
-                )[0]
-                type_day_finishers: polars.DataFrame = day_finishers.filter(
-                    polars.col("finisher.type_id") == type_id
-                )
-                type_day_statement_entries: polars.DataFrame = day_statement_entries.filter(
-                    polars.col("statement_entry.type_id") == type_id
-                )
-                print(type_id, current_date)
-                print(sum([value for value in type_day_finishers["finisher.payment_value"].to_list() if value]))
-                print(sum(type_day_statement_entries["statement_entry.value"].to_list()))
-                print(type_day_finishers)
-                print(type_day_statement_entries)
+
+    def __create_ingested_files(
+            self,
+            paths: typing.Iterable[pathlib.Path]
+        ) -> polars.DataFrame:
+        return polars.DataFrame(
+            [
+                {
+                    "hash": Loader.Loader.hash_file(path),
+                    "name": path.name,
+                    "size": path.stat().st_size,
+                }
+                for path in paths
+            ],
+            schema = {"hash": polars.String, "name": polars.String, "size": polars.Int64}
+        )
 
 
 if __name__ == "__main__":
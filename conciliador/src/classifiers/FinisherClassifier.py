@@ -0,0 +1,191 @@
+import datetime
+import polars
+import re
+import typeguard
+import typing
+
+from ..utils import BusinessCalendar
+
+
+T = typing.TypeVar("T")
+
+CALENDAR_PAST_YEARS = 10
+
+NUMBERED_REFERENCE_PATTERN = re.compile(r"\\[1-9]|\(\?\(\d")
+
+
+@typeguard.typechecked
+class FinisherClassifier():
+
+    def __init__(
+            self,
+            finisher_patterns: polars.DataFrame,
+            rates: polars.DataFrame,
+            calendar: typing.Optional[BusinessCalendar.BusinessCalendar] = None
+        ) -> None:
+        self.__patterns: typing.List[typing.Tuple[re.Pattern, typing.Optional[str], typing.Optional[int]]] = [
+            (re.compile(finisher_pattern["pattern"]), finisher_pattern["type_id"], finisher_pattern["payment_interval"])
+            for finisher_pattern in finisher_patterns.to_dicts()
+        ]
+
+        # Combine patterns into single matchers trying the last pattern first (last matching pattern wins)
+        self.__pattern_matcher: typing.Optional[typing.Tuple[re.Pattern, typing.Dict[int, typing.Tuple[typing.Optional[str], typing.Optional[int]]]]] = FinisherClassifier.combine_patterns(
+            [(pattern.pattern, (type_id, payment_interval)) for pattern, type_id, payment_interval in reversed(self.__patterns)]
+        )
+        self.__payment_interval_matcher: typing.Optional[typing.Tuple[re.Pattern, typing.Dict[int, int]]] = FinisherClassifier.combine_patterns(
+            [(pattern.pattern, payment_interval) for pattern, _, payment_interval in reversed(self.__patterns) if payment_interval is not None]
+        )
+        self.__can_combine: bool = self.__pattern_matcher is not None and self.__payment_interval_matcher is not None
+        self.__rates: polars.DataFrame = rates.select(
+            [
+                polars.col("type_id").cast(polars.String).alias("type_id"),
+                polars.col("rate").cast(polars.Float64).alias("rate"),
+                polars.col("start_time").cast(polars.Datetime("us")).alias("start_time"),
+            ]
+        ).sort("start_time")
+        self.__calendar: BusinessCalendar.BusinessCalendar = calendar or BusinessCalendar.BusinessCalendar(
+            datetime.date.today().year - CALENDAR_PAST_YEARS,
+            datetime.date.today().year + 1
+        )
+
+
+    def classify_name(
+            self,
+            name: str
+        ) -> typing.Tuple[typing.Optional[str], typing.Optional[int]]:
+        return self.__classify_names([name])[0]
+
+
+    def classify_names(
+            self,
+            names: polars.Series
+        ) -> polars.DataFrame:
+        # Map of each distinct name to its type and payment interval
+        distinct_names: typing.List[str] = names.drop_nulls().unique().to_list()
+        classified_names: typing.List[typing.Tuple[typing.Optional[str], typing.Optional[int]]] = self.__classify_names(distinct_names)
+        return polars.DataFrame(
+            {
+                "name": distinct_names,
+                "type_id": [type_id for type_id, _ in classified_names],
+                "payment_interval": [payment_interval for _, payment_interval in classified_names],
+            },
+            schema = {"name": polars.String, "type_id": polars.String, "payment_interval": polars.Int64}
+        )
+
+
+    def __classify_names(
+            self,
+            names: typing.List[str]
+        ) -> typing.List[typing.Tuple[typing.Optional[str], typing.Optional[int]]]:
+        # Single match of the combined matcher per name (the matched alternative tells the pattern)
+        if self.__can_combine:
+            combined_pattern, pattern_values = self.__pattern_matcher
+            payment_interval_pattern, payment_intervals = self.__payment_interval_matcher
+            classified_names: typing.List[typing.Tuple[typing.Optional[str], typing.Optional[int]]] = []
+            for name in names:
+                pattern_match = combined_pattern.match(name)
+                if not pattern_match:
+                    classified_names.append((None, None))
+                    continue
+
+                # Payment interval comes from the last matching pattern having one
+                type_id, payment_interval = pattern_values[pattern_match.lastindex]
+                if payment_interval is None:
+                    payment_interval_match = payment_interval_pattern.match(name)
+                    payment_interval = payment_intervals[payment_interval_match.lastindex] if payment_interval_match else None
+
+                classified_names.append((type_id, payment_interval))
+
+            return classified_names
+
+        # Last matching pattern wins
+        classified_names: typing.List[typing.Tuple[typing.Optional[str], typing.Optional[int]]] = []
+        for name in names:
+            type_id = None
+            payment_interval = None
+            for pattern, pattern_type_id, pattern_payment_interval in self.__patterns:
+                if pattern.match(name):
+                    type_id = pattern_type_id
+                    if pattern_payment_interval is not None:
+                        payment_interval = pattern_payment_interval
+
+            classified_names.append((type_id, payment_interval))
+
+        return classified_names
+
+
+    def classify(
+            self,
+            finishers: polars.DataFrame
+        ) -> polars.DataFrame:
+        # Classify each distinct name only once and join results onto all rows
+        finishers = finishers.join(
+            self.classify_names(finishers.get_column("name")),
+            on = "name",
+            how = "left",
+            maintain_order = "left"
+        )
+
+        # Compute raw payment date ("cash" is paid on the next day for non-first shifts)
+        finishers = finishers.with_columns(
+            (
+                polars.col("start_time").dt.date() + polars.duration(
+                    days = polars.col("payment_interval") + polars.when(
+                        (polars.col("type_id") == "cash") & (polars.col("shift") > 0)
+                    ).then(1).otherwise(0)
+                )
+            ).alias("payment_date")
+        )
+
+        # Fix payment dates to next business day
+        finishers = finishers.with_columns(
+            self.__calendar.next_business_days(finishers.get_column("payment_date"))
+        )
+
+        # Compute payment value with the rate of each type in effect at the report start time
+        finishers = finishers.with_row_index("index").sort("start_time").join_asof(
+            self.__rates.with_columns(
+                polars.col("start_time").cast(finishers.schema["start_time"])
+            ),
+            on = "start_time",
+            by = "type_id",
+            strategy = "backward",
+            check_sortedness = False
+        ).sort("index").with_columns(
+            polars.when(polars.col("type_id").is_not_null()).then(
+                (polars.col("value") * (1 - polars.col("rate").fill_null(0))).cast(polars.Int64)
+            ).alias("payment_value")
+        )
+
+        return finishers.drop(["index", "payment_interval", "rate"])
+
+
+    def next_business_day(
+            self,
+            date: datetime.date
+        ) -> datetime.date:
+        return self.__calendar.next_business_day(date)
+
+
+    @staticmethod
+    def combine_patterns(
+            patterns: typing.List[typing.Tuple[str, T]]
+        ) -> typing.Optional[typing.Tuple[re.Pattern, typing.Dict[int, T]]]:
+        # Patterns with numbered references can not be renumbered inside the alternation
+        if any(NUMBERED_REFERENCE_PATTERN.search(pattern) for pattern, _ in patterns):
+            return None
+
+        # Each pattern becomes an outer group of the alternation (its number maps to the pattern value)
+        alternatives: typing.List[str] = []
+        values: typing.Dict[int, T] = {}
+        group: int = 1
+        try:
+            for pattern, value in patterns:
+                alternatives.append(f"({pattern})")
+                values[group] = value
+                group += re.compile(pattern).groups + 1
+
+            return (re.compile("|".join(alternatives) if alternatives else "(?!)"), values)
+
+        except re.error:
+            return None
\ No newline at end of file
@@ -0,0 +1,111 @@
+import polars
+import re
+import typeguard
+import typing
+
+
+@typeguard.typechecked
+class StatementEntryClassifier():
+
+    def __init__(
+            self,
+            statement_entry_patterns: polars.DataFrame
+        ) -> None:
+        # Garantee null as first patterns (patterns without a name lose to any matching name)
+        self.__patterns: typing.List[typing.Tuple[typing.Optional[str], typing.Optional[re.Pattern], typing.Optional[re.Pattern], typing.Dict[str, typing.Optional[int]]]] = [
+            (
+                statement_entry_pattern["type_id"],
+                re.compile(statement_entry_pattern["pattern"]) if statement_entry_pattern["pattern"] else None,
+                re.compile(statement_entry_pattern["value_pattern"]) if statement_entry_pattern.get("value_pattern") else None,
+                {predicate: statement_entry_pattern.get(predicate) for predicate in ["sign", "min_value", "max_value", "value"]}
+            )
+            for statement_entry_pattern in statement_entry_patterns.sort("pattern", nulls_last = False, maintain_order = True).to_dicts()
+        ]
+
+
+    def get_patterns(
+            self
+        ) -> typing.List[typing.Tuple[typing.Optional[str], typing.Optional[re.Pattern], typing.Optional[re.Pattern], typing.Dict[str, typing.Optional[int]]]]:
+        return self.__patterns
+
+
+    def classify_entry(
+            self,
+            name: str,
+            value: int
+        ) -> typing.Optional[str]:
+        # Last matching pattern wins (numeric predicates are checked before the name)
+        for type_id, pattern, value_pattern, predicates in reversed(self.__patterns):
+            if not all(StatementEntryClassifier.build_value_conditions(value, predicates)):
+                continue
+
+            if value_pattern and not value_pattern.match(str(value)):
+                continue
+
+            if pattern and not pattern.match(name):
+                continue
+
+            return type_id
+
+        return None
+
+
+    def classify(
+            self,
+            statement_entries: polars.DataFrame
+        ) -> polars.DataFrame:
+        # Match names (and legacy value patterns) only once per distinct string
+        names: polars.Series = statement_entries.get_column("name").cast(polars.String)
+        values: polars.Series = statement_entries.get_column("value").cast(polars.Int64)
+        whens: typing.List[typing.Tuple[polars.Expr, typing.Optional[str]]] = []
+        for type_id, pattern, value_pattern, predicates in reversed(self.__patterns):
+            conditions: typing.List[polars.Expr] = StatementEntryClassifier.build_value_conditions(polars.col("value").cast(polars.Int64), predicates)
+            if value_pattern:
+                conditions.append(polars.lit(StatementEntryClassifier.match_series(value_pattern, values.cast(polars.String))))
+            if pattern:
+                conditions.append(polars.lit(StatementEntryClassifier.match_series(pattern, names)))
+
+            whens.append((polars.all_horizontal(conditions) if conditions else polars.lit(True), type_id))
+
+        # Last matching pattern wins (first case of the reversed patterns)
+        type_id: polars.Expr = polars.lit(None, dtype = polars.String)
+        for condition, pattern_type_id in reversed(whens):
+            type_id = polars.when(condition).then(polars.lit(pattern_type_id, dtype = polars.String)).otherwise(type_id)
+
+        return statement_entries.with_columns(
+            type_id.alias("type_id")
+        )
+
+
+    @staticmethod
+    def build_value_conditions(
+            value: typing.Any,
+            predicates: typing.Dict[str, typing.Optional[int]]
+        ) -> typing.List[typing.Any]:
+        # Comparisons shared by plain integers, polars expressions and SQL columns
+        conditions: typing.List[typing.Any] = []
+        if predicates.get("sign") is not None:
+            if predicates["sign"] > 0:
+                conditions.append(value > 0)
+            elif predicates["sign"] < 0:
+                conditions.append(value < 0)
+            else:
+                conditions.append(value == 0)
+        if predicates.get("min_value") is not None:
+            conditions.append(value >= predicates["min_value"])
+        if predicates.get("max_value") is not None:
+            conditions.append(value <= predicates["max_value"])
+        if predicates.get("value") is not None:
+            conditions.append(value == predicates["value"])
+
+        return conditions
+
+
+    @staticmethod
+    def match_series(
+            pattern: re.Pattern,
+            series: polars.Series
+        ) -> polars.Series:
+        # Match each distinct string once and map results back onto every row
+        matches: typing.Dict[str, bool] = {string: bool(pattern.match(string)) for string in series.drop_nulls().unique().to_list()}
+        return series.replace_strict(matches, default = False, return_dtype = polars.Boolean)
\ No newline at end of file
@@ -8,6 +8,10 @@ class BaseModel(sqlalchemy.orm.DeclarativeBase):
 
     __abstract__ = True
 
+    # Cacheable tables hold reference data only written through Database (its reads are cached by
+    # Database and its rows kept in memory by the listeners, both invalidated on those writes)
+    __cacheable__ = False
+
 
     def __repr__(self) -> str:
         values = ", ".join(
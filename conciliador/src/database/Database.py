@@ -1,7 +1,12 @@
+import collections
 import colorama
+import datetime
+import functools
 import logging
+import math
 import pathlib
 import polars
+import re
 import sqlalchemy
 import sqlalchemy.orm
 import typeguard
@@ -15,6 +20,25 @@ from .join import JoinTypeEnum
 from .models import * # Build all ORM models into Base.metadata
 
 
+READ_BATCH_SIZE = 100_000
+
+# Bytes of cached read results (estimated by polars, least recently used results are evicted first)
+READ_CACHE_SIZE = 64 * 1024 * 1024
+
+PATTERN_CACHE_SIZE = 1024
+
+PATTERN_MATCH_CACHE_SIZE = 1_000_000
+
+POLARS_TYPES: typing.Dict[type, polars.DataType] = {
+    bool: polars.Boolean(),
+    int: polars.Int64(),
+    float: polars.Float64(),
+    str: polars.String(),
+    datetime.date: polars.Date(),
+    datetime.datetime: polars.Datetime("us")
+}
+
+
 @typeguard.typechecked
 class Database():
 
@@ -25,17 +49,26 @@ class Database():
             insertions_path: pathlib.Path,
             can_fill: bool = True,
             can_purge: bool = False,
-            has_dev_mode: bool = False
+            has_dev_mode: bool = False,
+            should_defer_recomputes: bool = False
         ) -> None:
         self.__logger: logging.Logger = self.__init_logger(log_path, has_dev_mode)
         self.__engine: sqlalchemy.Engine = sqlalchemy.create_engine(database_uri)
+
+        # Register SQL functions on every new SQLite connection
+        if self.__engine.dialect.name == "sqlite":
+            sqlalchemy.event.listen(self.__engine, "connect", Database.register_sqlite_functions)
+
         self.__db_metadata: sqlalchemy.MetaData = sqlalchemy.MetaData()
         self.__orm_metadata: sqlalchemy.MetaData = BaseModel.BaseModel.metadata
-        self.__sessionmaker = sqlalchemy.orm.sessionmaker(bind = self.__engine)
+        self.__sessionmaker = sqlalchemy.orm.sessionmaker(bind = self.__engine, info = {"should_defer_recomputes": should_defer_recomputes})
         self.__inspector: sqlalchemy.Inspector = sqlalchemy.inspect(self.__engine)
+        self.__read_cache: collections.OrderedDict[typing.Tuple[str, str], typing.Tuple[typing.FrozenSet[str], polars.DataFrame]] = collections.OrderedDict()
+        self.__read_cache_size: int = 0
 
         # Load schema from database
         self.__db_metadata.reflect(bind = self.__engine)
+        has_daily_totals: bool = "daily_total" in self.__db_metadata.tables
 
         # Validate schema from database and schema defined via ORM
         self.sync_schema(can_fill = can_fill, can_purge = can_purge, should_raise_permission_errors = True)
@@ -43,6 +76,11 @@ class Database():
         # Setup models
         ModelsConfig.ModelsConfig.setup_models(self.__sessionmaker(), insertions_path = insertions_path)
 
+        # Daily totals are kept incrementally, so a new table starts from the rows already stored
+        if not has_daily_totals:
+            with self.__engine.begin() as connection:
+                ModelsConfig.ModelsConfig.rebuild_daily_totals(connection)
+
         # Load all event listeners
         ModelsConfig.ModelsConfig.activate_listeners()
 
@@ -51,6 +89,47 @@ class Database():
         self.__db_metadata.reflect(bind = self.__engine)
 
 
+    @staticmethod
+    def register_sqlite_functions(
+            dbapi_connection: typing.Any,
+            connection_record: typing.Any
+        ) -> None:
+        # Results are cached as the same names are matched against the same patterns
+        dbapi_connection.create_function(
+            "match_pattern",
+            2,
+            functools.lru_cache(maxsize = PATTERN_MATCH_CACHE_SIZE)(Database.match_pattern),
+            deterministic = True
+        )
+
+        # Math functions are only built into SQLite 3.35 and later
+        dbapi_connection.create_function(
+            "trunc",
+            1,
+            lambda value: math.trunc(value) if value is not None else None,
+            deterministic = True
+        )
+
+
+    @staticmethod
+    def match_pattern(
+            pattern: typing.Optional[str],
+            value: typing.Optional[str]
+        ) -> typing.Optional[bool]:
+        if pattern is None or value is None:
+            return None
+
+        return Database.compile_pattern(pattern).match(value) is not None
+
+
+    @staticmethod
+    @functools.lru_cache(maxsize = PATTERN_CACHE_SIZE)
+    def compile_pattern(
+            pattern: str
+        ) -> re.Pattern:
+        return re.compile(pattern)
+
+
     @staticmethod
     def parse_column_name(
             column_name: str
@@ -61,6 +140,18 @@ class Database():
         return (table, column_name)
 
 
+    @staticmethod
+    def get_polars_type(
+            column: sqlalchemy.ColumnElement
+        ) -> polars.DataType:
+        try:
+            python_type: type = column.type.python_type
+        except NotImplementedError:
+            return polars.Object()
+
+        return POLARS_TYPES.get(python_type, polars.Object())
+
+
     def insert(
             self,
             table_name: typing.Type[BaseModel.BaseModel] | str,
@@ -75,6 +166,7 @@ class Database():
                 instance: BaseModel.BaseModel = model(**data)
                 session.add(instance)
                 session.commit()
+                self.__invalidate_read_cache(model.__tablename__)
 
                 return tuple(pk for pk in sqlalchemy.inspect(instance).identity)
 
@@ -89,19 +181,34 @@ class Database():
     def extend(
             self,
             table_name: typing.Type[BaseModel.BaseModel] | str,
-            data: polars.DataFrame
-        ) -> typing.Tuple[typing.Any, ...]:
+            data: polars.DataFrame,
+            should_trigger_listeners: bool = True
+        ) -> polars.Series:
         if not self.has_table(table_name):
             raise Exception("Table name not found on schema tables.")
 
         with self.__sessionmaker() as session:
             try:
                 model: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model(table_name) if isinstance(table_name, str) else table_name
+                primary_key: sqlalchemy.Column = model.__table__.primary_key.columns[0]
+
+                if data.is_empty():
+                    return polars.Series(name = primary_key.name, values = [])
+
+                # Core executemany insert skipping ORM listeners (values must be already computed)
+                if not should_trigger_listeners:
+                    keys: polars.Series = self.__insert_rows(session, model, data)
+                    session.commit()
+                    self.__invalidate_read_cache(model.__tablename__)
+
+                    return keys
+
                 instances: typing.List[BaseModel.BaseModel] = [model(**record) for record in data.to_dicts()]
                 session.add_all(instances)
                 session.commit()
+                self.__invalidate_read_cache(model.__tablename__)
 
-                return tuple(pk for pk in sqlalchemy.inspect(instances[-1]).identity)
+                return polars.Series(name = primary_key.name, values = [sqlalchemy.inspect(instance).identity[0] for instance in instances])
 
             except Exception as e:
                 session.rollback()
@@ -111,6 +218,54 @@ class Database():
                 session.close()
 
 
+    def extend_all(
+            self,
+            tables: typing.List[typing.Tuple[str, typing.Callable[[typing.Dict[str, polars.Series]], polars.DataFrame]]]
+        ) -> typing.Dict[str, polars.Series]:
+        for table_name, _ in tables:
+            if not self.has_table(table_name):
+                raise Exception("Table name not found on schema tables.")
+
+        with self.__sessionmaker() as session:
+            try:
+                # Build the rows of each table from the keys inserted before it and insert all of them in a single transaction (listeners skipped)
+                keys: typing.Dict[str, polars.Series] = {}
+                for table_name, build_data in tables:
+                    keys[table_name] = self.__insert_rows(session, BaseModel.BaseModel.get_model(table_name), build_data(keys))
+                session.commit()
+                for table_name in keys:
+                    self.__invalidate_read_cache(table_name)
+
+                return keys
+
+            except Exception as e:
+                session.rollback()
+                raise Exception(f"Failed to extend tables: {e}")
+
+            finally:
+                session.close()
+
+
+    def __insert_rows(
+            self,
+            session: sqlalchemy.orm.Session,
+            model: typing.Type[BaseModel.BaseModel],
+            data: polars.DataFrame
+        ) -> polars.Series:
+        primary_key: sqlalchemy.Column = model.__table__.primary_key.columns[0]
+        if data.is_empty():
+            return polars.Series(name = primary_key.name, values = [])
+
+        keys: typing.Sequence[typing.Any] = session.scalars(
+            sqlalchemy.insert(model.__table__).returning(primary_key, sort_by_parameter_order = True),
+            data.to_dicts()
+        ).all()
+
+        # Add inserted rows to daily totals of their dates and types
+        ModelsConfig.ModelsConfig.track_inserted_rows(session.connection(), model, data)
+        return polars.Series(name = primary_key.name, values = keys)
+
+
     def read(
             self,
             table_name: typing.Type[BaseModel.BaseModel] | str,
@@ -126,123 +281,122 @@ class Database():
         if not self.has_table(table_name):
             raise Exception("Table name not found on schema tables.")
 
+        # Reuse results of queries only over cacheable tables
+        model: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model(table_name) if isinstance(table_name, str) else table_name
+        table_names: typing.FrozenSet[str] = frozenset(
+            [model.__tablename__]
+            + [join.left_table_name for join in joins]
+            + [join.right_table_name for join in joins]
+        )
+        can_cache: bool = all(BaseModel.BaseModel.get_model(name).__cacheable__ for name in table_names)
+
+        if can_cache:
+            with self.__sessionmaker() as session:
+                query, schema = self.__build_query(
+                    session,
+                    table_name,
+                    columns = columns,
+                    distinct = distinct,
+                    limit = limit,
+                    offset = offset,
+                    order_by = order_by,
+                    group_by = group_by,
+                    joins = joins,
+                    conditions = conditions
+                )
+                compiled: sqlalchemy.Compiled = query.with_entities(*schema.values()).statement.compile(dialect = self.__engine.dialect)
+                key: typing.Tuple[str, str] = (str(compiled), repr(compiled.params))
+
+            if key in self.__read_cache:
+                self.__read_cache.move_to_end(key)
+                return self.__read_cache[key][1].clone()
+
+        dataframe: polars.DataFrame = polars.concat(
+            self.read_batches(
+                table_name,
+                columns = columns,
+                distinct = distinct,
+                limit = limit,
+                offset = offset,
+                order_by = order_by,
+                group_by = group_by,
+                joins = joins,
+                conditions = conditions
+            ),
+            rechunk = True
+        )
+
+        if can_cache:
+            # Results larger than the whole cache are not kept
+            size: int = dataframe.estimated_size()
+            if size <= READ_CACHE_SIZE:
+                self.__read_cache[key] = (table_names, dataframe.clone())
+                self.__read_cache_size += size
+                while self.__read_cache_size > READ_CACHE_SIZE:
+                    _, (_, evicted_dataframe) = self.__read_cache.popitem(last = False)
+                    self.__read_cache_size -= evicted_dataframe.estimated_size()
+
+        return dataframe
+
+
+    def read_batches(
+            self,
+            table_name: typing.Type[BaseModel.BaseModel] | str,
+            columns: typing.Iterable[str] = [],
+            distinct: bool = False,
+            limit: int = 0,
+            offset: int = 0,
+            order_by: typing.Dict[str, ColumnOrdinationEnum.ColumnOrdinationEnum] = {},
+            group_by: typing.Iterable[str] = [],
+            joins: typing.Iterable[Join.Join] = [],
+            conditions: typing.Dict[str, typing.Callable[[sqlalchemy.orm.InstrumentedAttribute], sqlalchemy.ClauseElement]] = {},
+            batch_size: int = READ_BATCH_SIZE
+        ) -> typing.Iterator[polars.DataFrame]:
+        if not self.has_table(table_name):
+            raise Exception("Table name not found on schema tables.")
+
+        if batch_size <= 0:
+            raise ValueError("Batch size must be a positive integer.")
+
         with self.__sessionmaker() as session:
             try:
-                model: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model(table_name) if isinstance(table_name, str) else table_name
-                models: typing.Dict[str, typing.Type[BaseModel.BaseModel]] = {}
-                models[model.__tablename__] = model
-                for join in joins:
-                    if not join.left_table_name in models:
-                        models[join.left_table_name] = BaseModel.BaseModel.get_model(join.left_table_name)
-                    if not join.right_table_name in models:
-                        models[join.right_table_name] = BaseModel.BaseModel.get_model(join.right_table_name)
-
-                schema: typing.List[sqlalchemy.Column] = [column for model in models.values() for column in model.__table__.columns]
-                query: sqlalchemy.orm.Query = session.query(*schema)
-
-                # Apply joins
-                for join in joins:
-                    clause: typing.Callable[[BaseModel.BaseModel, BaseModel.BaseModel], sqlalchemy.ClauseElement] = join.clause
-                    join_type: JoinTypeEnum.JoinTypeEnum = join.type
-
-                    match(join_type):
-                        case JoinTypeEnum.JoinTypeEnum.INNER:
-                            query = query.join(
-                                models[join.right_table_name],
-                                clause(models[join.left_table_name], models[join.right_table_name]),
-                                isouter = False,
-                                full = False
-                            )
-
-                        case JoinTypeEnum.JoinTypeEnum.LEFT_OUTER:
-                            query = query.outerjoin(
-                                models[join.right_table_name],
-                                clause(models[join.left_table_name], models[join.right_table_name]),
-                                full = False
-                            )
-
-                        case JoinTypeEnum.JoinTypeEnum.RIGHT_OUTER:
-                            raise NotImplementedError("Not implemented support to right join (consider reversing the tables and using left join).")
-
-                        case JoinTypeEnum.JoinTypeEnum.FULL_OUTER:
-                            query = query.outerjoin(
-                                models[join.right_table_name],
-                                clause(models[join.left_table_name], models[join.right_table_name]),
-                                full = True
-                            )
-
-                        case JoinTypeEnum.JoinTypeEnum.CROSS:
-                            raise NotImplementedError("Not implemented support to cross join.")
-
-                # Apply column selection
-                if columns:
-                    selected_columns: typing.List[sqlalchemy.Column] = []
-                    for table_column_name in columns:
-                        table, column_name = self.parse_column_name(table_column_name)
-                        target: typing.Type[BaseModel.BaseModel] = models.get(table, model)
-                        column: typing.Optional[sqlalchemy.orm.InstrumentedAttribute] = getattr(target, column_name, None)
-                        if not column:
-                            raise ValueError(f"Invalid selection column \"{column_name}\" for table \"{target.__tablename__}\" was given.")
-
-                        selected_columns.append(column)
-
-                    string_schema: typing.List[str] = [f"{column.table.name}.{column.name}" for column in selected_columns]
-                    query = session.query(*selected_columns).select_from(query.subquery())
-
-                else:
-                    string_schema: typing.List[str] = [f"{column.table.name}.{column.name}" for column in schema]
-
-                # Apply conditions
-                if conditions:
-                    for table_column_name, clause in conditions.items():
-                        table, column_name = self.parse_column_name(table_column_name)
-                        target: typing.Type[BaseModel.BaseModel] = models.get(table, model)
-                        column: typing.Optional[sqlalchemy.orm.InstrumentedAttribute] = getattr(target, column_name, None)
-                        if not column:
-                            raise ValueError(f"Invalid condition column \"{column_name}\" for table \"{target.__tablename__}\" was given.")
-                        query = query.filter(clause(column))
-
-                # Apply option distinct
-                if distinct:
-                    query = query.distinct()
-
-                # Apply option limit
-                if limit:
-                    if limit < 0:
-                        raise ValueError("Limit must be a positive integer.")
-                    query = query.limit(limit)
-
-                # Apply option offset
-                if offset:
-                    if offset < 0:
-                        raise ValueError("Offset must be a non-negative integer.")
-                    query = query.offset(offset)
-
-                # Apply option order By
-                if order_by:
-                    for column_name, column_ordination in order_by.items():
-                        table, column_name = self.parse_column_name(table_column_name)
-                        target: typing.Type[BaseModel.BaseModel] = models.get(table, model)
-                        column: typing.Optional[sqlalchemy.orm.InstrumentedAttribute] = getattr(target, column_name, None)
-                        if not column:
-                            raise ValueError(f"Invalid order_by column \"{column_name}\" for table \"{target.__tablename__}\".")
-                        query = query.order_by(getattr(column, column_ordination)())
-
-                # Apply option group By
-                if group_by:
-                    group_columns: typing.List[typing.Optional[sqlalchemy.orm.InstrumentedAttribute]] = []
-                    for column_name in group_by:
-                        table, column_name = self.parse_column_name(table_column_name)
-                        target: typing.Type[BaseModel.BaseModel] = models.get(table, model)
-                        column: typing.Optional[sqlalchemy.orm.InstrumentedAttribute] = getattr(target, column_name, None)
-                        if not column:
-                            raise ValueError(f"Invalid group_by column \"{column_name}\" for table \"{model.__tablename__}\".")
-                        group_columns.append(column)
-                    query = query.group_by(*group_columns)
-
-                fetched: typing.List[sqlalchemy.Row] = query.all()
-
-                return polars.DataFrame([dict(zip(string_schema, instance)) for instance in fetched], schema = string_schema)
+                query, schema = self.__build_query(
+                    session,
+                    table_name,
+                    columns = columns,
+                    distinct = distinct,
+                    limit = limit,
+                    offset = offset,
+                    order_by = order_by,
+                    group_by = group_by,
+                    joins = joins,
+                    conditions = conditions
+                )
+
+                string_schema: typing.Dict[str, polars.DataType] = {column_name: Database.get_polars_type(column) for column_name, column in schema.items()}
+
+                # Fetch temporal values raw on SQLite to parse them as whole columns
+                raw_column_names: typing.Set[str] = {column_name for column_name, dtype in string_schema.items() if dtype.is_temporal()} if self.__engine.dialect.name == "sqlite" else set()
+                raw_schema: typing.Dict[str, polars.DataType] = {column_name: polars.String() if column_name in raw_column_names else dtype for column_name, dtype in string_schema.items()}
+                query = query.with_entities(*[
+                    sqlalchemy.type_coerce(column, sqlalchemy.String) if column_name in raw_column_names else column
+                    for column_name, column in schema.items()
+                ])
+                parsers: typing.List[polars.Expr] = [
+                    polars.col(column_name).str.to_date("%Y-%m-%d") if string_schema[column_name] == polars.Date else polars.col(column_name).str.to_datetime("%Y-%m-%d %H:%M:%S%.f", time_unit = "us")
+                    for column_name in raw_column_names
+                ]
+
+                # Stream rows through a server side cursor (when supported) building columns by batches
+                result: sqlalchemy.CursorResult = session.connection().execute(query.statement.execution_options(yield_per = batch_size))
+                has_rows: bool = False
+                for batch in result.partitions():
+                    has_rows = True
+                    yield polars.DataFrame(list(zip(*batch)), schema = raw_schema, orient = "col").with_columns(parsers)
+
+                # Keep the schema on empty results
+                if not has_rows:
+                    yield polars.DataFrame(schema = string_schema)
 
             except Exception as e:
                 session.rollback()
@@ -252,10 +406,133 @@ class Database():
                 session.close()
 
 
+    def __build_query(
+            self,
+            session: sqlalchemy.orm.Session,
+            table_name: typing.Type[BaseModel.BaseModel] | str,
+            columns: typing.Iterable[str],
+            distinct: bool,
+            limit: int,
+            offset: int,
+            order_by: typing.Dict[str, ColumnOrdinationEnum.ColumnOrdinationEnum],
+            group_by: typing.Iterable[str],
+            joins: typing.Iterable[Join.Join],
+            conditions: typing.Dict[str, typing.Callable[[sqlalchemy.orm.InstrumentedAttribute], sqlalchemy.ClauseElement]]
+        ) -> typing.Tuple[sqlalchemy.orm.Query, typing.Dict[str, sqlalchemy.ColumnElement]]:
+        model: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model(table_name) if isinstance(table_name, str) else table_name
+        models: typing.Dict[str, typing.Type[BaseModel.BaseModel]] = {}
+        models[model.__tablename__] = model
+        for join in joins:
+            if not join.left_table_name in models:
+                models[join.left_table_name] = BaseModel.BaseModel.get_model(join.left_table_name)
+            if not join.right_table_name in models:
+                models[join.right_table_name] = BaseModel.BaseModel.get_model(join.right_table_name)
+
+        schema: typing.Dict[str, sqlalchemy.ColumnElement] = {f"{column.table.name}.{column.name}": column for model in models.values() for column in model.__table__.columns}
+        query: sqlalchemy.orm.Query = session.query(*schema.values())
+
+        # Apply joins
+        for join in joins:
+            clause: typing.Callable[[BaseModel.BaseModel, BaseModel.BaseModel], sqlalchemy.ClauseElement] = join.clause
+            join_type: JoinTypeEnum.JoinTypeEnum = join.type
+
+            match(join_type):
+                case JoinTypeEnum.JoinTypeEnum.INNER:
+                    query = query.join(
+                        models[join.right_table_name],
+                        clause(models[join.left_table_name], models[join.right_table_name]),
+                        isouter = False,
+                        full = False
+                    )
+
+                case JoinTypeEnum.JoinTypeEnum.LEFT_OUTER:
+                    query = query.outerjoin(
+                        models[join.right_table_name],
+                        clause(models[join.left_table_name], models[join.right_table_name]),
+                        full = False
+                    )
+
+                case JoinTypeEnum.JoinTypeEnum.RIGHT_OUTER:
+                    raise NotImplementedError("Not implemented support to right join (consider reversing the tables and using left join).")
+
+                case JoinTypeEnum.JoinTypeEnum.FULL_OUTER:
+                    query = query.outerjoin(
+                        models[join.right_table_name],
+                        clause(models[join.left_table_name], models[join.right_table_name]),
+                        full = True
+                    )
+
+                case JoinTypeEnum.JoinTypeEnum.CROSS:
+                    raise NotImplementedError("Not implemented support to cross join.")
+
+        # Apply column selection (columns or SQL expressions of hybrid properties)
+        if columns:
+            schema = {}
+            for table_column_name in columns:
+                table, column_name = self.parse_column_name(table_column_name)
+                target: typing.Type[BaseModel.BaseModel] = models.get(table, model)
+                column: typing.Optional[sqlalchemy.orm.QueryableAttribute] = getattr(target, column_name, None)
+                if column is None:
+                    raise ValueError(f"Invalid selection column \"{column_name}\" for table \"{target.__tablename__}\" was given.")
+
+                schema[f"{target.__tablename__}.{column_name}"] = column.expression
+
+        # Apply conditions
+        if conditions:
+            for table_column_name, clause in conditions.items():
+                table, column_name = self.parse_column_name(table_column_name)
+                target: typing.Type[BaseModel.BaseModel] = models.get(table, model)
+                column: typing.Optional[sqlalchemy.orm.QueryableAttribute] = getattr(target, column_name, None)
+                if column is None:
+                    raise ValueError(f"Invalid condition column \"{column_name}\" for table \"{target.__tablename__}\" was given.")
+                query = query.filter(clause(column))
+
+        # Apply option distinct
+        if distinct:
+            query = query.distinct()
+
+        # Apply option order By
+        if order_by:
+            for table_column_name, column_ordination in order_by.items():
+                table, column_name = self.parse_column_name(table_column_name)
+                target: typing.Type[BaseModel.BaseModel] = models.get(table, model)
+                column: typing.Optional[sqlalchemy.orm.QueryableAttribute] = getattr(target, column_name, None)
+                if column is None:
+                    raise ValueError(f"Invalid order_by column \"{column_name}\" for table \"{target.__tablename__}\".")
+                query = query.order_by(getattr(column, column_ordination)())
+
+        # Apply option group By
+        if group_by:
+            group_columns: typing.List[sqlalchemy.orm.QueryableAttribute] = []
+            for table_column_name in group_by:
+                table, column_name = self.parse_column_name(table_column_name)
+                target: typing.Type[BaseModel.BaseModel] = models.get(table, model)
+                column: typing.Optional[sqlalchemy.orm.QueryableAttribute] = getattr(target, column_name, None)
+                if column is None:
+                    raise ValueError(f"Invalid group_by column \"{column_name}\" for table \"{model.__tablename__}\".")
+                group_columns.append(column)
+            query = query.group_by(*group_columns)
+
+        # Apply option limit
+        if limit:
+            if limit < 0:
+                raise ValueError("Limit must be a positive integer.")
+            query = query.limit(limit)
+
+        # Apply option offset
+        if offset:
+            if offset < 0:
+                raise ValueError("Offset must be a non-negative integer.")
+            query = query.offset(offset)
+
+        return (query, schema)
+
+
     def update(
             self,
             table_name: typing.Type[BaseModel.BaseModel] | str,
             data: typing.Dict[str, typing.Any],
+            should_trigger_listeners: typing.Optional[bool] = None,
             **conditions: typing.Callable[[sqlalchemy.orm.InstrumentedAttribute], sqlalchemy.ClauseElement]
         ) -> int:
         if not self.has_table(table_name):
@@ -267,22 +544,33 @@ class Database():
         with self.__sessionmaker() as session:
             try:
                 model: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model(table_name) if isinstance(table_name, str) else table_name
-                query: sqlalchemy.orm.Query = session.query(model)
+                clauses: typing.List[sqlalchemy.ClauseElement] = self.__build_clauses(model, conditions)
+
+                # Columns read by listeners are only updated through them (by default any other column skips them)
+                listened_column_names: typing.AbstractSet[str] = ModelsConfig.LISTENED_COLUMNS.get(model.__tablename__, frozenset()) & data.keys()
+                if should_trigger_listeners is None:
+                    should_trigger_listeners = bool(listened_column_names)
+                elif not should_trigger_listeners and listened_column_names:
+                    raise ValueError(f"Not able to update listened columns of table \"{model.__tablename__}\" skipping listeners: {', '.join(sorted(listened_column_names))}.")
 
-                if conditions:
-                    for column_name, clause in conditions.items():
-                        column = getattr(model, column_name, None)
-                        if not column:
-                            raise ValueError(f"Invalid column name \"{column_name}\" for table \"{model.__tablename__}\" was given.")
-                        query = query.filter(clause(column))
+                # Single UPDATE statement skipping ORM listeners
+                if not should_trigger_listeners:
+                    result: sqlalchemy.CursorResult = session.execute(
+                        sqlalchemy.update(model.__table__).where(*clauses).values(data)
+                    )
+                    session.commit()
+                    self.__invalidate_read_cache(model.__tablename__)
 
-                fetched: typing.List[BaseModel.BaseModel] = query.all()
+                    return result.rowcount
+
+                fetched: typing.List[BaseModel.BaseModel] = session.query(model).filter(*clauses).all()
 
                 for instance in fetched:
                     for key, value in data.items():
                         setattr(instance, key, value)
 
                 session.commit()
+                self.__invalidate_read_cache(model.__tablename__)
 
                 return len(fetched)
 
@@ -294,9 +582,57 @@ class Database():
                 session.close()
 
 
+    def update_rows(
+            self,
+            table_name: typing.Type[BaseModel.BaseModel] | str,
+            data: polars.DataFrame
+        ) -> int:
+        if not self.has_table(table_name):
+            raise Exception("Table name not found on schema tables.")
+
+        with self.__sessionmaker() as session:
+            try:
+                model: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model(table_name) if isinstance(table_name, str) else table_name
+                primary_key: sqlalchemy.Column = model.__table__.primary_key.columns[0]
+
+                if not primary_key.name in data.columns:
+                    raise Exception("Missing primary key column to update table.")
+
+                # Columns read by listeners are only updated through them
+                listened_column_names: typing.AbstractSet[str] = ModelsConfig.LISTENED_COLUMNS.get(model.__tablename__, frozenset()) & (set(data.columns) - {primary_key.name})
+                if listened_column_names:
+                    raise ValueError(f"Not able to update listened columns of table \"{model.__tablename__}\" by rows: {', '.join(sorted(listened_column_names))}.")
+
+                if data.is_empty():
+                    return 0
+
+                # Core executemany UPDATE by primary key skipping ORM listeners (values must be already computed)
+                key_name: str = f"_{primary_key.name}"
+                result: sqlalchemy.CursorResult = session.execute(
+                    sqlalchemy.update(model.__table__).where(
+                        primary_key == sqlalchemy.bindparam(key_name)
+                    ).values(
+                        {column_name: sqlalchemy.bindparam(column_name) for column_name in data.columns if column_name != primary_key.name}
+                    ),
+                    data.rename({primary_key.name: key_name}).to_dicts()
+                )
+                session.commit()
+                self.__invalidate_read_cache(model.__tablename__)
+
+                return result.rowcount
+
+            except Exception as e:
+                session.rollback()
+                raise Exception(f"Failed to update records: {e}")
+
+            finally:
+                session.close()
+
+
     def delete(
             self,
             table_name: typing.Type[BaseModel.BaseModel] | str,
+            should_trigger_listeners: typing.Optional[bool] = None,
             **conditions: typing.Callable[[sqlalchemy.orm.InstrumentedAttribute], sqlalchemy.ClauseElement]
         ) -> int:
         if not self.has_table(table_name):
@@ -305,21 +641,33 @@ class Database():
         with self.__sessionmaker() as session:
             try:
                 model: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model(table_name) if isinstance(table_name, str) else table_name
-                query: sqlalchemy.orm.Query = session.query(model)
+                clauses: typing.List[sqlalchemy.ClauseElement] = self.__build_clauses(model, conditions)
 
-                if conditions:
-                    for column_name, clause in conditions.items():
-                        column = getattr(model, column_name, None)
-                        if not column:
-                            raise ValueError(f"Invalid column name \"{column_name}\" for table \"{model.__tablename__}\" was given.")
-                        query = query.filter(clause(column))
+                # Deletes cascading to or recomputing other rows are only done through listeners (by default any other delete skips them)
+                is_listened: bool = model.__tablename__ in ModelsConfig.LISTENED_DELETE_TABLES
+                if should_trigger_listeners is None:
+                    should_trigger_listeners = is_listened
+                elif not should_trigger_listeners and is_listened:
+                    raise ValueError(f"Not able to delete records of table \"{model.__tablename__}\" skipping listeners.")
 
-                fetched: typing.List[BaseModel.BaseModel] = query.all()
+                # Single DELETE statement skipping ORM listeners (deleted rows leave their daily totals first)
+                if not should_trigger_listeners:
+                    ModelsConfig.ModelsConfig.track_deleted_rows(session.connection(), model, clauses)
+                    result: sqlalchemy.CursorResult = session.execute(
+                        sqlalchemy.delete(model.__table__).where(*clauses)
+                    )
+                    session.commit()
+                    self.__invalidate_read_cache(model.__tablename__)
+
+                    return result.rowcount
+
+                fetched: typing.List[BaseModel.BaseModel] = session.query(model).filter(*clauses).all()
 
                 for instance in fetched:
                     session.delete(instance)
 
                 session.commit()
+                self.__invalidate_read_cache(model.__tablename__)
 
                 return len(fetched)
 
@@ -331,6 +679,68 @@ class Database():
                 session.close()
 
 
+    def __invalidate_read_cache(
+            self,
+            table_name: str
+        ) -> None:
+        for key in [key for key, (table_names, _) in self.__read_cache.items() if table_name in table_names]:
+            self.__read_cache_size -= self.__read_cache.pop(key)[1].estimated_size()
+
+        # Listeners also keep the reference tables in memory
+        if BaseModel.BaseModel.get_model(table_name).__cacheable__:
+            ModelsConfig.ModelsConfig.invalidate_references()
+
+
+    def __build_clauses(
+            self,
+            model: typing.Type[BaseModel.BaseModel],
+            conditions: typing.Dict[str, typing.Callable[[sqlalchemy.orm.InstrumentedAttribute], sqlalchemy.ClauseElement]]
+        ) -> typing.List[sqlalchemy.ClauseElement]:
+        clauses: typing.List[sqlalchemy.ClauseElement] = []
+
+        for column_name, clause in conditions.items():
+            column: typing.Optional[sqlalchemy.orm.QueryableAttribute] = getattr(model, column_name, None)
+            if column is None:
+                raise ValueError(f"Invalid column name \"{column_name}\" for table \"{model.__tablename__}\" was given.")
+            clauses.append(clause(column))
+
+        return clauses
+
+
+    def reclassify(
+            self,
+            start_date: typing.Optional[datetime.date] = None,
+            end_date: typing.Optional[datetime.date] = None
+        ) -> typing.Tuple[int, int]:
+        if self.__engine.dialect.name != "sqlite":
+            raise NotImplementedError("Not implemented support to reclassify on dialects other than SQLite.")
+
+        with self.__sessionmaker() as session:
+            try:
+                # Set-based updates of every affected row skipping ORM listeners
+                connection: sqlalchemy.Connection = session.connection()
+                finishers_count: int = ModelsConfig.ModelsConfig.reclassify_finishers(connection, start_date, end_date)
+                statement_entries_count: int = ModelsConfig.ModelsConfig.reclassify_statement_entries(connection, start_date, end_date)
+                session.commit()
+                for table_name in ["finisher", "statement_entry", "dirty_date"]:
+                    self.__invalidate_read_cache(table_name)
+
+                return (finishers_count, statement_entries_count)
+
+            except Exception as e:
+                session.rollback()
+                raise Exception(f"Failed to reclassify records: {e}")
+
+            finally:
+                session.close()
+
+
+    def wait_recomputes(
+            self
+        ) -> None:
+        ModelsConfig.ModelsConfig.wait_deferred_recomputes(self.__engine)
+
+
     def has_table(
             self,
             table_name: BaseModel.BaseModel | str
@@ -389,9 +799,9 @@ class Database():
             if columns_to_create and can_fill:
                 try:
                     for column_name in columns_to_create:
-                        column: sqlalchemy.orm.InstrumentedAttribute = self.__orm_metadata.tables[table_name].c[column_name]
-                        with self.__engine.connect() as conn:
-                            conn.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column.type};")
+                        column: sqlalchemy.Column = self.__orm_metadata.tables[table_name].c[column_name]
+                        with self.__engine.begin() as conn:
+                            conn.execute(sqlalchemy.text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column.type.compile(dialect = self.__engine.dialect)};"))
                 except Exception as e:
                     raise Exception(f"Failed to create columns in table \"{table_name}\": {str(e)}")
 
@@ -403,11 +813,70 @@ class Database():
             if columns_to_purge and can_purge:
                 try:
                     for column_name in columns_to_purge:
-                        with self.__engine.connect() as conn:
-                            conn.execute(f"ALTER TABLE {table_name} DROP COLUMN {column_name};")
+                        with self.__engine.begin() as conn:
+                            conn.execute(sqlalchemy.text(f"ALTER TABLE {table_name} DROP COLUMN {column_name};"))
                 except Exception as e:
                     raise Exception(f"Failed to purge columns in table \"{table_name}\": {str(e)}")
 
+            # Handle relaxing of columns no longer required
+            db_required_columns: typing.List[str] = [col["name"] for col in self.__inspector.get_columns(table_name) if not col["nullable"]]
+            columns_to_relax: typing.List[str] = [col for col in db_required_columns if col in orm_columns and self.__orm_metadata.tables[table_name].c[col].nullable]
+            if columns_to_relax and not can_fill and should_raise_permission_errors:
+                raise PermissionError(f"Not able to relax required columns in table \"{table_name}\" (\"fill\" permission not granted): {', '.join(columns_to_relax)}.")
+
+            if columns_to_relax and can_fill:
+                try:
+                    self.__relax_columns(table_name, columns_to_relax)
+                except Exception as e:
+                    raise Exception(f"Failed to relax columns in table \"{table_name}\": {str(e)}")
+
+            # Handle index creation
+            db_indexes: typing.List[str] = [index["name"] for index in self.__inspector.get_indexes(table_name)]
+            indexes_to_create: typing.List[sqlalchemy.Index] = [index for index in self.__orm_metadata.tables[table_name].indexes if index.name not in db_indexes]
+            if indexes_to_create and not can_fill and should_raise_permission_errors:
+                raise PermissionError(f"Not able to create missing indexes in table \"{table_name}\" (\"fill\" permission not granted): {', '.join(index.name for index in indexes_to_create)}.")
+
+            if indexes_to_create and can_fill:
+                try:
+                    for index in indexes_to_create:
+                        index.create(self.__engine)
+                except Exception as e:
+                    raise Exception(f"Failed to create indexes in table \"{table_name}\": {str(e)}")
+
+
+    def __relax_columns(
+            self,
+            table_name: str,
+            column_names: typing.List[str]
+        ) -> None:
+        orm_table: sqlalchemy.Table = self.__orm_metadata.tables[table_name]
+
+        with self.__engine.begin() as conn:
+            if self.__engine.dialect.name != "sqlite":
+                for column_name in column_names:
+                    conn.execute(sqlalchemy.text(f"ALTER TABLE {table_name} ALTER COLUMN {column_name} DROP NOT NULL;"))
+                return
+
+            # SQLite can not alter columns (rebuild table from the ORM schema, indexes are recreated by sync)
+            db_columns: typing.List[str] = [col["name"] for col in sqlalchemy.inspect(conn).get_columns(table_name)]
+            extra_columns: typing.List[str] = [col for col in db_columns if col not in orm_table.c]
+            if extra_columns:
+                raise Exception(f"Not able to rebuild table with extra columns (\"purge\" permission required): {', '.join(extra_columns)}.")
+
+            # Copy the schema aside (foreign keys of the new table must resolve)
+            metadata: sqlalchemy.MetaData = sqlalchemy.MetaData()
+            for table in self.__orm_metadata.sorted_tables:
+                table.to_metadata(metadata)
+
+            new_table_name: str = f"_new_{table_name}"
+            columns: str = ", ".join(db_columns)
+            conn.execute(sqlalchemy.schema.CreateTable(orm_table.to_metadata(metadata, name = new_table_name)))
+            conn.execute(sqlalchemy.text(f"INSERT INTO {new_table_name} ({columns}) SELECT {columns} FROM {table_name};"))
+            conn.execute(sqlalchemy.text(f"DROP TABLE {table_name};"))
+            conn.execute(sqlalchemy.text(f"ALTER TABLE {new_table_name} RENAME TO {table_name};"))
+
+        self.__inspector.clear_cache()
+
 
     def __init_logger(
             self,
@@ -1,22 +1,61 @@
 import datetime
-import holidays
-import math
+import functools
 import pathlib
-import re
-import holidays.countries
+import polars
 import sqlalchemy
+import sqlalchemy.dialects.postgresql
+import sqlalchemy.dialects.sqlite
 import sqlalchemy.orm
+import threading
+import time
 import typeguard
 import typing
 
+from ..classifiers import FinisherClassifier, StatementEntryClassifier
 from ..loaders import InsertionsLoader
 from . import BaseModel
-from .models import Finisher, FinisherPattern, Rate, Report, StatementEntry, StatementEntryPattern, Type
+from .models import DailyTotal, DirtyDate, Finisher, FinisherPattern, Rate, Report, Statement, StatementEntry, StatementEntryPattern, Type
+
+
+# Numeric predicates equivalent to the value patterns of the rows inserted before they existed
+LEGACY_VALUE_PATTERNS: typing.Dict[str, typing.Dict[str, int]] = {
+    r"^\d+$": {"min_value": 0},
+    r"^-\d+$": {"max_value": -1}
+}
+
+# Columns read by the listeners of each table (Core updates of them would leave dependent values stale)
+LISTENED_COLUMNS: typing.Dict[str, typing.FrozenSet[str]] = {
+    "report": frozenset(["id", "start_time", "shift"]),
+    "finisher": frozenset(["id", "report_id", "type_id", "name", "value", "payment_date", "payment_value"]),
+    "statement": frozenset(["id", "date"]),
+    "statement_entry": frozenset(["id", "statement_id", "type_id", "name", "value"]),
+    "rate": frozenset(["id", "type_id", "rate", "start_time"])
+}
+
+# Finishers recomputed by each statement after a flush
+RECOMPUTE_BATCH_SIZE = 10_000
+
+# Attempts of a deferred recompute while another connection holds the SQLite write lock
+RECOMPUTE_ATTEMPTS = 5
+RECOMPUTE_RETRY_DELAY = 0.5
+
+# Tables whose deletes cascade to other rows or recompute them through the listeners
+LISTENED_DELETE_TABLES: typing.FrozenSet[str] = frozenset(["report", "statement", "rate"])
 
 
 @typeguard.typechecked
 class ModelsConfig():
 
+    # Reference data used by the listeners (loaded once per engine until changed)
+    __references_engine: typing.Optional[sqlalchemy.Engine] = None
+    __finisher_classifier: typing.Optional[FinisherClassifier.FinisherClassifier] = None
+    __statement_entry_classifier: typing.Optional[StatementEntryClassifier.StatementEntryClassifier] = None
+
+    # Payment value recomputes of changed rates deferred after commit (pending ones are kept by each session)
+    __recompute_threads: typing.Dict[sqlalchemy.Engine, typing.List[threading.Thread]] = {}
+    __recompute_errors: typing.Dict[sqlalchemy.Engine, typing.List[Exception]] = {}
+
+
     @staticmethod
     def setup_models(
             session: sqlalchemy.orm.Session,
@@ -24,6 +63,18 @@ class ModelsConfig():
         ) -> None:
         loader: InsertionsLoader.InsertionsLoader = InsertionsLoader.InsertionsLoader()
 
+        # Reference rows are only inserted by this session
+        session.info["is_setup"] = True
+
+        # Fill the numeric predicates of legacy value patterns (rows then match the insertions again)
+        for value_pattern, predicates in LEGACY_VALUE_PATTERNS.items():
+            session.execute(
+                sqlalchemy.update(StatementEntryPattern.StatementEntryPattern).where(
+                    StatementEntryPattern.StatementEntryPattern.value_pattern == value_pattern,
+                    *[getattr(StatementEntryPattern.StatementEntryPattern, predicate).is_(None) for predicate in ["sign", "min_value", "max_value", "value"]]
+                ).values(predicates)
+            )
+
         # Insert all instances not already in database
         for table_name, dataframe in loader.process_file(insertions_path).items():
             model: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model(table_name)
@@ -60,15 +111,34 @@ class ModelsConfig():
     def activate_listeners() -> None:
         # Register event listeners
         sqlalchemy.event.listen(sqlalchemy.orm.Session, "before_flush", ModelsConfig.block_inserts)
+        sqlalchemy.event.listen(sqlalchemy.orm.Session, "after_commit", ModelsConfig.run_deferred_recomputes)
+        sqlalchemy.event.listen(sqlalchemy.orm.Session, "after_rollback", ModelsConfig.discard_deferred_recomputes)
+
+        # Daily totals drop stored rows before any change and add them back after it (registered before the listeners changing them)
+        for model in [Report.Report, Finisher.Finisher, Statement.Statement, StatementEntry.StatementEntry]:
+            for event_name in ["before_update", "before_delete"]:
+                sqlalchemy.event.listen(model, event_name, ModelsConfig.listener_totals_before_change)
+            for event_name in ["after_insert", "after_update"]:
+                sqlalchemy.event.listen(model, event_name, ModelsConfig.listener_totals_after_change)
 
         for event_name in ["before_insert", "before_update"]:
             sqlalchemy.event.listen(Report.Report, event_name, ModelsConfig.listener_report_on_change)
             sqlalchemy.event.listen(Finisher.Finisher, event_name, ModelsConfig.listener_report_finisher_on_change)
+            sqlalchemy.event.listen(StatementEntry.StatementEntry, event_name, ModelsConfig.listener_statement_entry_on_change)
 
+        # Payment values of changed finishers and reports recompute through the table after the flush
+        for event_name in ["after_insert", "after_update"]:
+            sqlalchemy.event.listen(Finisher.Finisher, event_name, ModelsConfig.listener_payment_finisher_on_change)
+        sqlalchemy.event.listen(Report.Report, "after_update", ModelsConfig.listener_payment_report_on_change)
+        sqlalchemy.event.listen(sqlalchemy.orm.Session, "after_flush_postexec", ModelsConfig.recompute_flushed_payment_values)
+
+        # Rates recompute through the table after being written
+        for event_name in ["after_insert", "after_update", "after_delete"]:
             sqlalchemy.event.listen(Rate.Rate, event_name, ModelsConfig.listener_rate_on_change)
-            sqlalchemy.event.listen(Finisher.Finisher, event_name, ModelsConfig.listener_rate_finisher_on_change)
 
-            sqlalchemy.event.listen(StatementEntry.StatementEntry, event_name, ModelsConfig.listener_statement_entry_on_change)
+        for event_name in ["after_insert", "after_update", "after_delete"]:
+            for model in [Type.Type, FinisherPattern.FinisherPattern, StatementEntryPattern.StatementEntryPattern, Rate.Rate]:
+                sqlalchemy.event.listen(model, event_name, ModelsConfig.listener_references_on_change)
 
 
     @staticmethod
@@ -77,6 +147,9 @@ class ModelsConfig():
             flush_context: sqlalchemy.orm.unitofwork.UOWTransaction,
             instances: typing.Any
         ) -> None:
+        if session.info.get("is_setup"):
+            return
+
         for obj in session.new:
             if isinstance(obj, (Type.Type, FinisherPattern.FinisherPattern, StatementEntryPattern.StatementEntryPattern)):
                 raise Exception(f"Inserts are not allowed for \"{getattr(obj.__class__, '__tablename__')}\".")
@@ -110,11 +183,8 @@ class ModelsConfig():
         if "parent_target" in kwargs:
             report = kwargs["parent_target"]
         else:
-            result: typing.Optional[Report.Report] = session.query(
-                Report.Report
-            ).where(
-                Report.Report.id == target.report_id
-            ).first()
+            # Reports already in the session are not queried again
+            result: typing.Optional[Report.Report] = session.get(Report.Report, target.report_id)
 
             if not result:
                 raise Exception("Unable to recover \"report\" values through \"report_id\".")
@@ -124,27 +194,20 @@ class ModelsConfig():
         report_date: datetime.date = report.start_time.date()
         report_shift: int = report.shift
 
-        finisher_patterns: typing.List[FinisherPattern.FinisherPattern] = sqlalchemy.orm.Session(
-            bind = connection
-        ).query(FinisherPattern.FinisherPattern).all()
+        finisher_classifier: FinisherClassifier.FinisherClassifier = ModelsConfig.get_finisher_classifier(connection)
 
-        type_id: typing.Optional[str] = None
-        payment_date: typing.Optional[datetime.date] = None
-        for finisher_pattern in finisher_patterns:
-            if re.match(finisher_pattern.pattern, target.name):
-                type_id = finisher_pattern.type_id
-                if finisher_pattern.payment_interval is not None:
-                    payment_date = report_date + datetime.timedelta(days = finisher_pattern.payment_interval)
+        type_id: typing.Optional[str]
+        payment_interval: typing.Optional[int]
+        type_id, payment_interval = finisher_classifier.classify_name(target.name)
+        payment_date: typing.Optional[datetime.date] = report_date + datetime.timedelta(days = payment_interval) if payment_interval is not None else None
 
         # "cash" exception
         if type_id == "cash":
             payment_date += datetime.timedelta(days = 1 if report_shift > 0 else 0)
 
         # Fix payment day to next business day
-        brazil_holidays: holidays.countries.brazil.BR = holidays.countries.brazil.BR()
         if payment_date:
-            while not brazil_holidays.is_working_day(payment_date):
-                payment_date += datetime.timedelta(days = 1)
+            payment_date = finisher_classifier.next_business_day(payment_date)
 
         key: sqlalchemy.CursorResult = connection.execute(
             Finisher.Finisher.__table__.update().values(
@@ -167,54 +230,575 @@ class ModelsConfig():
             target: Rate.Rate,
             **kwargs: typing.Any
         ) -> None:
-        if target.type and target.type.finishers:
-            for finisher in target.type.finishers:
-                ModelsConfig.listener_rate_finisher_on_change(mapper, connection, finisher, parent_target = target, **kwargs)
+        # Rate windows starting at current and previous type and start time
+        state: sqlalchemy.orm.InstanceState = sqlalchemy.inspect(target)
+        rate_starts: typing.Set[typing.Tuple[str, datetime.datetime]] = {(target.type_id, target.start_time)}
+        for type_id in state.attrs.type_id.history.deleted or [target.type_id]:
+            for start_time in state.attrs.start_time.history.deleted or [target.start_time]:
+                if type_id is not None and start_time is not None:
+                    rate_starts.add((type_id, start_time))
+
+        # Each window ends at the next rate of the type
+        session: sqlalchemy.orm.Session = sqlalchemy.orm.session.object_session(target)
+        for type_id, start_time in rate_starts:
+            end_time: typing.Optional[datetime.datetime] = connection.execute(
+                sqlalchemy.select(
+                    sqlalchemy.func.min(Rate.Rate.start_time)
+                ).where(
+                    Rate.Rate.type_id == type_id,
+                    Rate.Rate.start_time > start_time
+                )
+            ).scalar()
+
+            if session.info.get("should_defer_recomputes"):
+                session.info.setdefault("pending_recomputes", []).append((type_id, start_time, end_time))
+            else:
+                ModelsConfig.recompute_payment_values(connection, ModelsConfig.build_rate_window(type_id, start_time, end_time))
 
 
     @staticmethod
-    def listener_rate_finisher_on_change(
+    def listener_payment_finisher_on_change(
             mapper: sqlalchemy.orm.Mapper,
             connection: sqlalchemy.Connection,
             target: Finisher.Finisher,
             **kwargs: typing.Any
         ) -> None:
-        if not target.type_id:
+        # Payment values of changed finishers are recomputed together after the flush
+        session: sqlalchemy.orm.Session = sqlalchemy.orm.session.object_session(target)
+        session.info.setdefault("payment_finisher_ids", set()).add(target.id)
+
+
+    @staticmethod
+    def listener_payment_report_on_change(
+            mapper: sqlalchemy.orm.Mapper,
+            connection: sqlalchemy.Connection,
+            target: Report.Report,
+            **kwargs: typing.Any
+        ) -> None:
+        # Rates in effect change with the start time of the report
+        if not sqlalchemy.inspect(target).attrs.start_time.history.has_changes():
             return
 
         session: sqlalchemy.orm.Session = sqlalchemy.orm.session.object_session(target)
+        session.info.setdefault("payment_report_ids", set()).add(target.id)
 
-        rate_rate: float
-        if "parent_target" in kwargs:
-            rate_rate = kwargs["parent_target"].rate
-        else:
-            result: typing.Optional[Rate.Rate] = session.query(
-                Rate.Rate
+
+    @staticmethod
+    def recompute_flushed_payment_values(
+            session: sqlalchemy.orm.Session,
+            flush_context: sqlalchemy.orm.unitofwork.UOWTransaction
+        ) -> None:
+        finisher_ids: typing.Set[int] = session.info.pop("payment_finisher_ids", set())
+        report_ids: typing.Set[int] = session.info.pop("payment_report_ids", set())
+        if not finisher_ids and not report_ids:
+            return
+
+        # Set-based recompute of the flushed finishers by batches of ids
+        connection: sqlalchemy.Connection = session.connection()
+        for column, ids in [(Finisher.Finisher.id, sorted(finisher_ids)), (Finisher.Finisher.report_id, sorted(report_ids))]:
+            for index in range(0, len(ids), RECOMPUTE_BATCH_SIZE):
+                ModelsConfig.recompute_payment_values(connection, [column.in_(ids[index:index + RECOMPUTE_BATCH_SIZE])])
+
+        # Loaded finishers read their recomputed payment values again
+        for instance in list(session.identity_map.values()):
+            if isinstance(instance, Finisher.Finisher) and (instance.id in finisher_ids or instance.report_id in report_ids):
+                session.expire(instance, ["payment_value"])
+
+
+    @staticmethod
+    def recompute_payment_values(
+            connection: sqlalchemy.Connection,
+            conditions: typing.List[sqlalchemy.ColumnElement]
+        ) -> None:
+        # Rate of the type in effect at the report start time (truncated as by the classifier on every dialect, unclassified finishers have no payment value)
+        rate_rate: sqlalchemy.ScalarSelect = sqlalchemy.select(
+            Rate.Rate.rate
+        ).where(
+            Rate.Rate.type_id == Finisher.Finisher.type_id,
+            Rate.Rate.start_time <= ModelsConfig.get_report_start_time()
+        ).order_by(
+            Rate.Rate.start_time.desc()
+        ).limit(1).scalar_subquery()
+        payment_value: sqlalchemy.ColumnElement = sqlalchemy.case(
+            (Finisher.Finisher.type_id.is_(None), None),
+            else_ = sqlalchemy.cast(sqlalchemy.func.trunc(Finisher.Finisher.value * (1 - sqlalchemy.func.coalesce(rate_rate, 0))), sqlalchemy.Integer)
+        )
+
+        # Keep daily totals of the dates and types (marked as changed)
+        ModelsConfig.track_finishers(connection, conditions, -1)
+        connection.execute(
+            Finisher.Finisher.__table__.update().values(
+                payment_value = payment_value
             ).where(
-                Rate.Rate.type_id == target.type_id
+                *conditions
+            )
+        )
+        ModelsConfig.track_finishers(connection, conditions, 1)
+
+
+    @staticmethod
+    def build_rate_window(
+            type_id: str,
+            start_time: datetime.datetime,
+            end_time: typing.Optional[datetime.datetime] = None
+        ) -> typing.List[sqlalchemy.ColumnElement]:
+        # Finishers of the type with reports started inside the window of a rate
+        conditions: typing.List[sqlalchemy.ColumnElement] = [
+            Finisher.Finisher.type_id == type_id,
+            ModelsConfig.get_report_start_time() >= start_time,
+        ]
+        if end_time is not None:
+            conditions.append(ModelsConfig.get_report_start_time() < end_time)
+
+        return conditions
+
+
+    @staticmethod
+    def get_report_start_time() -> sqlalchemy.ScalarSelect:
+        return sqlalchemy.select(
+            Report.Report.start_time
+        ).where(
+            Report.Report.id == Finisher.Finisher.report_id
+        ).correlate(
+            Finisher.Finisher
+        ).scalar_subquery()
+
+
+    @staticmethod
+    def reclassify_finishers(
+            connection: sqlalchemy.Connection,
+            start_date: typing.Optional[datetime.date] = None,
+            end_date: typing.Optional[datetime.date] = None
+        ) -> int:
+        finisher_classifier: FinisherClassifier.FinisherClassifier = ModelsConfig.get_finisher_classifier(connection)
+        finisher_patterns: typing.Sequence[sqlalchemy.Row] = connection.execute(
+            sqlalchemy.select(
+                FinisherPattern.FinisherPattern.pattern,
+                FinisherPattern.FinisherPattern.type_id,
+                FinisherPattern.FinisherPattern.payment_interval
             ).order_by(
-                Rate.Rate.start_time.desc()
-            ).first()
+                FinisherPattern.FinisherPattern.id
+            )
+        ).all()
 
-            if result:
-                rate_rate = result.rate
-            else:
-                rate_rate = 0
+        # Fix payment dates through the calendar of the classifier (dates repeat heavily)
+        connection.connection.driver_connection.create_function(
+            "next_business_day",
+            1,
+            functools.lru_cache(maxsize = None)(
+                lambda date: finisher_classifier.next_business_day(datetime.date.fromisoformat(date)).isoformat() if date else None
+            ),
+            deterministic = True
+        )
 
-        payment_value: int = math.trunc((target.value / 100) * (1 - rate_rate) * 100)
+        # Finishers with reports started inside the dates (joined to reports inside the update)
+        report_start_time: sqlalchemy.ScalarSelect = ModelsConfig.get_report_start_time()
+        start_time: datetime.datetime = datetime.datetime.combine(start_date or datetime.date.min, datetime.time.min)
+        end_time: typing.Optional[datetime.datetime] = datetime.datetime.combine(end_date + datetime.timedelta(days = 1), datetime.time.min) if end_date else None
+        conditions: typing.List[sqlalchemy.ColumnElement] = [report_start_time >= start_time]
+        report_conditions: typing.List[sqlalchemy.ColumnElement] = [Report.Report.id == Finisher.Finisher.report_id, Report.Report.start_time >= start_time]
+        if end_time is not None:
+            conditions.append(report_start_time < end_time)
+            report_conditions.append(Report.Report.start_time < end_time)
+
+        # Classify each distinct name only once (distinct keeps SQLite from flattening cases into every row, and the last matching pattern wins as the first case of the reversed patterns)
+        names: sqlalchemy.Subquery = sqlalchemy.select(Finisher.Finisher.name).distinct().subquery()
+        classified_names: sqlalchemy.Subquery = sqlalchemy.select(
+            names.c.name,
+            ModelsConfig.build_case(
+                [(sqlalchemy.func.match_pattern(pattern, names.c.name), pattern_type_id) for pattern, pattern_type_id, _ in reversed(finisher_patterns)]
+            ).label("type_id"),
+            ModelsConfig.build_case(
+                [(sqlalchemy.func.match_pattern(pattern, names.c.name), pattern_payment_interval) for pattern, _, pattern_payment_interval in reversed(finisher_patterns) if pattern_payment_interval is not None]
+            ).label("payment_interval")
+        ).distinct().subquery()
 
-        key: sqlalchemy.CursorResult = connection.execute(
+        # "cash" exception
+        payment_days: sqlalchemy.ColumnElement = classified_names.c.payment_interval + sqlalchemy.case(
+            (sqlalchemy.and_(classified_names.c.type_id == "cash", Report.Report.shift > 0), 1),
+            else_ = 0
+        )
+        payment_date: sqlalchemy.ColumnElement = sqlalchemy.case(
+            (classified_names.c.payment_interval.is_(None), None),
+            else_ = sqlalchemy.func.next_business_day(
+                sqlalchemy.func.date(Report.Report.start_time, sqlalchemy.func.printf("%+d days", payment_days))
+            )
+        )
+
+        # Stage finishers whose type or payment date changes (only their daily totals move)
+        reclassified_finishers: sqlalchemy.Table = ModelsConfig.stage_ids(
+            connection,
+            "reclassified_finisher",
+            sqlalchemy.select(
+                Finisher.Finisher.id
+            ).where(
+                Finisher.Finisher.name == classified_names.c.name,
+                *report_conditions,
+                sqlalchemy.or_(
+                    Finisher.Finisher.type_id.is_distinct_from(classified_names.c.type_id),
+                    Finisher.Finisher.payment_date.is_distinct_from(payment_date)
+                )
+            )
+        )
+        changed_conditions: typing.List[sqlalchemy.ColumnElement] = [Finisher.Finisher.id.in_(sqlalchemy.select(reclassified_finishers.c.id))]
+
+        # Keep daily totals of previous and new dates and types (marked as changed)
+        ModelsConfig.track_finishers(connection, changed_conditions, -1)
+        result: sqlalchemy.CursorResult = connection.execute(
             Finisher.Finisher.__table__.update().values(
-                payment_value = payment_value
+                type_id = classified_names.c.type_id,
+                payment_date = payment_date,
+                payment_value = None
+            ).where(
+                Finisher.Finisher.name == classified_names.c.name,
+                *report_conditions,
+                *changed_conditions
+            )
+        )
+        ModelsConfig.track_finishers(connection, changed_conditions, 1)
+
+        # Recompute payment values of classified finishers (keeps their daily totals)
+        ModelsConfig.recompute_payment_values(connection, changed_conditions + [Finisher.Finisher.type_id.is_not(None)])
+        reclassified_finishers.drop(connection)
+
+        return result.rowcount
+
+
+    @staticmethod
+    def reclassify_statement_entries(
+            connection: sqlalchemy.Connection,
+            start_date: typing.Optional[datetime.date] = None,
+            end_date: typing.Optional[datetime.date] = None
+        ) -> int:
+        # Statement entries with statements inside the dates
+        statement_date: sqlalchemy.ScalarSelect = sqlalchemy.select(
+            Statement.Statement.date
+        ).where(
+            Statement.Statement.id == StatementEntry.StatementEntry.statement_id
+        ).correlate(
+            StatementEntry.StatementEntry
+        ).scalar_subquery()
+        conditions: typing.List[sqlalchemy.ColumnElement] = []
+        if start_date is not None:
+            conditions.append(statement_date >= start_date)
+        if end_date is not None:
+            conditions.append(statement_date <= end_date)
+
+        # Last matching pattern wins (first case of the reversed patterns)
+        whens: typing.List[typing.Tuple[sqlalchemy.ColumnElement, typing.Optional[str]]] = []
+        for pattern_type_id, pattern, value_pattern, predicates in reversed(ModelsConfig.get_statement_entry_classifier(connection).get_patterns()):
+            # Numeric predicates compare the stored value directly (patterns are matched through the registered function)
+            pattern_conditions: typing.List[sqlalchemy.ColumnElement] = StatementEntryClassifier.StatementEntryClassifier.build_value_conditions(StatementEntry.StatementEntry.value, predicates)
+            if value_pattern:
+                pattern_conditions.append(sqlalchemy.func.match_pattern(value_pattern.pattern, sqlalchemy.cast(StatementEntry.StatementEntry.value, sqlalchemy.String)))
+            if pattern:
+                pattern_conditions.append(sqlalchemy.func.match_pattern(pattern.pattern, StatementEntry.StatementEntry.name))
+
+            whens.append((sqlalchemy.and_(*pattern_conditions) if pattern_conditions else sqlalchemy.true(), pattern_type_id))
+        type_id: sqlalchemy.ColumnElement = ModelsConfig.build_case(whens)
+
+        # Stage statement entries whose type changes (only their daily totals move)
+        reclassified_statement_entries: sqlalchemy.Table = ModelsConfig.stage_ids(
+            connection,
+            "reclassified_statement_entry",
+            sqlalchemy.select(
+                StatementEntry.StatementEntry.id
+            ).where(
+                *conditions,
+                StatementEntry.StatementEntry.type_id.is_distinct_from(type_id)
+            )
+        )
+        changed_conditions: typing.List[sqlalchemy.ColumnElement] = [StatementEntry.StatementEntry.id.in_(sqlalchemy.select(reclassified_statement_entries.c.id))]
+
+        # Keep daily totals of previous and new dates and types (marked as changed)
+        ModelsConfig.track_statement_entries(connection, changed_conditions, -1)
+        result: sqlalchemy.CursorResult = connection.execute(
+            StatementEntry.StatementEntry.__table__.update().values(
+                type_id = type_id
             ).where(
-                sqlalchemy.and_(
-                    Finisher.Finisher.id == target.id
+                *changed_conditions
+            )
+        )
+        ModelsConfig.track_statement_entries(connection, changed_conditions, 1)
+        reclassified_statement_entries.drop(connection)
+
+        return result.rowcount
+
+
+    @staticmethod
+    def stage_ids(
+            connection: sqlalchemy.Connection,
+            table_name: str,
+            ids: sqlalchemy.Select
+        ) -> sqlalchemy.Table:
+        # Temporary table of the selected ids (dropped by the caller, or with the transaction if it rolls back)
+        table: sqlalchemy.Table = sqlalchemy.Table(
+            table_name,
+            sqlalchemy.MetaData(),
+            sqlalchemy.Column("id", sqlalchemy.Integer, primary_key = True),
+            prefixes = ["TEMPORARY"]
+        )
+        table.create(connection)
+        connection.execute(table.insert().from_select(["id"], ids))
+        return table
+
+
+    @staticmethod
+    def build_case(
+            whens: typing.List[typing.Tuple[sqlalchemy.ColumnElement, typing.Any]]
+        ) -> sqlalchemy.ColumnElement:
+        if not whens:
+            return sqlalchemy.null()
+
+        return sqlalchemy.case(*whens, else_ = None)
+
+
+    @staticmethod
+    def track_finishers(
+            connection: sqlalchemy.Connection,
+            conditions: typing.List[sqlalchemy.ColumnElement],
+            sign: int
+        ) -> None:
+        # Add (or subtract if negative sign) stored finishers to daily totals of their dates and types
+        ModelsConfig.add_daily_totals(
+            connection,
+            connection.execute(
+                sqlalchemy.select(
+                    Finisher.Finisher.payment_date.label("date"),
+                    Finisher.Finisher.type_id.label("type_id"),
+                    (sign * sqlalchemy.func.sum(Finisher.Finisher.value)).label("finishers_gross_value"),
+                    (sign * sqlalchemy.func.sum(sqlalchemy.func.coalesce(Finisher.Finisher.payment_value, 0))).label("finishers_net_value"),
+                    (sign * sqlalchemy.func.count()).label("finishers_count")
+                ).where(
+                    Finisher.Finisher.payment_date.is_not(None),
+                    Finisher.Finisher.type_id.is_not(None),
+                    *conditions
+                ).group_by(
+                    Finisher.Finisher.payment_date,
+                    Finisher.Finisher.type_id
+                )
+            ).mappings().all()
+        )
+
+
+    @staticmethod
+    def track_statement_entries(
+            connection: sqlalchemy.Connection,
+            conditions: typing.List[sqlalchemy.ColumnElement],
+            sign: int
+        ) -> None:
+        # Add (or subtract if negative sign) stored statement entries to daily totals of their dates and types
+        ModelsConfig.add_daily_totals(
+            connection,
+            connection.execute(
+                sqlalchemy.select(
+                    Statement.Statement.date.label("date"),
+                    StatementEntry.StatementEntry.type_id.label("type_id"),
+                    (sign * sqlalchemy.func.sum(StatementEntry.StatementEntry.value)).label("statement_entries_value"),
+                    (sign * sqlalchemy.func.count()).label("statement_entries_count")
+                ).select_from(
+                    StatementEntry.StatementEntry
+                ).join(
+                    Statement.Statement,
+                    Statement.Statement.id == StatementEntry.StatementEntry.statement_id
+                ).where(
+                    StatementEntry.StatementEntry.type_id.is_not(None),
+                    *conditions
+                ).group_by(
+                    Statement.Statement.date,
+                    StatementEntry.StatementEntry.type_id
                 )
+            ).mappings().all()
+        )
+
+
+    @staticmethod
+    def track_deleted_rows(
+            connection: sqlalchemy.Connection,
+            model: typing.Type[BaseModel.BaseModel],
+            conditions: typing.List[sqlalchemy.ColumnElement]
+        ) -> None:
+        # Rows deleted skipping listeners are subtracted from daily totals before being deleted
+        if model is Finisher.Finisher:
+            ModelsConfig.track_finishers(connection, conditions, -1)
+        elif model is StatementEntry.StatementEntry:
+            ModelsConfig.track_statement_entries(connection, conditions, -1)
+
+
+    @staticmethod
+    def track_inserted_rows(
+            connection: sqlalchemy.Connection,
+            model: typing.Type[BaseModel.BaseModel],
+            data: polars.DataFrame
+        ) -> None:
+        # Rows inserted skipping listeners are added to daily totals from their values (missing values are null)
+        totals_df: polars.DataFrame
+        if model is Finisher.Finisher:
+            data = data.with_columns([polars.lit(None).alias(column_name) for column_name in ["payment_date", "type_id", "payment_value"] if not column_name in data.columns])
+            totals_df = data.select(
+                [
+                    polars.col("payment_date").cast(polars.Date).alias("date"),
+                    polars.col("type_id").cast(polars.String).alias("type_id"),
+                    polars.col("value").cast(polars.Int64).alias("finishers_gross_value"),
+                    polars.col("payment_value").cast(polars.Int64).fill_null(0).alias("finishers_net_value"),
+                ]
+            ).drop_nulls(["date", "type_id"]).group_by(["date", "type_id"]).agg(
+                [
+                    polars.col("finishers_gross_value").sum(),
+                    polars.col("finishers_net_value").sum(),
+                    polars.len().cast(polars.Int64).alias("finishers_count"),
+                ]
+            )
+        elif model is StatementEntry.StatementEntry:
+            data = data.with_columns([polars.lit(None).alias(column_name) for column_name in ["type_id"] if not column_name in data.columns])
+            statement_ids: typing.List[int] = data.get_column("statement_id").drop_nulls().unique().to_list()
+            statements_df: polars.DataFrame = polars.DataFrame(
+                connection.execute(
+                    sqlalchemy.select(
+                        Statement.Statement.id,
+                        Statement.Statement.date
+                    ).where(
+                        Statement.Statement.id.in_(statement_ids)
+                    )
+                ).all(),
+                schema = {"statement_id": polars.Int64, "date": polars.Date},
+                orient = "row"
+            )
+            totals_df = data.select(
+                [
+                    polars.col("statement_id").cast(polars.Int64).alias("statement_id"),
+                    polars.col("type_id").cast(polars.String).alias("type_id"),
+                    polars.col("value").cast(polars.Int64).alias("statement_entries_value"),
+                ]
+            ).join(
+                statements_df,
+                on = "statement_id",
+                how = "inner"
+            ).drop_nulls(["date", "type_id"]).group_by(["date", "type_id"]).agg(
+                [
+                    polars.col("statement_entries_value").sum(),
+                    polars.len().cast(polars.Int64).alias("statement_entries_count"),
+                ]
             )
+        else:
+            return
+
+        ModelsConfig.add_daily_totals(connection, totals_df.to_dicts())
+
+
+    @staticmethod
+    def add_daily_totals(
+            connection: sqlalchemy.Connection,
+            totals: typing.Sequence[typing.Mapping[str, typing.Any]]
+        ) -> None:
+        if not totals:
+            return
+
+        # Mark dates and types as changed (dates and types already marked are kept)
+        connection.execute(
+            ModelsConfig.get_insert(connection)(DirtyDate.DirtyDate.__table__).on_conflict_do_nothing(),
+            [{"date": total["date"], "type_id": total["type_id"]} for total in totals]
         )
 
-        if not key in session.identity_map:
-            sqlalchemy.orm.attributes.set_committed_value(target, "payment_value", payment_value)
+        # Add values to daily totals already stored (inserted otherwise)
+        insert: typing.Any = ModelsConfig.get_insert(connection)(DailyTotal.DailyTotal.__table__)
+        column_names: typing.List[str] = [column_name for column_name in totals[0].keys() if not column_name in ["date", "type_id"]]
+        connection.execute(
+            insert.on_conflict_do_update(
+                index_elements = ["type_id", "date"],
+                set_ = {column_name: DailyTotal.DailyTotal.__table__.c[column_name] + insert.excluded[column_name] for column_name in column_names}
+            ),
+            [dict(total) for total in totals]
+        )
+
+
+    @staticmethod
+    def rebuild_daily_totals(
+            connection: sqlalchemy.Connection
+        ) -> None:
+        # Daily totals of every stored row (dates and types are marked as changed)
+        connection.execute(DailyTotal.DailyTotal.__table__.delete())
+        ModelsConfig.track_finishers(connection, [], 1)
+        ModelsConfig.track_statement_entries(connection, [], 1)
+
+
+    @staticmethod
+    def get_insert(
+            connection: sqlalchemy.Connection
+        ) -> typing.Callable[..., typing.Any]:
+        # Conflict clauses are only built by the inserts of each dialect
+        match connection.dialect.name:
+            case "sqlite":
+                return sqlalchemy.dialects.sqlite.insert
+            case "postgresql":
+                return sqlalchemy.dialects.postgresql.insert
+            case _:
+                raise NotImplementedError("Not implemented support to conflict clauses on dialects other than SQLite and PostgreSQL.")
+
+
+    @staticmethod
+    def run_deferred_recomputes(
+            session: sqlalchemy.orm.Session
+        ) -> None:
+        recomputes: typing.List[typing.Tuple[str, datetime.datetime, typing.Optional[datetime.datetime]]] = session.info.pop("pending_recomputes", [])
+        if not recomputes:
+            return
+
+        # In-memory SQLite databases are only seen by the connection of this thread
+        engine: sqlalchemy.Engine = session.get_bind()
+        if engine.dialect.name == "sqlite" and engine.url.database in [None, "", ":memory:"]:
+            ModelsConfig.__run_recomputes(engine, recomputes)
+            ModelsConfig.wait_deferred_recomputes(engine)
+            return
+
+        thread: threading.Thread = threading.Thread(
+            target = ModelsConfig.__run_recomputes,
+            args = (engine, recomputes)
+        )
+        ModelsConfig.__recompute_threads.setdefault(engine, []).append(thread)
+        thread.start()
+
+
+    @staticmethod
+    def discard_deferred_recomputes(
+            session: sqlalchemy.orm.Session
+        ) -> None:
+        session.info.pop("pending_recomputes", None)
+
+
+    @staticmethod
+    def wait_deferred_recomputes(
+            engine: sqlalchemy.Engine
+        ) -> None:
+        threads: typing.List[threading.Thread] = ModelsConfig.__recompute_threads.get(engine, [])
+        while threads:
+            threads.pop().join()
+
+        # Errors of the recompute threads are raised to the thread waiting for them
+        errors: typing.List[Exception] = ModelsConfig.__recompute_errors.pop(engine, [])
+        if errors:
+            raise Exception(f"Failed to recompute payment values: {errors[0]}") from errors[0]
+
+
+    @staticmethod
+    def __run_recomputes(
+            engine: sqlalchemy.Engine,
+            recomputes: typing.List[typing.Tuple[str, datetime.datetime, typing.Optional[datetime.datetime]]]
+        ) -> None:
+        try:
+            for attempt in range(1, RECOMPUTE_ATTEMPTS + 1):
+                try:
+                    with engine.begin() as connection:
+                        for type_id, start_time, end_time in recomputes:
+                            ModelsConfig.recompute_payment_values(connection, ModelsConfig.build_rate_window(type_id, start_time, end_time))
+                    return
+                except sqlalchemy.exc.OperationalError as e:
+                    # Writes of the main thread may hold the lock beyond the busy timeout
+                    if attempt == RECOMPUTE_ATTEMPTS or "database is locked" not in str(e):
+                        raise
+                    time.sleep(RECOMPUTE_RETRY_DELAY * attempt)
+        except Exception as e:
+            ModelsConfig.__recompute_errors.setdefault(engine, []).append(e)
 
 
     @staticmethod
@@ -226,20 +810,7 @@ class ModelsConfig():
         ) -> None:
         session: sqlalchemy.orm.Session = sqlalchemy.orm.session.object_session(target)
 
-        statement_entry_patterns: typing.List[StatementEntryPattern.StatementEntryPattern] = sqlalchemy.orm.Session(
-            bind = connection
-        ).query(
-            StatementEntryPattern.StatementEntryPattern
-        ).order_by(
-            # Garantee null as last patterns
-            StatementEntryPattern.StatementEntryPattern.pattern.asc()
-        ).all()
-
-        type_id: typing.Optional[str] = None
-        for statement_entry_pattern in statement_entry_patterns:
-            if re.match(statement_entry_pattern.value_pattern, str(target.value)) and \
-            (not statement_entry_pattern.pattern or re.match(statement_entry_pattern.pattern, target.name)):
-                type_id = statement_entry_pattern.type_id
+        type_id: typing.Optional[str] = ModelsConfig.get_statement_entry_classifier(connection).classify_entry(target.name, target.value)
 
         key: sqlalchemy.CursorResult = connection.execute(
             StatementEntry.StatementEntry.__table__.update().values(
@@ -250,4 +821,140 @@ class ModelsConfig():
         )
 
         if not key in session.identity_map:
-            sqlalchemy.orm.attributes.set_committed_value(target, "type_id", type_id)
\ No newline at end of file
+            sqlalchemy.orm.attributes.set_committed_value(target, "type_id", type_id)
+
+
+    @staticmethod
+    def listener_totals_before_change(
+            mapper: sqlalchemy.orm.Mapper,
+            connection: sqlalchemy.Connection,
+            target: BaseModel.BaseModel,
+            **kwargs: typing.Any
+        ) -> None:
+        ModelsConfig.track_target(connection, target, -1)
+
+
+    @staticmethod
+    def listener_totals_after_change(
+            mapper: sqlalchemy.orm.Mapper,
+            connection: sqlalchemy.Connection,
+            target: BaseModel.BaseModel,
+            **kwargs: typing.Any
+        ) -> None:
+        ModelsConfig.track_target(connection, target, 1)
+
+
+    @staticmethod
+    def track_target(
+            connection: sqlalchemy.Connection,
+            target: BaseModel.BaseModel,
+            sign: int
+        ) -> None:
+        # Stored finishers or statement entries of the target as read by the database
+        match target:
+            case Finisher.Finisher():
+                ModelsConfig.track_finishers(connection, [Finisher.Finisher.id == target.id], sign)
+            case Report.Report():
+                ModelsConfig.track_finishers(connection, [Finisher.Finisher.report_id == target.id], sign)
+            case StatementEntry.StatementEntry():
+                ModelsConfig.track_statement_entries(connection, [StatementEntry.StatementEntry.id == target.id], sign)
+            case Statement.Statement():
+                ModelsConfig.track_statement_entries(connection, [StatementEntry.StatementEntry.statement_id == target.id], sign)
+
+
+    @staticmethod
+    def listener_references_on_change(
+            mapper: sqlalchemy.orm.Mapper,
+            connection: sqlalchemy.Connection,
+            target: BaseModel.BaseModel,
+            **kwargs: typing.Any
+        ) -> None:
+        ModelsConfig.invalidate_references()
+
+
+    @staticmethod
+    def invalidate_references() -> None:
+        ModelsConfig.__references_engine = None
+
+
+    @staticmethod
+    def get_finisher_classifier(
+            connection: sqlalchemy.Connection
+        ) -> FinisherClassifier.FinisherClassifier:
+        ModelsConfig.__load_references(connection)
+        return ModelsConfig.__finisher_classifier
+
+
+    @staticmethod
+    def get_statement_entry_classifier(
+            connection: sqlalchemy.Connection
+        ) -> StatementEntryClassifier.StatementEntryClassifier:
+        ModelsConfig.__load_references(connection)
+        return ModelsConfig.__statement_entry_classifier
+
+
+    @staticmethod
+    def __load_references(
+            connection: sqlalchemy.Connection
+        ) -> None:
+        if ModelsConfig.__references_engine is connection.engine:
+            return
+
+        finisher_patterns: polars.DataFrame = polars.DataFrame(
+            connection.execute(
+                sqlalchemy.select(
+                    FinisherPattern.FinisherPattern.type_id,
+                    FinisherPattern.FinisherPattern.pattern,
+                    FinisherPattern.FinisherPattern.payment_interval
+                ).order_by(
+                    FinisherPattern.FinisherPattern.id
+                )
+            ).all(),
+            schema = {"type_id": polars.String, "pattern": polars.String, "payment_interval": polars.Int64},
+            orient = "row"
+        )
+        rates: polars.DataFrame = polars.DataFrame(
+            connection.execute(
+                sqlalchemy.select(
+                    Rate.Rate.type_id,
+                    Rate.Rate.rate,
+                    Rate.Rate.start_time
+                ).order_by(
+                    Rate.Rate.start_time
+                )
+            ).all(),
+            schema = {"type_id": polars.String, "rate": polars.Float64, "start_time": polars.Datetime("us")},
+            orient = "row"
+        )
+        statement_entry_patterns: polars.DataFrame = polars.DataFrame(
+            connection.execute(
+                sqlalchemy.select(
+                    StatementEntryPattern.StatementEntryPattern.type_id,
+                    StatementEntryPattern.StatementEntryPattern.pattern,
+                    StatementEntryPattern.StatementEntryPattern.value_pattern,
+                    StatementEntryPattern.StatementEntryPattern.sign,
+                    StatementEntryPattern.StatementEntryPattern.min_value,
+                    StatementEntryPattern.StatementEntryPattern.max_value,
+                    StatementEntryPattern.StatementEntryPattern.value
+                ).order_by(
+                    # Garantee null as last patterns
+                    StatementEntryPattern.StatementEntryPattern.pattern.asc()
+                )
+            ).all(),
+            schema = {
+                "type_id": polars.String,
+                "pattern": polars.String,
+                "value_pattern": polars.String,
+                "sign": polars.Int64,
+                "min_value": polars.Int64,
+                "max_value": polars.Int64,
+                "value": polars.Int64
+            },
+            orient = "row"
+        )
+
+        # Compile patterns and calendar once
+        ModelsConfig.__finisher_classifier = FinisherClassifier.FinisherClassifier(finisher_patterns, rates)
+        ModelsConfig.__statement_entry_classifier = StatementEntryClassifier.StatementEntryClassifier(statement_entry_patterns)
+
+        ModelsConfig.__references_engine = connection.engine
\ No newline at end of file
@@ -0,0 +1,75 @@
+import datetime
+import sqlalchemy
+import sqlalchemy.orm
+import typeguard
+
+from .. import BaseModel
+
+
+@typeguard.typechecked
+class DailyTotal(BaseModel.BaseModel):
+
+    # Table name
+    __tablename__ = "daily_total"
+
+
+    # Columns
+    id: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        primary_key = True,
+        unique = True,
+        nullable = False,
+        autoincrement = True
+    )
+    type_id: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
+        sqlalchemy.ForeignKey("type.id"),
+        nullable = False
+    )
+    date: sqlalchemy.orm.Mapped[datetime.date] = sqlalchemy.orm.mapped_column(
+        nullable = False
+    )
+    finishers_gross_value: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        default = 0,
+        nullable = False
+    )
+    finishers_net_value: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        default = 0,
+        nullable = False
+    )
+    finishers_count: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        default = 0,
+        nullable = False
+    )
+    statement_entries_value: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        default = 0,
+        nullable = False
+    )
+    statement_entries_count: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        default = 0,
+        nullable = False
+    )
+
+
+    # Constraints
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint("type_id", "date", name = "unique_daily_total_type_id_date"),
+        sqlalchemy.Index("index_daily_total_date_type_id", "date", "type_id"),
+    )
+
+
+    # Computed columns
+    @property
+    def str_date(self) -> str:
+        return self.date.isoformat()
+
+    @str_date.setter
+    def str_date(self, value: datetime.date | str) -> None:
+        if isinstance(value, str):
+            self.date = datetime.date.fromisoformat(value)
+        else:
+            self.date = value
+
+
+    # Relationships
+    type: sqlalchemy.orm.Mapped["Type"] = sqlalchemy.orm.relationship( # type: ignore
+        back_populates = "daily_totals"
+    )
\ No newline at end of file
@@ -0,0 +1,54 @@
+import datetime
+import sqlalchemy
+import sqlalchemy.orm
+import typeguard
+
+from .. import BaseModel
+
+
+@typeguard.typechecked
+class DirtyDate(BaseModel.BaseModel):
+
+    # Table name
+    __tablename__ = "dirty_date"
+
+
+    # Columns
+    id: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        primary_key = True,
+        unique = True,
+        nullable = False,
+        autoincrement = True
+    )
+    type_id: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
+        sqlalchemy.ForeignKey("type.id"),
+        nullable = False
+    )
+    date: sqlalchemy.orm.Mapped[datetime.date] = sqlalchemy.orm.mapped_column(
+        nullable = False
+    )
+
+
+    # Constraints
+    __table_args__ = (
+        sqlalchemy.UniqueConstraint("date", "type_id", name = "unique_dirty_date_date_type_id"),
+    )
+
+
+    # Computed columns
+    @property
+    def str_date(self) -> str:
+        return self.date.isoformat()
+
+    @str_date.setter
+    def str_date(self, value: datetime.date | str) -> None:
+        if isinstance(value, str):
+            self.date = datetime.date.fromisoformat(value)
+        else:
+            self.date = value
+
+
+    # Relationships
+    type: sqlalchemy.orm.Mapped["Type"] = sqlalchemy.orm.relationship( # type: ignore
+        back_populates = "dirty_dates"
+    )
\ No newline at end of file
@@ -50,6 +50,9 @@ class Finisher(BaseModel.BaseModel):
     # Constraints
     __table_args__ = (
         sqlalchemy.UniqueConstraint("report_id", "name", name = "unique_report_id_name"),
+        sqlalchemy.Index("index_finisher_payment_date_type_id", "payment_date", "type_id"),
+        sqlalchemy.Index("index_finisher_type_id_report_id", "type_id", "report_id"),
+        sqlalchemy.Index("index_finisher_verification_id", "verification_id"),
     )
 
 
@@ -12,6 +12,9 @@ class FinisherPattern(BaseModel.BaseModel):
     __tablename__ = "finisher_pattern"
 
 
+    __cacheable__ = True
+
+
     # Columns
     id: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
         primary_key = True,
@@ -0,0 +1,49 @@
+import datetime
+import sqlalchemy
+import sqlalchemy.orm
+import typeguard
+
+from .. import BaseModel
+
+
+@typeguard.typechecked
+class IngestedFile(BaseModel.BaseModel):
+
+    # Table name
+    __tablename__ = "ingested_file"
+
+
+    # Columns
+    id: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        primary_key = True,
+        unique = True,
+        nullable = False,
+        autoincrement = True
+    )
+    hash: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
+        unique = True,
+        nullable = False
+    )
+    name: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
+        nullable = False
+    )
+    size: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        nullable = False
+    )
+    loaded_on: sqlalchemy.orm.Mapped[datetime.datetime] = sqlalchemy.orm.mapped_column(
+        default = datetime.datetime.now,
+        nullable = False
+    )
+
+
+    # Computed columns
+    @property
+    def str_loaded_on(self) -> str:
+        return self.loaded_on.isoformat()
+
+    @str_loaded_on.setter
+    def str_loaded_on(self, value: datetime.datetime | str) -> None:
+        if isinstance(value, str):
+            self.loaded_on = datetime.datetime.fromisoformat(value)
+        else:
+            self.loaded_on = value
\ No newline at end of file
@@ -13,6 +13,9 @@ class Rate(BaseModel.BaseModel):
     __tablename__ = "rate"
 
 
+    __cacheable__ = True
+
+
     # Columns
     id: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
         primary_key = True,
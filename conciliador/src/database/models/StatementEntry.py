@@ -39,6 +39,13 @@ class StatementEntry(BaseModel.BaseModel):
     )
 
 
+    # Constraints
+    __table_args__ = (
+        sqlalchemy.Index("index_statement_entry_statement_id_type_id", "statement_id", "type_id"),
+        sqlalchemy.Index("index_statement_entry_verification_id", "verification_id"),
+    )
+
+
     # Relationships
     statement: sqlalchemy.orm.Mapped["Statement"] = sqlalchemy.orm.relationship( # type: ignore
         back_populates = "statement_entries"
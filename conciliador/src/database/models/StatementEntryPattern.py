@@ -12,6 +12,9 @@ class StatementEntryPattern(BaseModel.BaseModel):
     __tablename__ = "statement_entry_pattern"
 
 
+    __cacheable__ = True
+
+
     # Columns
     id: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
         primary_key = True,
@@ -27,13 +30,25 @@ class StatementEntryPattern(BaseModel.BaseModel):
         nullable = True
     )
     value_pattern: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
-        nullable = False
+        nullable = True
+    )
+    sign: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        nullable = True
+    )
+    min_value: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        nullable = True
+    )
+    max_value: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        nullable = True
+    )
+    value: sqlalchemy.orm.Mapped[int] = sqlalchemy.orm.mapped_column(
+        nullable = True
     )
 
 
     # Constraints
     __table_args__ = (
-        sqlalchemy.UniqueConstraint("pattern", "value_pattern", name = "unique_pattern_value_pattern"),
+        sqlalchemy.UniqueConstraint("pattern", "value_pattern", "sign", "min_value", "max_value", "value", name = "unique_pattern_value_pattern"),
     )
 
 
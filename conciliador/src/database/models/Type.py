@@ -14,6 +14,9 @@ class Type(BaseModel.BaseModel):
     __tablename__ = "type"
 
 
+    __cacheable__ = True
+
+
     # Columns
     id: sqlalchemy.orm.Mapped[str] = sqlalchemy.orm.mapped_column(
         primary_key = True,
@@ -40,4 +43,10 @@ class Type(BaseModel.BaseModel):
     )
     verifications: sqlalchemy.orm.Mapped[typing.List["Verification"]] = sqlalchemy.orm.relationship( # type: ignore
         back_populates = "type"
+    )
+    dirty_dates: sqlalchemy.orm.Mapped[typing.List["DirtyDate"]] = sqlalchemy.orm.relationship( # type: ignore
+        back_populates = "type"
+    )
+    daily_totals: sqlalchemy.orm.Mapped[typing.List["DailyTotal"]] = sqlalchemy.orm.relationship( # type: ignore
+        back_populates = "type"
     )
\ No newline at end of file
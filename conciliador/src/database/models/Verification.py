@@ -42,6 +42,7 @@ class Verification(BaseModel.BaseModel):
     # Constraints
     __table_args__ = (
         sqlalchemy.UniqueConstraint("type_id", "date", name = "unique_type_id_date"),
+        sqlalchemy.Index("index_verification_date_type_id", "date", "type_id"),
     )
 
 
@@ -60,13 +61,62 @@ class Verification(BaseModel.BaseModel):
 
     # Computed columns
     @sqlalchemy.ext.hybrid.hybrid_property
-    def finishers_value(self) -> int:
+    def finishers_gross_value(self) -> int:
         return sum(finisher.value for finisher in self.finishers)
 
+    @finishers_gross_value.inplace.expression
+    @classmethod
+    def _finishers_gross_value_expression(cls) -> sqlalchemy.ScalarSelect:
+        finisher: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model("finisher")
+        return sqlalchemy.select(
+            sqlalchemy.func.coalesce(sqlalchemy.func.sum(finisher.value), 0)
+        ).where(
+            finisher.verification_id == cls.id
+        ).correlate_except(
+            finisher
+        ).scalar_subquery()
+
+    @sqlalchemy.ext.hybrid.hybrid_property
+    def finishers_value(self) -> int:
+        return sum(finisher.payment_value or 0 for finisher in self.finishers)
+
+    @finishers_value.inplace.expression
+    @classmethod
+    def _finishers_value_expression(cls) -> sqlalchemy.ScalarSelect:
+        finisher: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model("finisher")
+        return sqlalchemy.select(
+            sqlalchemy.func.coalesce(sqlalchemy.func.sum(finisher.payment_value), 0)
+        ).where(
+            finisher.verification_id == cls.id
+        ).correlate_except(
+            finisher
+        ).scalar_subquery()
+
     @sqlalchemy.ext.hybrid.hybrid_property
     def statement_entries_value(self) -> int:
         return sum(statement_entry.value for statement_entry in self.statement_entries)
 
+    @statement_entries_value.inplace.expression
+    @classmethod
+    def _statement_entries_value_expression(cls) -> sqlalchemy.ScalarSelect:
+        statement_entry: typing.Type[BaseModel.BaseModel] = BaseModel.BaseModel.get_model("statement_entry")
+        return sqlalchemy.select(
+            sqlalchemy.func.coalesce(sqlalchemy.func.sum(statement_entry.value), 0)
+        ).where(
+            statement_entry.verification_id == cls.id
+        ).correlate_except(
+            statement_entry
+        ).scalar_subquery()
+
+    @sqlalchemy.ext.hybrid.hybrid_property
+    def difference(self) -> int:
+        return self.finishers_value - self.statement_entries_value
+
+    @difference.inplace.expression
+    @classmethod
+    def _difference_expression(cls) -> sqlalchemy.ColumnElement:
+        return cls.finishers_value - cls.statement_entries_value
+
 
     # Relationships
     type: sqlalchemy.orm.Mapped["Type"] = sqlalchemy.orm.relationship( # type: ignore
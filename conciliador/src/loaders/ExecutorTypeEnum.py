@@ -0,0 +1,9 @@
+import enum
+import typeguard
+
+
+@typeguard.typechecked
+class ExecutorTypeEnum(enum.StrEnum):
+    SEQUENTIAL = "sequential"
+    THREAD = "thread"
+    PROCESS = "process"
\ No newline at end of file
@@ -1,33 +1,71 @@
 import abc
 import chardet
+import codecs
+import concurrent.futures
+import hashlib
+import itertools
+import multiprocessing
+import os
 import pathlib
 import polars
 import typeguard
 import typing
 
+from . import ExecutorTypeEnum
+
 
 T = typing.TypeVar("T")
 
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Bytes decoded with the detected encoding before trusting it for the whole file
+ENCODING_CHECK_SIZE = 1024 * 1024
+
 
 @typeguard.typechecked
 class Loader(abc.ABC, typing.Generic[T]):
 
+    __encodings: typing.Dict[typing.Tuple[str, int, int], str] = dict()
+    __hashes: typing.Dict[typing.Tuple[str, int, int], str] = dict()
+
+
     def process_files(
             self,
             paths: typing.Iterable[pathlib.Path],
-            encoding: typing.Optional[str] = None
-        ) -> typing.Tuple[T, ...]:
-        processed_files: typing.List[T] = list()
+            encoding: typing.Optional[str] = None,
+            executor_type: ExecutorTypeEnum.ExecutorTypeEnum = ExecutorTypeEnum.ExecutorTypeEnum.SEQUENTIAL,
+            workers: typing.Optional[int] = None
+        ) -> typing.Dict[pathlib.Path, T]:
+        paths = tuple(paths)
+        processed_files: typing.List[typing.Optional[T]]
 
-        for path in paths:
-            try:
-                processed_file = self.process_file(path, encoding or Loader.detect_encoding(path))
-            except Exception as e:
-                Exception(f"Error processing file \"{path}\": {e}")
-            else:
-                processed_files.append(processed_file)
+        # Results keep the order of the given paths for every executor
+        match executor_type:
+            case ExecutorTypeEnum.ExecutorTypeEnum.SEQUENTIAL:
+                processed_files = [self.try_process_file(path, encoding) for path in paths]
+
+            case ExecutorTypeEnum.ExecutorTypeEnum.THREAD:
+                with concurrent.futures.ThreadPoolExecutor(max_workers = workers) as executor:
+                    processed_files = list(executor.map(self.try_process_file, paths, itertools.repeat(encoding)))
+
+            case ExecutorTypeEnum.ExecutorTypeEnum.PROCESS:
+                # Forking after polars started its thread pool may deadlock, so spawn workers
+                with concurrent.futures.ProcessPoolExecutor(max_workers = workers, mp_context = multiprocessing.get_context("spawn")) as executor:
+                    processed_files = list(executor.map(self.try_process_file, paths, itertools.repeat(encoding)))
 
-        return tuple(processed_files)
+        return {path: processed_file for path, processed_file in zip(paths, processed_files) if processed_file is not None}
+
+
+    def try_process_file(
+            self,
+            path: pathlib.Path,
+            encoding: typing.Optional[str] = None
+        ) -> typing.Optional[T]:
+        try:
+            return self.process_file(path, encoding or Loader.detect_encoding(path))
+        except Exception as e:
+            Exception(f"Error processing file \"{path}\": {e}")
+            return None
 
 
     def process_file(
@@ -93,9 +131,66 @@ class Loader(abc.ABC, typing.Generic[T]):
         return tuple(paths)
 
 
+    def filter_paths(
+        self,
+        paths: typing.Iterable[pathlib.Path],
+        ignored_hashes: typing.Iterable[str] = ()
+    ) -> typing.Tuple[pathlib.Path, ...]:
+        seen_hashes: typing.Set[str] = set(ignored_hashes)
+        filtered_paths: typing.List[pathlib.Path] = list()
+
+        # Skip files with ignored or repeated contents
+        for path in paths:
+            file_hash: str = Loader.hash_file(path)
+            if file_hash in seen_hashes:
+                continue
+
+            seen_hashes.add(file_hash)
+            filtered_paths.append(path)
+
+        return tuple(filtered_paths)
+
+
     @staticmethod
-    def detect_encoding(
+    def hash_file(
             path: pathlib.Path
         ) -> str:
+        # Reuse hashes of unchanged files
+        stat: os.stat_result = path.stat()
+        key: typing.Tuple[str, int, int] = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        if key in Loader.__hashes:
+            return Loader.__hashes[key]
+
+        with open(path, "rb") as file:
+            file_hash: str = hashlib.file_digest(file, "sha256").hexdigest()
+
+        Loader.__hashes[key] = file_hash
+        return file_hash
+
+
+    @staticmethod
+    def detect_encoding(
+            path: pathlib.Path,
+            sample_size: int = ENCODING_SAMPLE_SIZE
+        ) -> str:
+        # Reuse detections of unchanged files
+        stat: os.stat_result = path.stat()
+        key: typing.Tuple[str, int, int] = (str(path.resolve()), stat.st_size, stat.st_mtime_ns)
+        if key in Loader.__encodings:
+            return Loader.__encodings[key]
+
         with open(path, "rb") as file:
-            return chardet.detect(file.read())["encoding"]
\ No newline at end of file
+            # Detect only through the first bytes of the file
+            sample: bytes = file.read(sample_size)
+            encoding: typing.Optional[str] = chardet.detect(sample)["encoding"]
+
+            # Escalate to the whole file only if the detected encoding is unable to decode a bounded window of it (samples of whole files need no check)
+            if len(sample) == sample_size:
+                try:
+                    codecs.getincrementaldecoder(encoding)().decode(sample + file.read(max(ENCODING_CHECK_SIZE - sample_size, 0)))
+                except (LookupError, TypeError, UnicodeDecodeError):
+                    file.seek(0)
+                    encoding = chardet.detect(file.read())["encoding"]
+
+        Loader.__encodings[key] = encoding
+        return encoding
\ No newline at end of file
@@ -1,3 +1,5 @@
+import collections
+import itertools
 import pathlib
 import polars
 import typeguard
@@ -7,6 +9,8 @@ from . import Loader
 
 
 REPORT_COLUMNS = ("Turno", "Funcionário", "Data", "Início", "Término", "Finalizadora", "Total")
+REPORT_HEADER_SIZE = 5
+REPORT_FOOTER_SIZE = 3
 
 
 @typeguard.typechecked
@@ -17,62 +21,81 @@ class ReportLoader(Loader.Loader[polars.DataFrame]):
             path: pathlib.Path,
             encoding: typing.Optional[str] = None
         ) -> polars.DataFrame:
-        report_content = open(path, encoding = encoding or Loader.Loader.detect_encoding(path)).read()
-
-        # Remove unuseful header
-        report_content = report_content.split("\n", maxsplit = 5)[-1]
-
-        # Remove unuseful footer
-        report_content = report_content.rsplit("\n", maxsplit = 3)[0]
-
-        # Split the content into sections by the first element and filter last columns
-        sections: typing.List[typing.List[typing.List[str]]] = list()
-        rows = report_content.split("\n")
-        for row in rows:
+        columns_buffers: typing.Dict[str, typing.List[str]] = {column: list() for column in REPORT_COLUMNS[1:]}
+        rows_sections: typing.List[int] = list()
+        sections_start_times: typing.List[str] = list()
+
+        # Current section info and row held back (the last row of a section is its total)
+        name: str = ""
+        date: str = ""
+        start_time: str = ""
+        end_time: str = ""
+        section_row: int = 0
+        held_columns: typing.Optional[typing.List[str]] = None
+
+        def process_row(row: str) -> None:
+            nonlocal name, date, start_time, end_time, section_row, held_columns
+
+            # Filter last columns
             columns = row.split(";")[:-5]
 
             if columns[0].strip(): # If it is a new report section
-                sections.append([columns])
-                continue
-
-            sections[-1].append(columns)
-
-        df_sections: typing.List[polars.DataFrame] = list()
-        start_times: typing.List[str] = list()
-        for i, section in enumerate(sections):        
-            info, _, section, _ = section[0], section[1], section[2:-1], section[-1]
-
-            # Get the info
-            name = info[0]
-            date, start_time = info[3].split(" ")[:2]
-            _, end_time = info[4].split(" ")[:2]
-            start_times.append(start_time)
-
-            # Repeat info through section
-            for j in range(len(section)):
-                finisher = section[j][1]
-                value = section[j][4] if finisher != "RECEBIMENTO DINHEIRO" else section[j][5]
-                section[j] = [
-                    "",
-                    name,
-                    date,
-                    start_time,
-                    end_time,
-                    finisher,
-                    value,
-                ]
-
-            # Convert the sections into DataFrames and store them
-            df_sections.append(polars.DataFrame(section, schema = REPORT_COLUMNS, orient = "row"))
+                name = columns[0]
+                date, start_time = columns[3].split(" ")[:2]
+                _, end_time = columns[4].split(" ")[:2]
+                sections_start_times.append(start_time)
+                section_row = 0
+                held_columns = None
+                return
+
+            # Skip section header
+            section_row += 1
+            if section_row == 1:
+                return
+
+            if held_columns is not None:
+                finisher = held_columns[1]
+                columns_buffers["Funcionário"].append(name)
+                columns_buffers["Data"].append(date)
+                columns_buffers["Início"].append(start_time)
+                columns_buffers["Término"].append(end_time)
+                columns_buffers["Finalizadora"].append(finisher)
+                columns_buffers["Total"].append(held_columns[4] if finisher != "RECEBIMENTO DINHEIRO" else held_columns[5])
+                rows_sections.append(len(sections_start_times) - 1)
+
+            held_columns = columns
+
+        with open(path, encoding = encoding or Loader.Loader.detect_encoding(path)) as file:
+            # Remove unuseful header
+            lines: typing.Iterator[str] = itertools.islice(file, REPORT_HEADER_SIZE, None)
+
+            # Remove unuseful footer by holding the last rows back
+            footer: typing.Deque[str] = collections.deque()
+            for line in lines:
+                footer.append(line)
+                if len(footer) > REPORT_FOOTER_SIZE:
+                    process_row(footer.popleft().removesuffix("\n"))
+
+            # A trailing line break counts as an empty footer row
+            if not footer or footer[-1].endswith("\n"):
+                footer.append("")
+                if len(footer) > REPORT_FOOTER_SIZE:
+                    process_row(footer.popleft().removesuffix("\n"))
 
         # Using start time to define shift order
-        starts = sorted([df_section.item(0, "Início") for df_section in df_sections])
-        df_sections.sort(key = lambda x: starts.index(x.item(0, "Início")))
-
-        # Combine all dataframes and insert shift value
-        report = polars.DataFrame(schema = {x: str for x in REPORT_COLUMNS})
-        for i, df_section in enumerate(df_sections):
-            df_section = df_section.with_columns([(polars.lit(str(i))).alias("Turno")])
-            report.vstack(df_section, in_place = True)
+        sections_shifts: typing.List[int] = [0] * len(sections_start_times)
+        for shift, section in enumerate(sorted(range(len(sections_start_times)), key = lambda i: sections_start_times[i])):
+            sections_shifts[section] = shift
+
+        # Build the report at once with the shift value
+        rows_shifts: typing.List[int] = [sections_shifts[section] for section in rows_sections]
+        report = polars.DataFrame(
+            {
+                "Turno": [str(shift) for shift in rows_shifts],
+                **columns_buffers,
+                "shift": rows_shifts,
+            },
+            schema = {**{x: polars.String for x in REPORT_COLUMNS}, "shift": polars.Int64}
+        ).sort("shift", maintain_order = True).drop("shift")
 
         return report
\ No newline at end of file
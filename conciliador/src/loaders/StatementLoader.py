@@ -1,5 +1,7 @@
+import codecs
 import pathlib
 import polars
+import shutil
 import typeguard
 import typing
 
@@ -7,6 +9,7 @@ from . import Loader
 
 
 STATEMENT_COLUMNS = ("Data", "Histórico", "Valor")
+SCAN_ENCODINGS = ("utf-8", "ascii")
 
 
 @typeguard.typechecked
@@ -19,4 +22,34 @@ class StatementLoader(Loader.Loader[polars.DataFrame]):
         ) -> polars.DataFrame:
         df = polars.read_csv(path, separator = ";", encoding = encoding or Loader.Loader.detect_encoding(path))
         df.columns = STATEMENT_COLUMNS
-        return df
\ No newline at end of file
+        return df
+
+
+    def scan_files(
+            self,
+            paths: typing.Iterable[pathlib.Path],
+            directory: pathlib.Path,
+            encoding: typing.Optional[str] = None
+        ) -> polars.LazyFrame:
+        scan_paths: typing.List[pathlib.Path] = list()
+
+        # Lazy scans only read UTF-8 (other encodings are transcoded into the given directory)
+        for index, path in enumerate(paths):
+            file_encoding: typing.Optional[str] = encoding or Loader.Loader.detect_encoding(path)
+            if file_encoding is None or codecs.lookup(file_encoding).name in SCAN_ENCODINGS:
+                scan_paths.append(path)
+                continue
+
+            scan_path: pathlib.Path = directory / f"{index}.csv"
+            with open(path, mode = "r", encoding = file_encoding, newline = "") as source, open(scan_path, mode = "w", encoding = "utf-8", newline = "") as target:
+                shutil.copyfileobj(source, target)
+            scan_paths.append(scan_path)
+
+        # Single scan of every file with a fixed schema (header replaced by the statement columns)
+        return polars.scan_csv(
+            scan_paths,
+            separator = ";",
+            has_header = False,
+            skip_rows = 1,
+            schema = {column: polars.String for column in STATEMENT_COLUMNS}
+        )
\ No newline at end of file
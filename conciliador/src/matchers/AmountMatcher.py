@@ -0,0 +1,285 @@
+import polars
+import time
+import typeguard
+import typing
+
+from ..utils import BusinessCalendar
+
+
+MATCH_SUBSET_SIZE = 24
+MATCH_TIME_BUDGET = 0.25
+
+
+@typeguard.typechecked
+class AmountMatcher():
+
+    def __init__(
+            self,
+            subset_size: int = MATCH_SUBSET_SIZE,
+            time_budget: float = MATCH_TIME_BUDGET,
+            tolerance_days: int = 0,
+            calendar: typing.Optional[BusinessCalendar.BusinessCalendar] = None
+        ) -> None:
+        if subset_size < 1:
+            raise ValueError("Subset size must be a positive integer.")
+
+        if tolerance_days < 0:
+            raise ValueError("Tolerance days must be a non-negative integer.")
+
+        self.__subset_size: int = subset_size
+        self.__time_budget: float = time_budget
+        self.__tolerance_days: int = tolerance_days
+        self.__calendar: typing.Optional[BusinessCalendar.BusinessCalendar] = calendar
+
+
+    def match(
+            self,
+            finishers: polars.DataFrame,
+            statement_entries: polars.DataFrame
+        ) -> typing.Tuple[polars.DataFrame, polars.DataFrame]:
+        # Both sides are given as id, date, type and value (matches happen only within the same type)
+        keys: typing.List[str] = ["date", "type_id"]
+        finishers = finishers.select(
+            [
+                polars.col("id").cast(polars.Int64).alias("id"),
+                polars.col("date").cast(polars.Date).alias("date"),
+                polars.col("type_id").cast(polars.String).alias("type_id"),
+                polars.col("value").cast(polars.Int64).alias("value"),
+            ]
+        ).drop_nulls()
+        statement_entries = statement_entries.select(
+            [
+                polars.col("id").cast(polars.Int64).alias("id"),
+                polars.col("date").cast(polars.Date).alias("date"),
+                polars.col("type_id").cast(polars.String).alias("type_id"),
+                polars.col("value").cast(polars.Int64).alias("value"),
+            ]
+        ).drop_nulls()
+
+        # Pair exact amounts through a hash join (repeated amounts are paired by occurrence)
+        ranked_finishers: polars.DataFrame = finishers.with_columns(
+            polars.int_range(polars.len()).over(keys + ["value"]).alias("rank")
+        )
+        ranked_statement_entries: polars.DataFrame = statement_entries.with_columns(
+            polars.int_range(polars.len()).over(keys + ["value"]).alias("rank")
+        )
+        exact_df: polars.DataFrame = ranked_finishers.join(
+            ranked_statement_entries,
+            on = keys + ["value", "rank"],
+            how = "inner",
+            suffix = "_statement_entry"
+        )
+        matched_finishers_dfs: typing.List[polars.DataFrame] = [exact_df.select(["id"] + keys)]
+        matched_statement_entries_dfs: typing.List[polars.DataFrame] = [exact_df.select([polars.col("id_statement_entry").alias("id")] + keys)]
+        finishers = finishers.join(exact_df.select("id"), on = "id", how = "anti")
+        statement_entries = statement_entries.join(exact_df.select(polars.col("id_statement_entry").alias("id")), on = "id", how = "anti")
+
+        # Pair exact amounts of near dates (finishers are linked to the date of their statement entry)
+        if self.__tolerance_days > 0:
+            window_df: polars.DataFrame = self.match_window(finishers, statement_entries)
+            matched_finishers_dfs.append(window_df.select([polars.col("id")] + keys))
+            matched_statement_entries_dfs.append(window_df.select([polars.col("id_statement_entry").alias("id")] + keys))
+            finishers = finishers.join(window_df.select("id"), on = "id", how = "anti")
+            statement_entries = statement_entries.join(window_df.select(polars.col("id_statement_entry").alias("id")), on = "id", how = "anti")
+
+        # Match combinations of the remaining amounts of every date and type
+        remaining_finishers: typing.Dict[typing.Tuple[typing.Any, ...], polars.DataFrame] = finishers.partition_by(keys, as_dict = True)
+        remaining_statement_entries: typing.Dict[typing.Tuple[typing.Any, ...], polars.DataFrame] = statement_entries.partition_by(keys, as_dict = True)
+        for key, group_finishers in remaining_finishers.items():
+            if key not in remaining_statement_entries:
+                continue
+
+            finisher_ids, statement_entry_ids = self.match_group(
+                list(group_finishers.select(["id", "value"]).iter_rows()),
+                list(remaining_statement_entries[key].select(["id", "value"]).iter_rows())
+            )
+            matched_finishers_dfs.append(group_finishers.filter(polars.col("id").is_in(finisher_ids)).select(["id"] + keys))
+            matched_statement_entries_dfs.append(remaining_statement_entries[key].filter(polars.col("id").is_in(statement_entry_ids)).select(["id"] + keys))
+
+        return (polars.concat(matched_finishers_dfs), polars.concat(matched_statement_entries_dfs))
+
+
+    def match_window(
+            self,
+            finishers: polars.DataFrame,
+            statement_entries: polars.DataFrame
+        ) -> polars.DataFrame:
+        if finishers.is_empty() or statement_entries.is_empty():
+            return polars.DataFrame(schema = {"id": polars.Int64, "id_statement_entry": polars.Int64, "date": polars.Date, "type_id": polars.String})
+
+        # Index dates by business days (calendar covers the given dates if none was given)
+        dates: polars.Series = polars.concat([finishers.get_column("date"), statement_entries.get_column("date")])
+        calendar: BusinessCalendar.BusinessCalendar = self.__calendar or BusinessCalendar.BusinessCalendar(dates.min().year, dates.max().year)
+        sort_columns: typing.List[str] = ["type_id", "value", "index"]
+        sorted_finishers: polars.DataFrame = finishers.with_columns(
+            calendar.business_day_indexes(finishers.get_column("date")).alias("index")
+        ).sort(sort_columns)
+        sorted_statement_entries: polars.DataFrame = statement_entries.with_columns(
+            calendar.business_day_indexes(statement_entries.get_column("date")).alias("index")
+        ).sort(sort_columns)
+
+        # Two pointers over both sides sorted by type, amount and business day (a finisher too early for an entry is too early for every next one)
+        finisher_keys: typing.List[typing.Tuple[typing.Any, ...]] = list(sorted_finishers.select(sort_columns).iter_rows())
+        statement_entry_keys: typing.List[typing.Tuple[typing.Any, ...]] = list(sorted_statement_entries.select(sort_columns).iter_rows())
+        finisher_indexes, statement_entry_indexes = self.__pair_window(finisher_keys, statement_entry_keys)
+
+        return polars.concat(
+            [
+                sorted_finishers.select("id")[finisher_indexes],
+                sorted_statement_entries.select(
+                    [
+                        polars.col("id").alias("id_statement_entry"),
+                        polars.col("date").alias("date"),
+                        polars.col("type_id").alias("type_id"),
+                    ]
+                )[statement_entry_indexes],
+            ],
+            how = "horizontal"
+        )
+
+
+    def match_group(
+            self,
+            finishers: typing.List[typing.Tuple[int, int]],
+            statement_entries: typing.List[typing.Tuple[int, int]]
+        ) -> typing.Tuple[typing.List[int], typing.List[int]]:
+        return self.__match_subsets(finishers, statement_entries, time.perf_counter() + self.__time_budget)
+
+
+    def find_subset(
+            self,
+            items: typing.List[typing.Tuple[int, int]],
+            target: int,
+            deadline: float
+        ) -> typing.Optional[typing.List[int]]:
+        if not items or target == 0 or time.perf_counter() > deadline:
+            return None
+
+        # Whole group paid at once (common for acquirers depositing a day of sales in one entry)
+        if sum(value for _, value in items) == target:
+            return [item_id for item_id, _ in items]
+
+        # Bound the search to the amounts able to take part in the sum (largest amounts first)
+        if target > 0 and all(value >= 0 for _, value in items):
+            items = [item for item in items if 0 < item[1] <= target]
+        items = sorted(items, key = lambda x: -abs(x[1]))[:self.__subset_size]
+
+        # Meet in the middle (sums of each half are enumerated and the complement is looked up)
+        half: int = len(items) // 2
+        left_sums: typing.Dict[int, int] = self.__enumerate_sums(items[:half], deadline)
+        right_sums: typing.Dict[int, int] = self.__enumerate_sums(items[half:], deadline)
+
+        mask: typing.Optional[int] = self.__find_complement(left_sums, right_sums, target, half)
+        if mask is None:
+            return None
+
+        return [item_id for index, (item_id, _) in enumerate(items) if mask >> index & 1]
+
+
+    # Hot loops run without checking their annotated locals (arguments are checked by the public methods calling them)
+    @typeguard.suppress_type_checks
+    def __pair_window(
+            self,
+            finisher_keys: typing.List[typing.Tuple[typing.Any, ...]],
+            statement_entry_keys: typing.List[typing.Tuple[typing.Any, ...]]
+        ) -> typing.Tuple[typing.List[int], typing.List[int]]:
+        finisher_indexes: typing.List[int] = []
+        statement_entry_indexes: typing.List[int] = []
+        i: int = 0
+        j: int = 0
+        while i < len(finisher_keys) and j < len(statement_entry_keys):
+            finisher_key: typing.Tuple[typing.Any, ...] = finisher_keys[i]
+            statement_entry_key: typing.Tuple[typing.Any, ...] = statement_entry_keys[j]
+            if finisher_key[:2] == statement_entry_key[:2] and abs(finisher_key[2] - statement_entry_key[2]) <= self.__tolerance_days:
+                finisher_indexes.append(i)
+                statement_entry_indexes.append(j)
+                i += 1
+                j += 1
+            elif finisher_key < statement_entry_key:
+                i += 1
+            else:
+                j += 1
+
+        return (finisher_indexes, statement_entry_indexes)
+
+
+    @typeguard.suppress_type_checks
+    def __match_subsets(
+            self,
+            finishers: typing.List[typing.Tuple[int, int]],
+            statement_entries: typing.List[typing.Tuple[int, int]],
+            deadline: float
+        ) -> typing.Tuple[typing.List[int], typing.List[int]]:
+        finisher_ids: typing.List[int] = []
+        statement_entry_ids: typing.List[int] = []
+
+        # Many finishers paid in a single statement entry (largest entries first, only while entries are the fewer side)
+        for statement_entry_id, value in sorted(statement_entries, key = lambda x: -abs(x[1])):
+            if len(finishers) < 2 or len(finishers) <= len(statement_entries) - len(statement_entry_ids):
+                break
+
+            subset: typing.Optional[typing.List[int]] = self.find_subset(finishers, value, deadline)
+            if subset is None:
+                continue
+
+            finisher_ids.extend(subset)
+            statement_entry_ids.append(statement_entry_id)
+            matched_ids: typing.Set[int] = set(subset)
+            finishers = [finisher for finisher in finishers if finisher[0] not in matched_ids]
+
+        # Single finisher split across many statement entries (only while finishers are the fewer side)
+        matched_ids: typing.Set[int] = set(statement_entry_ids)
+        finishers_count: int = len(finisher_ids)
+        statement_entries = [statement_entry for statement_entry in statement_entries if statement_entry[0] not in matched_ids]
+        for finisher_id, value in sorted(finishers, key = lambda x: -abs(x[1])):
+            if len(statement_entries) < 2 or len(statement_entries) <= len(finishers) - (len(finisher_ids) - finishers_count):
+                break
+
+            subset: typing.Optional[typing.List[int]] = self.find_subset(statement_entries, value, deadline)
+            if subset is None:
+                continue
+
+            statement_entry_ids.extend(subset)
+            finisher_ids.append(finisher_id)
+            matched_ids: typing.Set[int] = set(subset)
+            statement_entries = [statement_entry for statement_entry in statement_entries if statement_entry[0] not in matched_ids]
+
+        return (finisher_ids, statement_entry_ids)
+
+
+    @typeguard.suppress_type_checks
+    def __find_complement(
+            self,
+            left_sums: typing.Dict[int, int],
+            right_sums: typing.Dict[int, int],
+            target: int,
+            half: int
+        ) -> typing.Optional[int]:
+        # First non empty pair of subsets (as a bit mask of indexes) whose sums reach the target
+        for right_sum, right_mask in right_sums.items():
+            left_mask: typing.Optional[int] = left_sums.get(target - right_sum)
+            if left_mask is None or not (left_mask or right_mask):
+                continue
+
+            return left_mask | (right_mask << half)
+
+        return None
+
+
+    @typeguard.suppress_type_checks
+    def __enumerate_sums(
+            self,
+            items: typing.List[typing.Tuple[int, int]],
+            deadline: float
+        ) -> typing.Dict[int, int]:
+        sums: typing.Dict[int, int] = {0: 0}
+
+        # Keep the first subset (as a bit mask of indexes) reaching each sum (stop enumerating once out of time)
+        for index, (_, value) in enumerate(items):
+            if time.perf_counter() > deadline:
+                break
+
+            for current_sum, mask in list(sums.items()):
+                sums.setdefault(current_sum + value, mask | (1 << index))
+
+        return sums
\ No newline at end of file
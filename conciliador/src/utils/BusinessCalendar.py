@@ -0,0 +1,133 @@
+import datetime
+import holidays
+import holidays.countries
+import polars
+import typeguard
+import typing
+
+
+@typeguard.typechecked
+class BusinessCalendar():
+
+    def __init__(
+            self,
+            start_year: int,
+            end_year: int,
+            subdivision: typing.Optional[str] = None
+        ) -> None:
+        if start_year > end_year:
+            raise ValueError("Start year must not be after end year.")
+
+        # Following year included to resolve the last days of the range
+        self.__holidays: holidays.countries.brazil.BR = holidays.countries.brazil.BR(
+            years = range(start_year, end_year + 2),
+            subdiv = subdivision
+        )
+
+        # Precompute next business day of every day in range (business days point to themselves)
+        dates: polars.Series = polars.date_range(
+            datetime.date(start_year, 1, 1),
+            datetime.date(end_year + 1, 1, 31),
+            interval = "1d",
+            eager = True
+        )
+        self.__days: polars.DataFrame = polars.DataFrame(
+            {
+                "date": dates,
+                "business_date": [date if self.__holidays.is_working_day(date) else None for date in dates.to_list()],
+            },
+            schema = {"date": polars.Date, "business_date": polars.Date}
+        ).with_columns(
+            polars.col("business_date").backward_fill()
+        ).filter(
+            polars.col("date") <= datetime.date(end_year, 12, 31)
+        )
+        self.__next_business_days: typing.Dict[datetime.date, datetime.date] = dict(self.__days.iter_rows())
+        self.__start_date: datetime.date = datetime.date(start_year, 1, 1)
+
+
+    def is_business_day(
+            self,
+            date: datetime.date
+        ) -> bool:
+        return self.next_business_day(date) == date
+
+
+    def next_business_day(
+            self,
+            date: datetime.date
+        ) -> datetime.date:
+        if date in self.__next_business_days:
+            return self.__next_business_days[date]
+
+        # Step through days out of the precomputed range
+        business_date: datetime.date = date
+        while not self.__holidays.is_working_day(business_date):
+            business_date += datetime.timedelta(days = 1)
+
+        self.__next_business_days[date] = business_date
+        return business_date
+
+
+    def shift_business_days(
+            self,
+            date: datetime.date,
+            days: int
+        ) -> datetime.date:
+        # Step over days (backwards if negative) until the given count of business days is passed
+        step: datetime.timedelta = datetime.timedelta(days = 1 if days >= 0 else -1)
+        remaining: int = abs(days)
+        while remaining > 0:
+            date += step
+            if self.is_business_day(date):
+                remaining -= 1
+
+        return date
+
+
+    def next_business_days(
+            self,
+            dates: polars.Series
+        ) -> polars.Series:
+        dates_df: polars.DataFrame = dates.cast(polars.Date).alias("date").to_frame()
+
+        # Extend lookup with dates out of the precomputed range
+        missing_dates: typing.List[datetime.date] = dates_df.join(
+            self.__days,
+            on = "date",
+            how = "anti"
+        ).get_column("date").drop_nulls().unique().to_list()
+        if missing_dates:
+            self.__days = polars.concat(
+                [
+                    self.__days,
+                    polars.DataFrame(
+                        {
+                            "date": missing_dates,
+                            "business_date": [self.next_business_day(date) for date in missing_dates],
+                        },
+                        schema = {"date": polars.Date, "business_date": polars.Date}
+                    ),
+                ]
+            )
+
+        return dates_df.join(
+            self.__days,
+            on = "date",
+            how = "left",
+            maintain_order = "left"
+        ).get_column("business_date").alias(dates.name)
+
+
+    def business_day_indexes(
+            self,
+            dates: polars.Series
+        ) -> polars.Series:
+        # Count business days since the start of the calendar (non business days share the index of the next one)
+        return polars.select(
+            polars.business_day_count(
+                polars.lit(self.__start_date),
+                dates.cast(polars.Date),
+                holidays = list(self.__holidays.keys())
+            ).cast(polars.Int64)
+        ).to_series().alias(dates.name)
\ No newline at end of file
@@ -0,0 +1,68 @@
+import pathlib
+import pytest
+import typing
+
+from conciliador.src import Conciliador
+from conciliador.src.database import Database
+
+
+INSERTIONS_PATH = pathlib.Path(__file__).parent.parent / "conciliador" / "db" / "db_insertions.json"
+
+
+@pytest.fixture
+def database_path(tmp_path: pathlib.Path) -> pathlib.Path:
+    return tmp_path / "database.db"
+
+
+@pytest.fixture
+def open_database(tmp_path: pathlib.Path, database_path: pathlib.Path):
+    def open_database(database_uri: typing.Optional[str] = None, **kwargs) -> Database.Database:
+        return Database.Database(database_uri or f"sqlite:///{database_path}", tmp_path / "database.log", INSERTIONS_PATH, **kwargs)
+
+    return open_database
+
+
+@pytest.fixture
+def open_conciliador(tmp_path: pathlib.Path, database_path: pathlib.Path):
+    def open_conciliador(database_uri: typing.Optional[str] = None) -> Conciliador.Conciliador:
+        return Conciliador.Conciliador(database_uri or f"sqlite:///{database_path}", tmp_path / "database.log", INSERTIONS_PATH)
+
+    return open_conciliador
+
+
+@pytest.fixture
+def conciliador(open_conciliador) -> Conciliador.Conciliador:
+    return open_conciliador()
+
+
+@pytest.fixture
+def write_statement(tmp_path: pathlib.Path):
+    def write_statement(name: str, rows: typing.List[typing.Tuple[str, str, str]]) -> pathlib.Path:
+        path: pathlib.Path = tmp_path / "in" / "statements" / name
+        path.parent.mkdir(parents = True, exist_ok = True)
+        path.write_text("\n".join(["Data;Histórico;Valor"] + [";".join(row) for row in rows]) + "\n", encoding = "cp1252")
+        return path
+
+    return write_statement
+
+
+@pytest.fixture
+def write_report(tmp_path: pathlib.Path):
+    def write_report(name: str, sections: typing.List[typing.Tuple[str, str, str, typing.List[typing.Tuple[str, str]]]], newline: str = "\n", has_trailing_newline: bool = True) -> pathlib.Path:
+        path: pathlib.Path = tmp_path / "in" / "reports" / name
+        path.parent.mkdir(parents = True, exist_ok = True)
+
+        # Sections of an employee with its finishers (cash totals are read from the "Dinheiro" column) closed by their total
+        lines: typing.List[str] = [f"HEADER {index}" for index in range(5)]
+        for employee, start_time, end_time, finishers in sections:
+            lines.append(f"{employee};x;x;{start_time} x;{end_time} x;x;a;b;c;d;e")
+            lines.append(";Finalizadora;x;x;Total;Dinheiro;a;b;c;d;e")
+            lines.extend([f";{finisher};x;x;{total};{total};a;b;c;d;e" for finisher, total in finishers])
+            lines.append(";TOTAL;x;x;0,00;0,00;a;b;c;d;e")
+
+        # A trailing line break counts as the last footer row
+        lines.extend(["FOOTER 0", "FOOTER 1"] if has_trailing_newline else ["FOOTER 0", "FOOTER 1", "FOOTER 2"])
+        path.write_bytes((newline.join(lines) + (newline if has_trailing_newline else "")).encode("cp1252"))
+        return path
+
+    return write_report
\ No newline at end of file
@@ -0,0 +1,149 @@
+BEGIN TRANSACTION;
+CREATE TABLE finisher (
+	id INTEGER NOT NULL, 
+	report_id INTEGER NOT NULL, 
+	type_id VARCHAR, 
+	verification_id INTEGER, 
+	name VARCHAR NOT NULL, 
+	value INTEGER NOT NULL, 
+	payment_date DATE, 
+	payment_value INTEGER, 
+	PRIMARY KEY (id), 
+	CONSTRAINT unique_report_id_name UNIQUE (report_id, name), 
+	UNIQUE (id), 
+	FOREIGN KEY(report_id) REFERENCES report (id), 
+	FOREIGN KEY(type_id) REFERENCES type (id), 
+	FOREIGN KEY(verification_id) REFERENCES verification (id)
+);
+CREATE TABLE finisher_pattern (
+	id INTEGER NOT NULL, 
+	type_id VARCHAR, 
+	pattern VARCHAR NOT NULL, 
+	payment_interval INTEGER, 
+	PRIMARY KEY (id), 
+	UNIQUE (id), 
+	FOREIGN KEY(type_id) REFERENCES type (id), 
+	UNIQUE (pattern)
+);
+INSERT INTO "finisher_pattern" VALUES(1,'cash','^RECEBIMENTO DINHEIRO(?!.*RECEITAS)$',0);
+INSERT INTO "finisher_pattern" VALUES(2,'revenue','^.*RECEITAS$',NULL);
+INSERT INTO "finisher_pattern" VALUES(3,'usage_and_consumption','^USO E CONSUMO$',NULL);
+INSERT INTO "finisher_pattern" VALUES(4,'installment','^PRAZO$',NULL);
+INSERT INTO "finisher_pattern" VALUES(5,'pix','^PIX.*$',0);
+INSERT INTO "finisher_pattern" VALUES(6,'card.credit.visa','^VISA CR[EÉ]DITO$',30);
+INSERT INTO "finisher_pattern" VALUES(7,'card.credit.master','^MASTER CR[EÉ]DITO$',30);
+INSERT INTO "finisher_pattern" VALUES(8,'card.credit.elo','^ELO CR[EÉ]DITO$',30);
+INSERT INTO "finisher_pattern" VALUES(9,'card.credit.hipercard','^HIPER$',30);
+INSERT INTO "finisher_pattern" VALUES(10,'card.credit.amex','^.*AMEX$',30);
+INSERT INTO "finisher_pattern" VALUES(11,'card.credit.visa','^PR[EÉ][ -]?PAGO VISA CR[EÉ]DITO$',2);
+INSERT INTO "finisher_pattern" VALUES(12,'card.credit.master','^PR[EÉ][ -]?PAGO MASTER CR[EÉ]DITO$',2);
+INSERT INTO "finisher_pattern" VALUES(13,'card.credit.elo','^PR[EÉ][ -]?PAGO ELO CR[EÉ]DITO$',2);
+INSERT INTO "finisher_pattern" VALUES(14,'card.debit.visa','^VISA D[EÉ]BITO$',1);
+INSERT INTO "finisher_pattern" VALUES(15,'card.debit.master','^MASTER(?:CARD)? D[EÉ]BITO$',1);
+INSERT INTO "finisher_pattern" VALUES(16,'card.debit.elo','^ELO D[EÉ]BITO$',1);
+INSERT INTO "finisher_pattern" VALUES(17,'card.debit.visa','^PR[EÉ][ -]?PAGO VISA D[EÉ]BITO$',1);
+INSERT INTO "finisher_pattern" VALUES(18,'card.debit.master','^PR[EÉ][ -]?PAGO MASTER(?:CARD)? D[EÉ]BITO$',1);
+INSERT INTO "finisher_pattern" VALUES(19,'card.debit.elo','^PR[EÉ][ -]?PAGO ELO D[EÉ]BITO$',1);
+CREATE TABLE rate (
+	id INTEGER NOT NULL, 
+	type_id VARCHAR NOT NULL, 
+	rate DOUBLE NOT NULL, 
+	start_time DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	CONSTRAINT unique_start_time_type_id UNIQUE (start_time, type_id), 
+	UNIQUE (id), 
+	FOREIGN KEY(type_id) REFERENCES type (id)
+);
+INSERT INTO "rate" VALUES(1,'card.credit.visa',0.0128,'2025-03-19 00:00:00.000000');
+INSERT INTO "rate" VALUES(2,'card.credit.master',0.0128,'2025-03-19 00:00:00.000000');
+INSERT INTO "rate" VALUES(3,'card.credit.elo',0.0178,'2025-03-19 00:00:00.000000');
+INSERT INTO "rate" VALUES(4,'card.credit.hipercard',0.0178,'2025-03-19 00:00:00.000000');
+INSERT INTO "rate" VALUES(5,'card.credit.amex',0.0178,'2025-03-19 00:00:00.000000');
+INSERT INTO "rate" VALUES(6,'card.debit.visa',0.0065,'2025-03-19 00:00:00.000000');
+INSERT INTO "rate" VALUES(7,'card.debit.master',0.0065,'2025-03-19 00:00:00.000000');
+INSERT INTO "rate" VALUES(8,'card.debit.elo',0.0115,'2025-03-19 00:00:00.000000');
+CREATE TABLE report (
+	id INTEGER NOT NULL, 
+	shift INTEGER NOT NULL, 
+	employee VARCHAR NOT NULL, 
+	start_time DATETIME NOT NULL, 
+	end_time DATETIME NOT NULL, 
+	PRIMARY KEY (id), 
+	UNIQUE (id), 
+	UNIQUE (start_time), 
+	UNIQUE (end_time)
+);
+CREATE TABLE statement (
+	id INTEGER NOT NULL, 
+	date DATE NOT NULL, 
+	PRIMARY KEY (id), 
+	UNIQUE (id), 
+	UNIQUE (date)
+);
+CREATE TABLE statement_entry (
+	id INTEGER NOT NULL, 
+	statement_id INTEGER NOT NULL, 
+	type_id VARCHAR, 
+	verification_id INTEGER, 
+	name VARCHAR NOT NULL, 
+	value INTEGER NOT NULL, 
+	PRIMARY KEY (id), 
+	UNIQUE (id), 
+	FOREIGN KEY(statement_id) REFERENCES statement (id), 
+	FOREIGN KEY(type_id) REFERENCES type (id), 
+	FOREIGN KEY(verification_id) REFERENCES verification (id)
+);
+CREATE TABLE statement_entry_pattern (
+	id INTEGER NOT NULL, 
+	type_id VARCHAR, 
+	pattern VARCHAR, 
+	value_pattern VARCHAR NOT NULL, 
+	PRIMARY KEY (id), 
+	CONSTRAINT unique_pattern_value_pattern UNIQUE (pattern, value_pattern), 
+	UNIQUE (id), 
+	FOREIGN KEY(type_id) REFERENCES type (id)
+);
+INSERT INTO "statement_entry_pattern" VALUES(1,'cash','^DEPÓSITO.*$','^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(2,'pix','^PIX CREDITO(?!.*TRR IVAI COMERCIO DE COMB).*$|^TRANSFERENCIA.*$','^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(3,'card.credit.visa','^VENDAS CARTAO TIPO CREDITO.*CIELO-VISA.*$','^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(4,'card.credit.master','^VENDAS CARTAO TIPO CREDITO.*CIELO-MASTER.*$','^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(5,'card.credit.elo','^VENDAS CARTAO TIPO CREDITO.*CIELO-ELO.*$','^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(6,'card.credit.hipercard','^VENDAS CARTAO TIPO CREDITO.*CIELO-HIPERCA.*$','^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(7,'card.credit.amex','^VENDAS CARTAO TIPO CREDITO.*CIELO-AMERICA.*$','^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(8,'card.debit.visa','^VENDAS CARTAO TIPO DEBITO.*CIELO-VISA.*$','^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(9,'card.debit.master','^VENDAS CARTAO TIPO DEBITO.*CIELO-MAESTRO.*$','^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(10,'card.debit.elo','^VENDAS CARTAO TIPO DEBITO.*CIELO-ELO.*$','^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(11,'income',NULL,'^\d+$');
+INSERT INTO "statement_entry_pattern" VALUES(12,'outcome',NULL,'^-\d+$');
+CREATE TABLE type (
+	id VARCHAR NOT NULL, 
+	PRIMARY KEY (id), 
+	UNIQUE (id)
+);
+INSERT INTO "type" VALUES('cash');
+INSERT INTO "type" VALUES('revenue');
+INSERT INTO "type" VALUES('usage_and_consumption');
+INSERT INTO "type" VALUES('installment');
+INSERT INTO "type" VALUES('pix');
+INSERT INTO "type" VALUES('card.debit.visa');
+INSERT INTO "type" VALUES('card.debit.master');
+INSERT INTO "type" VALUES('card.debit.elo');
+INSERT INTO "type" VALUES('card.credit.visa');
+INSERT INTO "type" VALUES('card.credit.master');
+INSERT INTO "type" VALUES('card.credit.elo');
+INSERT INTO "type" VALUES('card.credit.hipercard');
+INSERT INTO "type" VALUES('card.credit.amex');
+INSERT INTO "type" VALUES('income');
+INSERT INTO "type" VALUES('outcome');
+CREATE TABLE verification (
+	id INTEGER NOT NULL, 
+	type_id VARCHAR NOT NULL, 
+	date DATE NOT NULL, 
+	verified_on DATETIME NOT NULL, 
+	is_verified BOOLEAN NOT NULL, 
+	PRIMARY KEY (id), 
+	CONSTRAINT unique_type_id_date UNIQUE (type_id, date), 
+	UNIQUE (id), 
+	FOREIGN KEY(type_id) REFERENCES type (id)
+);
+COMMIT;
\ No newline at end of file
@@ -0,0 +1,85 @@
+import datetime
+import polars
+import time
+
+from conciliador.src.matchers import AmountMatcher
+
+
+def build_rows(rows):
+    return polars.DataFrame(rows, schema = {"id": polars.Int64, "date": polars.Date, "type_id": polars.String, "value": polars.Int64}, orient = "row")
+
+
+def test_window_matches_pair_near_business_days():
+    # Friday and the next Monday are one business day apart
+    finishers = build_rows([(1, datetime.date(2025, 3, 14), "cash", 10000), (2, datetime.date(2025, 3, 10), "cash", 20000)])
+    statement_entries = build_rows([(1, datetime.date(2025, 3, 17), "cash", 10000), (2, datetime.date(2025, 3, 17), "cash", 20000)])
+
+    matched_finishers, matched_statement_entries = AmountMatcher.AmountMatcher(tolerance_days = 1).match(finishers, statement_entries)
+    assert matched_finishers.rows() == [(1, datetime.date(2025, 3, 17), "cash")]
+    assert matched_statement_entries.rows() == [(1, datetime.date(2025, 3, 17), "cash")]
+
+    # Without tolerance only the same date is matched
+    matched_finishers, matched_statement_entries = AmountMatcher.AmountMatcher().match(finishers, statement_entries)
+    assert matched_finishers.is_empty() and matched_statement_entries.is_empty()
+
+
+def test_match_reads_dates_across_the_tolerance(conciliador):
+    database = conciliador._Conciliador__database
+    (report_id,) = database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 3, 14, 6), "end_time": datetime.datetime(2025, 3, 14, 14)})
+    database.insert("finisher", {"report_id": report_id, "name": "RECEBIMENTO DINHEIRO", "value": 10000})
+    (statement_id,) = database.insert("statement", {"date": datetime.date(2025, 3, 17)})
+    database.insert("statement_entry", {"statement_id": statement_id, "name": "DEPÓSITO", "value": 10000})
+
+    # The finisher of the Friday before the range is matched to the entry of its Monday
+    matched_df: polars.DataFrame = conciliador.match(datetime.date(2025, 3, 17), datetime.date(2025, 3, 17), tolerance_days = 1)
+    assert matched_df.select(["date", "type_id", "matched_finishers_count", "matched_statement_entries_count"]).rows() == [(datetime.date(2025, 3, 17), "cash", 1, 1)]
+
+    # Matches whose date is out of the range are left unlinked
+    database.update("finisher", {"verification_id": None}, id = lambda x: x.is_not(None))
+    database.update("statement_entry", {"verification_id": None}, id = lambda x: x.is_not(None))
+    matched_df = conciliador.match(datetime.date(2025, 3, 14), datetime.date(2025, 3, 14), tolerance_days = 1)
+    assert matched_df.select(["date", "matched_finishers_count", "matched_statement_entries_count"]).rows() == [(datetime.date(2025, 3, 14), 0, 0)]
+
+def test_exact_matches_pair_repeated_amounts_by_occurrence():
+    finishers = build_rows([(1, datetime.date(2025, 3, 10), "cash", 500), (2, datetime.date(2025, 3, 10), "cash", 500), (3, datetime.date(2025, 3, 10), "pix", 500)])
+    statement_entries = build_rows([(7, datetime.date(2025, 3, 10), "cash", 500), (8, datetime.date(2025, 3, 11), "cash", 500)])
+
+    # Amounts only pair within the same date and type
+    matched_finishers, matched_statement_entries = AmountMatcher.AmountMatcher().match(finishers, statement_entries)
+    assert matched_finishers.get_column("id").to_list() == [1]
+    assert matched_statement_entries.get_column("id").to_list() == [7]
+
+
+def test_subset_matches_pair_sums_of_either_side():
+    date = datetime.date(2025, 3, 10)
+
+    # Many finishers paid in a single statement entry
+    finishers = build_rows([(1, date, "card", 300), (2, date, "card", 450), (3, date, "card", 250), (4, date, "card", 999)])
+    statement_entries = build_rows([(1, date, "card", 1000)])
+    matched_finishers, matched_statement_entries = AmountMatcher.AmountMatcher().match(finishers, statement_entries)
+    assert sorted(matched_finishers.get_column("id").to_list()) == [1, 2, 3]
+    assert matched_statement_entries.get_column("id").to_list() == [1]
+
+    # Single finisher split across many statement entries
+    finishers = build_rows([(1, date, "card", 1000)])
+    statement_entries = build_rows([(1, date, "card", 600), (2, date, "card", 400), (3, date, "card", 50)])
+    matched_finishers, matched_statement_entries = AmountMatcher.AmountMatcher().match(finishers, statement_entries)
+    assert matched_finishers.get_column("id").to_list() == [1]
+    assert sorted(matched_statement_entries.get_column("id").to_list()) == [1, 2]
+
+
+def test_subset_search_stops_at_the_time_budget():
+    items = [(index, value) for index, value in enumerate([3, 5, 7, 11, 13, 17])]
+
+    # Searches past their deadline find nothing
+    matcher: AmountMatcher.AmountMatcher = AmountMatcher.AmountMatcher()
+    assert matcher.find_subset(items, 20, time.perf_counter() + 60) is not None
+    assert matcher.find_subset(items, 20, time.perf_counter() - 1) is None
+
+    # No budget leaves combinations unmatched while exact amounts still pair
+    date = datetime.date(2025, 3, 10)
+    finishers = build_rows([(1, date, "card", 300), (2, date, "card", 700), (3, date, "card", 50)])
+    statement_entries = build_rows([(1, date, "card", 1000), (2, date, "card", 50)])
+    matched_finishers, matched_statement_entries = AmountMatcher.AmountMatcher(time_budget = 0.0).match(finishers, statement_entries)
+    assert matched_finishers.get_column("id").to_list() == [3]
+    assert matched_statement_entries.get_column("id").to_list() == [2]
\ No newline at end of file
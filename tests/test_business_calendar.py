@@ -0,0 +1,35 @@
+import datetime
+import polars
+
+from conciliador.src.utils import BusinessCalendar
+
+
+def test_scalar_lookups_skip_weekends_and_holidays():
+    calendar: BusinessCalendar.BusinessCalendar = BusinessCalendar.BusinessCalendar(2025, 2025)
+
+    # Tiradentes (Monday 2025-04-21) follows a weekend
+    assert calendar.next_business_day(datetime.date(2025, 4, 19)) == datetime.date(2025, 4, 22)
+    assert calendar.next_business_day(datetime.date(2025, 4, 22)) == datetime.date(2025, 4, 22)
+    assert not calendar.is_business_day(datetime.date(2025, 4, 21))
+
+    # Dates out of the precomputed range are stepped through
+    assert calendar.next_business_day(datetime.date(2030, 1, 1)) == datetime.date(2030, 1, 2)
+    assert calendar.next_business_day(datetime.date(2025, 12, 31)) == datetime.date(2025, 12, 31)
+
+    # Business days shift in both directions
+    assert calendar.shift_business_days(datetime.date(2025, 4, 17), 1) == datetime.date(2025, 4, 22)
+    assert calendar.shift_business_days(datetime.date(2025, 4, 22), -1) == datetime.date(2025, 4, 17)
+
+
+def test_vectorized_lookups_match_scalar_ones():
+    calendar: BusinessCalendar.BusinessCalendar = BusinessCalendar.BusinessCalendar(2025, 2025)
+    dates: polars.Series = polars.Series("date", [datetime.date(2025, 4, 19), None, datetime.date(2030, 1, 1), datetime.date(2025, 4, 19), datetime.date(2024, 12, 25)])
+
+    # Order, nulls and repeated dates are kept (dates out of range extend the lookup)
+    next_business_days: polars.Series = calendar.next_business_days(dates)
+    assert next_business_days.name == "date"
+    assert next_business_days.to_list() == [None if date is None else calendar.next_business_day(date) for date in dates.to_list()]
+
+    # Non business days share the index of the next business day
+    indexes = calendar.business_day_indexes(polars.Series([datetime.date(2025, 4, 17), datetime.date(2025, 4, 19), datetime.date(2025, 4, 21), datetime.date(2025, 4, 22)])).to_list()
+    assert indexes[1] == indexes[2] == indexes[3] == indexes[0] + 1
\ No newline at end of file
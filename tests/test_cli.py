@@ -0,0 +1,50 @@
+import datetime
+import importlib
+import pytest
+import sys
+import typing
+
+
+cli = importlib.import_module("conciliador.__main__")
+
+
+class FakeConciliador():
+
+    calls: typing.List[typing.Tuple[str, typing.Dict[str, typing.Any]]] = []
+
+    def __init__(self, **kwargs: typing.Any) -> None:
+        pass
+
+    def __getattr__(self, name: str) -> typing.Callable[..., None]:
+        return lambda **kwargs: FakeConciliador.calls.append((name, kwargs))
+
+
+@pytest.fixture
+def run(monkeypatch):
+    monkeypatch.setattr(cli.dotenv, "find_dotenv", lambda **kwargs: "")
+    monkeypatch.setattr(cli.dotenv, "load_dotenv", lambda *args, **kwargs: True)
+    monkeypatch.setattr(cli.Conciliador, "Conciliador", FakeConciliador)
+    monkeypatch.delenv("START_DATE", raising = False)
+    monkeypatch.delenv("END_DATE", raising = False)
+    FakeConciliador.calls = []
+
+    def run(*argv: str) -> typing.Tuple[str, typing.Dict[str, typing.Any]]:
+        monkeypatch.setattr(sys, "argv", ["conciliador", *argv])
+        cli.main()
+        return FakeConciliador.calls[-1]
+
+    return run
+
+
+def test_reclassify_defaults_to_all_dates(run, monkeypatch):
+    monkeypatch.setenv("START_DATE", "2025-01-01")
+    assert run("reclassify") == ("reclassify", {"start_date": None, "end_date": None})
+
+
+def test_reclassify_given_dates(run):
+    assert run("reclassify", "--start-date", "2025-03-01") == ("reclassify", {"start_date": datetime.date(2025, 3, 1), "end_date": None})
+
+
+def test_link_defaults_to_today(run, monkeypatch):
+    monkeypatch.setenv("END_DATE", "2025-12-31")
+    assert run("link") == ("link", {"start_date": datetime.date.today(), "end_date": datetime.date(2025, 12, 31)})
\ No newline at end of file
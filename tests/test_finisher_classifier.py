@@ -0,0 +1,75 @@
+import polars
+import re
+
+from conciliador.src.classifiers import FinisherClassifier
+from conciliador.src.database import Database
+from conciliador.src.utils import BusinessCalendar
+
+
+NAMES = ["RECEBIMENTO DINHEIRO", "VISA DEBITO", "VISA DÉBITO", "ELO DÉBITO", "MASTER CRÉDITO", "VISA CRÉDITO", "PIX", "PRAZO", "PRE-PAGO VISA DEBITO", "HIPER", "X AMEX", "DESCONHECIDO", ""]
+
+
+def classify_each_pattern(finisher_patterns, name):
+    # Reference classification trying every pattern in order (last matching pattern wins)
+    type_id = None
+    payment_interval = None
+    for finisher_pattern in finisher_patterns.to_dicts():
+        if re.compile(finisher_pattern["pattern"]).match(name):
+            type_id = finisher_pattern["type_id"]
+            if finisher_pattern["payment_interval"] is not None:
+                payment_interval = finisher_pattern["payment_interval"]
+
+    return (type_id, payment_interval)
+
+
+def build_classifier(finisher_patterns):
+    return FinisherClassifier.FinisherClassifier(
+        finisher_patterns,
+        polars.DataFrame(schema = {"type_id": polars.String, "rate": polars.Float64, "start_time": polars.Datetime("us")}),
+        BusinessCalendar.BusinessCalendar(2025, 2025)
+    )
+
+
+def test_combined_patterns_classify_as_each_pattern(open_database):
+    finisher_patterns: polars.DataFrame = open_database().read("finisher_pattern").rename(lambda column: Database.Database.parse_column_name(column)[1])
+    classifier: FinisherClassifier.FinisherClassifier = build_classifier(finisher_patterns)
+
+    classified_names: polars.DataFrame = classifier.classify_names(polars.Series(NAMES))
+    for name, type_id, payment_interval in classified_names.rows():
+        assert (type_id, payment_interval) == classify_each_pattern(finisher_patterns, name)
+    assert any(type_id is not None for type_id in classified_names.get_column("type_id"))
+
+
+def test_numbered_references_fall_back_to_each_pattern():
+    finisher_patterns: polars.DataFrame = polars.DataFrame(
+        {
+            "pattern": [r"^(\w)\w*\1$", r"^A.*", r"^ABA$"],
+            "type_id": ["repeated", "starts.a", None],
+            "payment_interval": [1, None, 3],
+        },
+        schema = {"pattern": polars.String, "type_id": polars.String, "payment_interval": polars.Int64}
+    )
+    assert FinisherClassifier.FinisherClassifier.combine_patterns([(pattern, None) for pattern in finisher_patterns.get_column("pattern")]) is None
+
+    # Later patterns override the type (even with none) and keep earlier payment intervals unless they have one
+    classifier: FinisherClassifier.FinisherClassifier = build_classifier(finisher_patterns)
+    for name in ["ABA", "ABCA", "AB", "XYX", "XY"]:
+        assert classifier.classify_name(name) == classify_each_pattern(finisher_patterns, name)
+    assert classifier.classify_name("ABCA") == ("starts.a", 1)
+    assert classifier.classify_name("ABA") == (None, 3)
+
+def test_combined_patterns_keep_earlier_payment_intervals():
+    finisher_patterns: polars.DataFrame = polars.DataFrame(
+        {
+            "pattern": [r"^A\w*A$", r"^A.*", r"^ABA$"],
+            "type_id": ["ends.a", "starts.a", None],
+            "payment_interval": [1, None, 3],
+        },
+        schema = {"pattern": polars.String, "type_id": polars.String, "payment_interval": polars.Int64}
+    )
+    assert FinisherClassifier.FinisherClassifier.combine_patterns([(pattern, None) for pattern in finisher_patterns.get_column("pattern")]) is not None
+
+    classifier: FinisherClassifier.FinisherClassifier = build_classifier(finisher_patterns)
+    for name in ["ABA", "ABCA", "AB", "XYX", "XY"]:
+        assert classifier.classify_name(name) == classify_each_pattern(finisher_patterns, name)
+    assert classifier.classify_name("ABCA") == ("starts.a", 1)
\ No newline at end of file
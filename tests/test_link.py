@@ -0,0 +1,155 @@
+import datetime
+import pathlib
+import polars
+import pytest
+import sqlite3
+
+
+def read_rows(conciliador, table_name, columns):
+    return sorted(conciliador._Conciliador__database.read(table_name, columns = columns).rows())
+
+
+def test_dirty_dates_are_unique_and_cleared_by_link(conciliador, write_statement, tmp_path):
+    input: pathlib.Path = tmp_path / "in" / "statements"
+    write_statement("first.csv", [("10/03/2025", "DEPOSITO", "1,00"), ("10/03/2025", "DEPOSITO", "2,00"), ("11/03/2025", "DEPOSITO", "3,00")])
+    conciliador.load_statements(input = input, archive = tmp_path / "archive")
+    assert read_rows(conciliador, "dirty_date", ["dirty_date.date", "dirty_date.type_id"]) == [
+        (datetime.date(2025, 3, 10), "income"),
+        (datetime.date(2025, 3, 11), "income"),
+    ]
+
+    # Changing an already marked date keeps a single row of it
+    conciliador._Conciliador__database.update("statement_entry", {"value": 500}, should_trigger_listeners = True, id = lambda x: x == 1)
+    assert len(read_rows(conciliador, "dirty_date", ["dirty_date.date", "dirty_date.type_id"])) == 2
+
+    # Incremental links replace one verification per changed date and type
+    conciliador.link(is_incremental = True)
+    conciliador._Conciliador__database.update("statement_entry", {"value": 600}, should_trigger_listeners = True, id = lambda x: x == 1)
+    totals_df: polars.DataFrame = conciliador.link(is_incremental = True)
+    assert totals_df.select(["date", "type_id", "statement_entries_value"]).rows() == [(datetime.date(2025, 3, 10), "income", 800)]
+    assert read_rows(conciliador, "dirty_date", ["dirty_date.date"]) == []
+    assert read_rows(conciliador, "verification", ["verification.date", "verification.type_id"]) == [
+        (datetime.date(2025, 3, 10), "income"),
+        (datetime.date(2025, 3, 11), "income"),
+    ]
+
+
+def read_daily_totals(database_path):
+    # Stored daily totals holding rows and the same totals summed again from every row
+    connection: sqlite3.Connection = sqlite3.connect(database_path)
+    stored = connection.execute(
+        "SELECT date, type_id, finishers_gross_value, finishers_net_value, finishers_count, statement_entries_value, statement_entries_count FROM daily_total"
+        " WHERE finishers_count > 0 OR statement_entries_count > 0 ORDER BY date, type_id;"
+    ).fetchall()
+    expected = connection.execute(
+        "SELECT date, type_id, SUM(gross_value), SUM(net_value), SUM(finishers_count), SUM(entries_value), SUM(entries_count) FROM ("
+        " SELECT payment_date AS date, type_id, value AS gross_value, COALESCE(payment_value, 0) AS net_value, 1 AS finishers_count, 0 AS entries_value, 0 AS entries_count"
+        " FROM finisher WHERE payment_date IS NOT NULL AND type_id IS NOT NULL"
+        " UNION ALL SELECT statement.date, statement_entry.type_id, 0, 0, 0, statement_entry.value, 1"
+        " FROM statement_entry JOIN statement ON statement.id = statement_entry.statement_id WHERE statement_entry.type_id IS NOT NULL"
+        ") GROUP BY date, type_id ORDER BY date, type_id;"
+    ).fetchall()
+    connection.close()
+    return (stored, expected)
+
+
+def test_incremental_link_after_update_and_delete(conciliador, database_path):
+    database = conciliador._Conciliador__database
+    (report_id,) = database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 4, 1, 6), "end_time": datetime.datetime(2025, 4, 1, 14)})
+    database.extend("finisher", polars.DataFrame({"report_id": [report_id, report_id], "name": ["RECEBIMENTO DINHEIRO", "VISA CRÉDITO"], "value": [10000, 20000]}))
+    (statement_id,) = database.insert("statement", {"date": datetime.date(2025, 4, 1)})
+    database.extend("statement_entry", polars.DataFrame({"statement_id": [statement_id, statement_id], "name": ["DEPÓSITO", "DEPÓSITO"], "value": [10000, 500]}))
+    stored, expected = read_daily_totals(database_path)
+    assert stored == expected and len(stored) == 2
+
+    conciliador.link(datetime.date(2025, 1, 1), datetime.date(2025, 12, 31))
+    assert read_rows(conciliador, "verification", ["verification.type_id", "verification.is_verified"]) == [("card.credit.visa", False), ("cash", False)]
+
+    # Updated finishers and statement entries only recompute their dates and types (listened columns update through listeners and deletes of rows without cascades skip them)
+    database.update("finisher", {"value": 10500}, name = lambda x: x == "RECEBIMENTO DINHEIRO")
+    database.delete("statement_entry", value = lambda x: x == 500)
+    stored, expected = read_daily_totals(database_path)
+    assert stored == expected
+    totals_df: polars.DataFrame = conciliador.link(is_incremental = True)
+    assert totals_df.select(["type_id", "finishers_value", "statement_entries_value"]).rows() == [("cash", 10500, 10000)]
+    assert read_rows(conciliador, "dirty_date", ["dirty_date.date"]) == []
+
+    # Moved reports move their finishers to new dates
+    database.update("report", {"start_time": datetime.datetime(2025, 4, 2, 6)}, id = lambda x: x == report_id)
+    stored, expected = read_daily_totals(database_path)
+    assert stored == expected and len(stored) == 3
+    conciliador.link(is_incremental = True)
+    assert read_rows(conciliador, "verification", ["verification.date", "verification.type_id"]) == [
+        (datetime.date(2025, 4, 1), "cash"),
+        (datetime.date(2025, 4, 2), "cash"),
+        (datetime.date(2025, 5, 2), "card.credit.visa"),
+    ]
+
+    # Deleted reports and statements leave no daily totals nor verifications
+    database.delete("report", id = lambda x: x == report_id)
+    database.delete("statement", id = lambda x: x == statement_id)
+    stored, expected = read_daily_totals(database_path)
+    assert stored == expected == []
+    conciliador.link(is_incremental = True)
+    assert read_rows(conciliador, "verification", ["verification.date"]) == []
+    assert read_rows(conciliador, "daily_total", ["daily_total.date"]) == []
+
+
+def test_new_daily_totals_start_from_stored_rows(open_database, database_path):
+    database = open_database()
+    (report_id,) = database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 4, 1, 6), "end_time": datetime.datetime(2025, 4, 1, 14)})
+    database.insert("finisher", {"report_id": report_id, "name": "RECEBIMENTO DINHEIRO", "value": 10000})
+
+    # Databases created before daily totals existed
+    connection: sqlite3.Connection = sqlite3.connect(database_path)
+    connection.execute("DROP TABLE daily_total;")
+    connection.close()
+
+    open_database()
+    stored, expected = read_daily_totals(database_path)
+    assert stored == expected and len(stored) == 1
+
+
+def test_listened_writes_refuse_skipping_listeners(open_database):
+    database = open_database()
+    (report_id,) = database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 4, 1, 6), "end_time": datetime.datetime(2025, 4, 1, 14)})
+    (finisher_id,) = database.insert("finisher", {"report_id": report_id, "name": "RECEBIMENTO DINHEIRO", "value": 10000})
+
+    with pytest.raises(Exception, match = "listened columns"):
+        database.update("finisher", {"value": 1}, should_trigger_listeners = False, id = lambda x: x == finisher_id)
+    with pytest.raises(Exception, match = "listened columns"):
+        database.update_rows("finisher", polars.DataFrame({"id": [finisher_id], "value": [1]}))
+    with pytest.raises(Exception, match = "skipping listeners"):
+        database.delete("report", should_trigger_listeners = False, id = lambda x: x == report_id)
+    assert database.read("finisher", columns = ["finisher.value"]).rows() == [(10000,)]
+
+
+def test_incremental_link_without_dirty_dates(conciliador):
+    # Nothing changed since the last link
+    totals_df: polars.DataFrame = conciliador.link(is_incremental = True)
+    assert totals_df.is_empty()
+    assert totals_df.schema["verification_id"] == polars.Int64
+
+def test_reclassify_only_moves_changed_rows(conciliador, database_path):
+    database = conciliador._Conciliador__database
+    for day in [1, 2]:
+        (report_id,) = database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 4, day, 6), "end_time": datetime.datetime(2025, 4, day, 14)})
+        database.insert("finisher", {"report_id": report_id, "name": "RECEBIMENTO DINHEIRO", "value": 10000})
+    conciliador.link(is_incremental = True)
+
+    # Nothing changed since the rows were classified
+    assert conciliador.reclassify() == (0, 0)
+    assert read_rows(conciliador, "dirty_date", ["dirty_date.date"]) == []
+
+    # Names changed behind the listeners are classified again only on their own date
+    connection: sqlite3.Connection = sqlite3.connect(database_path)
+    connection.execute("UPDATE finisher SET name = 'VISA CRÉDITO' WHERE payment_date = '2025-04-02';")
+    connection.commit()
+    connection.close()
+    assert conciliador.reclassify() == (1, 0)
+    assert read_rows(conciliador, "dirty_date", ["dirty_date.date", "dirty_date.type_id"]) == [
+        (datetime.date(2025, 4, 2), "cash"),
+        (datetime.date(2025, 5, 2), "card.credit.visa"),
+    ]
+    stored, expected = read_daily_totals(database_path)
+    assert stored == expected and len(stored) == 2
\ No newline at end of file
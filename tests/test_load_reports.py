@@ -0,0 +1,36 @@
+import datetime
+import pathlib
+import polars
+import pytest
+
+
+def test_overlapping_exports_add_finishers_to_loaded_reports(conciliador, write_report, tmp_path):
+    input: pathlib.Path = tmp_path / "in" / "reports"
+    write_report("first.csv", [("EMPLOYEE", "10/03/2025 06:00:00", "10/03/2025 14:00:00", [("VISA CRÉDITO", "10,00")])])
+    conciliador.load_reports(input = input, archive = tmp_path / "archive")
+
+    # Second export repeats the first report with one more finisher (and a changed value of a loaded one) and adds another report
+    (input / "first.csv").unlink()
+    write_report("second.csv", [
+        ("EMPLOYEE", "10/03/2025 06:00:00", "10/03/2025 14:00:00", [("VISA CRÉDITO", "12,00"), ("ELO DÉBITO", "5,00")]),
+        ("EMPLOYEE", "11/03/2025 06:00:00", "11/03/2025 14:00:00", [("VISA CRÉDITO", "10,00")]),
+    ])
+    conciliador.load_reports(input = input, archive = tmp_path / "archive")
+
+    database = conciliador._Conciliador__database
+    assert database.read("report", columns = ["report.id"]).height == 2
+    finishers: polars.DataFrame = database.read("finisher", columns = ["finisher.report_id", "finisher.name", "finisher.value"])
+    assert sorted(finishers.rows()) == [(1, "ELO DÉBITO", 500), (1, "VISA CRÉDITO", 1000), (2, "VISA CRÉDITO", 1000)]
+    assert database.read("ingested_file", columns = ["ingested_file.name"]).height == 2
+
+
+def test_extend_all_writes_every_table_or_none(open_database):
+    database = open_database()
+
+    def failing_finishers(keys):
+        raise ValueError("broken finishers")
+
+    reports: polars.DataFrame = polars.DataFrame({"shift": [0], "employee": ["EMPLOYEE"], "start_time": [datetime.datetime(2025, 3, 10, 6)], "end_time": [datetime.datetime(2025, 3, 10, 14)]})
+    with pytest.raises(Exception, match = "broken finishers"):
+        database.extend_all([("report", lambda keys: reports), ("finisher", failing_finishers)])
+    assert database.read("report", columns = ["report.id"]).is_empty()
\ No newline at end of file
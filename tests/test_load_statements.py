@@ -0,0 +1,45 @@
+import pathlib
+import polars
+
+from conciliador.src.database.join import Join, JoinTypeEnum
+
+
+def test_overlapping_exports_skip_loaded_entries(conciliador, write_statement, tmp_path):
+    input: pathlib.Path = tmp_path / "in" / "statements"
+    write_statement("first.csv", [("10/03/2025", "DEPOSITO", "1,00"), ("10/03/2025", "TARIFA", "-2,00")])
+    conciliador.load_statements(input = input, archive = tmp_path / "archive")
+
+    # Second export repeats the first day and adds one more entry to it
+    (input / "first.csv").unlink()
+    write_statement("second.csv", [("10/03/2025", "DEPOSITO", "1,00"), ("10/03/2025", "TARIFA", "-2,00"), ("10/03/2025", "TARIFA", "-2,00"), ("11/03/2025", "DEPOSITO", "3,00")])
+    conciliador.load_statements(input = input, archive = tmp_path / "archive")
+
+    statement_entries: polars.DataFrame = conciliador._Conciliador__database.read(
+        "statement_entry",
+        columns = ["statement_entry.statement_id", "statement_entry.name", "statement_entry.value"]
+    )
+    assert sorted(statement_entries.rows()) == [(1, "DEPOSITO", 100), (1, "TARIFA", -200), (1, "TARIFA", -200), (2, "DEPOSITO", 300)]
+
+def read_statement_entries(conciliador):
+    return sorted(conciliador._Conciliador__database.read(
+        "statement",
+        columns = ["statement.date", "statement_entry.name", "statement_entry.value", "statement_entry.type_id"],
+        joins = [
+            Join.Join("statement", "statement_entry", lambda x, y: x.id == y.statement_id, JoinTypeEnum.JoinTypeEnum.INNER),
+        ]
+    ).rows())
+
+
+def test_lazy_and_eager_loads_are_equal(open_conciliador, write_statement, tmp_path):
+    input: pathlib.Path = tmp_path / "in" / "statements"
+    write_statement("first.csv", [("10/03/2025", "DEPÓSITO", "1.000,00"), ("10/03/2025", "TARIFA", "-2,00"), ("11/03/2025", "PIX CREDITO: FULANO", "12,34")])
+    write_statement("second.csv", [("11/03/2025", "VENDAS CARTAO TIPO DEBITO 123 CIELO-VISA", "50,00"), ("12/03/2025", "DEPÓSITO", "3,00")])
+
+    eager_conciliador = open_conciliador(f"sqlite:///{tmp_path / 'eager.db'}")
+    eager_conciliador.load_statements(input = input, archive = tmp_path / "archive")
+    lazy_conciliador = open_conciliador(f"sqlite:///{tmp_path / 'lazy.db'}")
+    lazy_conciliador.load_statements(input = input, archive = tmp_path / "archive", is_lazy = True)
+
+    entries = read_statement_entries(eager_conciliador)
+    assert len(entries) == 5 and all(entry[3] is not None for entry in entries)
+    assert entries == read_statement_entries(lazy_conciliador)
\ No newline at end of file
@@ -0,0 +1,41 @@
+import pytest
+
+from conciliador.src.loaders import ExecutorTypeEnum, Loader, ReportLoader, StatementLoader
+
+
+def test_detect_encoding_of_non_utf8_files(tmp_path):
+    text: str = "Data;Histórico;Valor\n10/03/2025;DEPÓSITO EM ESPÉCIE;1,00\n"
+    path = tmp_path / "statement.csv"
+    path.write_bytes(text.encode("cp1252"))
+
+    encoding: str = Loader.Loader.detect_encoding(path)
+    assert encoding.lower().replace("-", "") != "utf8"
+    assert path.read_bytes().decode(encoding) == text
+
+
+def test_detect_encoding_checks_a_bounded_window(tmp_path, monkeypatch):
+    monkeypatch.setattr(Loader, "ENCODING_CHECK_SIZE", 256)
+
+    # Accents past the sample but inside the window escalate the detection to the whole file
+    near_path = tmp_path / "near.csv"
+    near_path.write_bytes(b"a;b;c\n" * 20 + "DEPÓSITO;Histórico\n".encode("cp1252"))
+    near_encoding: str = Loader.Loader.detect_encoding(near_path, sample_size = 64)
+    assert near_encoding != "ascii"
+    near_path.read_bytes().decode(near_encoding)
+
+    # Accents past the window are not read
+    far_path = tmp_path / "far.csv"
+    far_path.write_bytes(b"a;b;c\n" * 100 + "DEPÓSITO;Histórico\n".encode("cp1252"))
+    assert Loader.Loader.detect_encoding(far_path, sample_size = 64) == "ascii"
+
+@pytest.mark.parametrize("executor_type", [ExecutorTypeEnum.ExecutorTypeEnum.THREAD, ExecutorTypeEnum.ExecutorTypeEnum.PROCESS])
+def test_executors_process_files_as_sequential(write_report, write_statement, executor_type):
+    report_paths = [write_report(f"report_{day}.csv", [("EMPLOYEE", f"{day}/03/2025 06:00:00", f"{day}/03/2025 14:00:00", [("VISA CRÉDITO", f"{day},00")])]) for day in range(10, 14)]
+    statement_paths = [write_statement(f"statement_{day}.csv", [(f"{day}/03/2025", "DEPÓSITO", f"{day},00")]) for day in range(10, 14)]
+
+    # Results keep the order of the given paths
+    for loader, paths in [(ReportLoader.ReportLoader(), report_paths), (StatementLoader.StatementLoader(), statement_paths)]:
+        expected = loader.process_files(paths, encoding = "cp1252")
+        processed = loader.process_files(paths, encoding = "cp1252", executor_type = executor_type, workers = 2)
+        assert list(processed) == list(expected) == paths
+        assert all(processed[path].equals(expected[path]) for path in paths)
\ No newline at end of file
@@ -0,0 +1,77 @@
+import datetime
+import polars
+import pytest
+import sqlalchemy
+
+from conciliador.src.database import ModelsConfig
+
+
+def read_payment_values(database):
+    return database.read("finisher", columns = ["finisher.name", "finisher.payment_value"]).sort("finisher.name").rows()
+
+
+def test_payment_values_use_rates_in_effect_at_report_start(open_database):
+    database = open_database()
+    (first_report_id,) = database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 2, 19, 6, 0, 40), "end_time": datetime.datetime(2025, 2, 19, 13, 0, 59)})
+    (second_report_id,) = database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 3, 20, 6), "end_time": datetime.datetime(2025, 3, 20, 13)})
+    database.extend("finisher", polars.DataFrame({"report_id": [first_report_id, second_report_id], "name": ["ELO DEBITO", "ELO DÉBITO"], "value": [38500, 38500]}))
+
+    # The rate of "card.debit.elo" starts on 2025-03-19
+    assert read_payment_values(database) == [("ELO DEBITO", 38500), ("ELO DÉBITO", 38057)]
+
+    # Moving the report moves the finisher into the rate window
+    database.update("report", {"start_time": datetime.datetime(2025, 3, 19, 6)}, id = lambda x: x == first_report_id)
+    assert read_payment_values(database) == [("ELO DEBITO", 38057), ("ELO DÉBITO", 38057)]
+
+    # A later rate only changes finishers of reports started after it
+    database.insert("rate", {"type_id": "card.debit.elo", "rate": 0.02, "start_time": datetime.datetime(2025, 3, 20)})
+    assert read_payment_values(database) == [("ELO DEBITO", 38057), ("ELO DÉBITO", 37730)]
+
+
+def test_deferred_rate_recomputes(open_database):
+    database = open_database(should_defer_recomputes = True)
+    (report_id,) = database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 3, 20, 6), "end_time": datetime.datetime(2025, 3, 20, 13)})
+    database.extend("finisher", polars.DataFrame({"report_id": [report_id, report_id], "name": ["ELO DEBITO", "ELO DÉBITO"], "value": [38500, -38500]}))
+
+    # Recomputes of file databases run after commit in another thread (values are truncated towards zero)
+    database.insert("rate", {"type_id": "card.debit.elo", "rate": 0.02, "start_time": datetime.datetime(2025, 3, 20)})
+    database.wait_recomputes()
+    assert read_payment_values(database) == [("ELO DEBITO", 37730), ("ELO DÉBITO", -37730)]
+
+    # In-memory databases are only seen by their own thread
+    memory_database = open_database("sqlite:///:memory:", should_defer_recomputes = True)
+    (report_id,) = memory_database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 3, 20, 6), "end_time": datetime.datetime(2025, 3, 20, 13)})
+    memory_database.insert("finisher", {"report_id": report_id, "name": "ELO DEBITO", "value": 38500})
+    memory_database.insert("rate", {"type_id": "card.debit.elo", "rate": 0.02, "start_time": datetime.datetime(2025, 3, 20)})
+    assert read_payment_values(memory_database) == [("ELO DEBITO", 37730)]
+
+
+def test_deferred_rate_recompute_errors_reach_wait(open_database, monkeypatch):
+    database = open_database(should_defer_recomputes = True)
+    (report_id,) = database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 3, 20, 6), "end_time": datetime.datetime(2025, 3, 20, 13)})
+    database.insert("finisher", {"report_id": report_id, "name": "ELO DEBITO", "value": 38500})
+    recompute_payment_values = ModelsConfig.ModelsConfig.recompute_payment_values
+    calls = []
+
+    # Recomputes retry while another connection holds the write lock
+    def locked_once(connection, conditions):
+        calls.append(conditions)
+        if len(calls) == 1:
+            raise sqlalchemy.exc.OperationalError("UPDATE finisher", {}, Exception("database is locked"))
+        recompute_payment_values(connection, conditions)
+
+    monkeypatch.setattr(ModelsConfig.ModelsConfig, "recompute_payment_values", staticmethod(locked_once))
+    database.insert("rate", {"type_id": "card.debit.elo", "rate": 0.02, "start_time": datetime.datetime(2025, 3, 20)})
+    database.wait_recomputes()
+    assert len(calls) == 2
+    assert read_payment_values(database) == [("ELO DEBITO", 37730)]
+
+    # Other errors of the thread are raised by the wait
+    def failing(connection, conditions):
+        raise ValueError("broken rate")
+
+    monkeypatch.setattr(ModelsConfig.ModelsConfig, "recompute_payment_values", staticmethod(failing))
+    database.insert("rate", {"type_id": "card.debit.elo", "rate": 0.03, "start_time": datetime.datetime(2025, 3, 20, 1)})
+    with pytest.raises(Exception, match = "broken rate"):
+        database.wait_recomputes()
+    database.wait_recomputes()
\ No newline at end of file
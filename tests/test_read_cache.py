@@ -0,0 +1,24 @@
+from conciliador.src.database import Database
+
+
+def test_read_cache_evicts_by_estimated_size(open_database, monkeypatch):
+    database = open_database()
+    rates_size: int = database.read("rate").estimated_size()
+    patterns_size: int = database.read("finisher_pattern").estimated_size()
+    read_cache = database._Database__read_cache
+
+    # Room for the rates but not for both results
+    monkeypatch.setattr(Database, "READ_CACHE_SIZE", max(rates_size, patterns_size))
+    read_cache.clear()
+    database._Database__read_cache_size = 0
+    database.read("rate")
+    database.read("finisher_pattern")
+    assert len(read_cache) == 1
+    assert database._Database__read_cache_size == patterns_size
+
+    # Results larger than the whole cache are not kept
+    monkeypatch.setattr(Database, "READ_CACHE_SIZE", min(rates_size, patterns_size) - 1)
+    read_cache.clear()
+    database._Database__read_cache_size = 0
+    database.read("rate")
+    assert len(read_cache) == 0 and database._Database__read_cache_size == 0
\ No newline at end of file
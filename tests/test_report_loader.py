@@ -0,0 +1,26 @@
+import polars
+import pytest
+
+from conciliador.src.loaders import ReportLoader
+
+
+SECTIONS = [
+    ("JOAO LOPES", "10/03/2025 13:01:25", "10/03/2025 20:08:04", [("VISA CRÉDITO", "1.234,56"), ("RECEBIMENTO DINHEIRO", "78,90")]),
+    ("EMILY", "10/03/2025 06:00:40", "10/03/2025 13:00:59", [("ELO DÉBITO", "5,00")]),
+]
+
+# Rows of the sections ordered by start time (cash totals are read from the "Dinheiro" column)
+EXPECTED_ROWS = [
+    ("0", "EMILY", "10/03/2025", "06:00:40", "13:00:59", "ELO DÉBITO", "5,00"),
+    ("1", "JOAO LOPES", "10/03/2025", "13:01:25", "20:08:04", "VISA CRÉDITO", "1.234,56"),
+    ("1", "JOAO LOPES", "10/03/2025", "13:01:25", "20:08:04", "RECEBIMENTO DINHEIRO", "78,90"),
+]
+
+
+@pytest.mark.parametrize(("newline", "has_trailing_newline"), [("\n", True), ("\r\n", True), ("\n", False), ("\r\n", False)])
+def test_report_rows_of_every_line_ending(write_report, newline, has_trailing_newline):
+    path = write_report("report.csv", SECTIONS, newline = newline, has_trailing_newline = has_trailing_newline)
+
+    report: polars.DataFrame = ReportLoader.ReportLoader().process_file(path, encoding = "cp1252")
+    assert report.columns == list(ReportLoader.REPORT_COLUMNS)
+    assert report.rows() == EXPECTED_ROWS
\ No newline at end of file
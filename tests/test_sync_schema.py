@@ -0,0 +1,18 @@
+import sqlalchemy
+
+
+def test_sync_creates_missing_columns_and_indexes(open_database, database_path):
+    open_database()
+
+    # Simulate a database built before the column and the index existed
+    engine: sqlalchemy.Engine = sqlalchemy.create_engine(f"sqlite:///{database_path}")
+    with engine.begin() as connection:
+        connection.execute(sqlalchemy.text("DROP INDEX index_finisher_payment_date_type_id;"))
+        connection.execute(sqlalchemy.text("ALTER TABLE finisher DROP COLUMN payment_value;"))
+
+    open_database()
+
+    inspector: sqlalchemy.Inspector = sqlalchemy.inspect(engine)
+    assert "payment_value" in [column["name"] for column in inspector.get_columns("finisher")]
+    assert "index_finisher_payment_date_type_id" in [index["name"] for index in inspector.get_indexes("finisher")]
+    engine.dispose()
\ No newline at end of file
@@ -0,0 +1,35 @@
+import pathlib
+import polars
+import sqlalchemy
+import sqlite3
+
+
+BASELINE_PATH = pathlib.Path(__file__).parent / "data" / "baseline.sql"
+
+
+def test_open_baseline_database(open_database, database_path):
+    # Database built by the first released schema with its default rows
+    connection: sqlite3.Connection = sqlite3.connect(database_path)
+    connection.executescript(BASELINE_PATH.read_text(encoding = "utf-8"))
+    connection.close()
+
+    database = open_database()
+
+    engine: sqlalchemy.Engine = sqlalchemy.create_engine(f"sqlite:///{database_path}")
+    columns = {column["name"]: column for column in sqlalchemy.inspect(engine).get_columns("statement_entry_pattern")}
+    assert columns["value_pattern"]["nullable"]
+    assert {"sign", "min_value", "max_value", "value"} <= columns.keys()
+
+    # Legacy rows gained their numeric predicates instead of being inserted again
+    patterns: polars.DataFrame = database.read("statement_entry_pattern")
+    assert patterns.height == 12
+    assert patterns.filter(polars.col("statement_entry_pattern.type_id") == "income").get_column("statement_entry_pattern.min_value").to_list() == [0]
+    assert patterns.filter(polars.col("statement_entry_pattern.type_id") == "outcome").get_column("statement_entry_pattern.max_value").to_list() == [-1]
+
+    # Rows without a value pattern are accepted
+    with engine.begin() as connection:
+        connection.execute(sqlalchemy.text("INSERT INTO statement_entry_pattern (type_id, pattern, min_value) VALUES ('income', '^RENDIMENTO.*$', 1);"))
+    engine.dispose()
+
+    # The upgraded database opens as is
+    assert open_database().read("statement_entry_pattern").height == 13
\ No newline at end of file
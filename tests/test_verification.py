@@ -0,0 +1,32 @@
+import datetime
+import polars
+import sqlalchemy
+import sqlalchemy.orm
+
+from conciliador.src.database.models import Verification
+
+
+def test_verification_values_are_net(open_database, database_path):
+    database = open_database()
+    (report_id,) = database.insert("report", {"shift": 0, "employee": "EMPLOYEE", "start_time": datetime.datetime(2025, 4, 1, 6), "end_time": datetime.datetime(2025, 4, 1, 14)})
+    (finisher_id,) = database.insert("finisher", {"report_id": report_id, "name": "VISA CRÉDITO", "value": 10000})
+    finisher: polars.DataFrame = database.read("finisher", conditions = {"id": lambda x: x == finisher_id})
+    payment_date: datetime.date = finisher.item(0, "finisher.payment_date")
+    assert finisher.item(0, "finisher.payment_value") == 9872
+
+    (statement_id,) = database.insert("statement", {"date": payment_date})
+    (statement_entry_id,) = database.insert("statement_entry", {"statement_id": statement_id, "name": "VENDAS CARTAO TIPO CREDITO CIELO-VISA", "value": 9872})
+    (verification_id,) = database.insert("verification", {"type_id": "card.credit.visa", "date": payment_date})
+    database.update("finisher", {"verification_id": verification_id}, id = lambda x: x == finisher_id)
+    database.update("statement_entry", {"verification_id": verification_id}, id = lambda x: x == statement_entry_id)
+
+    # SQL expressions
+    verification: polars.DataFrame = database.read("verification", columns = ["verification.finishers_gross_value", "verification.finishers_value", "verification.statement_entries_value", "verification.difference"])
+    assert verification.row(0) == (10000, 9872, 9872, 0)
+
+    # Python bodies
+    engine: sqlalchemy.Engine = sqlalchemy.create_engine(f"sqlite:///{database_path}")
+    with sqlalchemy.orm.Session(engine) as session:
+        instance: Verification.Verification = session.get(Verification.Verification, verification_id)
+        assert (instance.finishers_gross_value, instance.finishers_value, instance.statement_entries_value, instance.difference) == (10000, 9872, 9872, 0)
+    engine.dispose()
\ No newline at end of file